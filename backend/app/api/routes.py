@@ -1,65 +1,250 @@
-from fastapi import APIRouter
-from typing import Optional
-from fastapi import Query
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from pydantic import BaseModel
+from fastapi import Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+import asyncio
+import json
 from app.services.farmbot_service import FarmBotService
+from app.services.fleet_manager import FleetManager, UnknownDevice
+from app.utils.metrics import REGISTRY
 
+# Les routes du robot sont servies à la racine (robot par défaut) et sous /devices/{device_id}
 router = APIRouter()
-farmbot_service = FarmBotService()
+fleet_router = APIRouter()
+fleet = FleetManager()
+REGISTRY.collector(fleet.metrics)
+
+
+async def get_service(device_id: Optional[str] = None) -> FarmBotService:
+    try:
+        return await fleet.get(device_id)
+    except UnknownDevice as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@fleet_router.get("/devices")
+def list_devices():
+    return fleet.describe()
+
+
+@fleet_router.get("/metrics")
+def metrics():
+    # Format texte Prometheus (version 0.0.4)
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@fleet_router.get("/ready")
+def ready():
+    # Sonde de disponibilité : 503 tant que le robot par défaut n'est pas utilisable
+    report = fleet.readiness()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+class Waypoint(BaseModel):
+    x: float
+    y: float
+    z: Optional[float] = None
+
+
+class GridSpec(BaseModel):
+    start_x: int = 0
+    start_y: int = 0
+    width: Optional[int] = None
+    length: Optional[int] = None
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+
+
+class PlanRequest(BaseModel):
+    waypoints: List[Waypoint] = []
+    grid: Optional[GridSpec] = None
+    action_type: str = "move"
+    from_current: bool = True
+
+
+def client_key(request: Request, client_id: Optional[str] = None) -> str:
+    # Identifie le kiosque : paramètre explicite, en-tête X-Client-Id ou adresse IP
+    return client_id or request.headers.get("x-client-id") or (request.client.host if request.client else "anonymous")
+
+
+async def plan_waypoints(plan: PlanRequest, service: FarmBotService) -> List[dict]:
+    waypoints = [w.model_dump() for w in plan.waypoints]
+    if plan.grid is not None:
+        cells, _ = await service.grid_cells(**plan.grid.model_dump())
+        waypoints += [{"x": x, "y": y} for x, y in cells]
+    return waypoints
+
 
 @router.get("/status")
 @router.get("/device")
-def read_status():
-    return farmbot_service.get_status()
+async def read_status(service: FarmBotService = Depends(get_service)):
+    return await service.get_status()
 
 @router.post("/move")
 async def move_bot(
+    request: Request,
     x: Optional[float] = Query(None),
     y: Optional[float] = Query(None),
     z: Optional[float] = Query(None),
+    client_id: Optional[str] = Query(None),
     # safe_z: Optional[int] = Query(None),
     # speed: Optional[float] = Query(None),
     # override: Optional[bool] = Query(False),
+    service: FarmBotService = Depends(get_service),
 ):
-    return await farmbot_service.safe_move_to(x, y, z)
+    return await service.safe_move_to(x, y, z, client_key(request, client_id))
+
+@router.get("/motion/queue")
+def motion_queue(service: FarmBotService = Depends(get_service)):
+    return service.dispatcher.snapshot()
 
 
 @router.get("/garden_size")
-def garden_size():
-    return farmbot_service.garden_size()
+async def garden_size(service: FarmBotService = Depends(get_service)):
+    return await service.garden_size()
 
 @router.post("/toast")
-def toast(message: str):
-    return farmbot_service.toast(message)
+def toast(message: str, service: FarmBotService = Depends(get_service)):
+    return service.toast(message)
+
+@router.post("/grid_travel", status_code=202)
+async def grid_travel(start_x: int = 0, start_y: int = 0, width: int = None, length: int = None, rows: int = None, columns: int = None,
+                      order: str = Query("zigzag", pattern="^(zigzag|optimal)$"), service: FarmBotService = Depends(get_service)):
+    job = await service.start_grid_travel(start_x, start_y, width, length, rows, columns, order)
+    return {"job_id": job.id, "status": job.status, "total": len(job.steps)}
+
+@router.post("/visit_points", status_code=202)
+async def visit_points(pointer_type: Optional[str] = "Plant", point_ids: Optional[List[int]] = Query(None),
+                       service: FarmBotService = Depends(get_service)):
+    job = await service.start_visit_points(pointer_type, point_ids)
+    return {"job_id": job.id, "status": job.status, "total": len(job.steps), "route": job.params["route"]}
+
+@router.get("/jobs")
+def list_jobs(service: FarmBotService = Depends(get_service)):
+    return service.jobs.list()
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str, service: FarmBotService = Depends(get_service)):
+    job = service.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+@router.post("/jobs/{job_id}/cancel")
+def cancel_job(job_id: str, service: FarmBotService = Depends(get_service)):
+    job = service.jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+@router.post("/validate_plan")
+async def validate_plan(plan: PlanRequest, service: FarmBotService = Depends(get_service)):
+    waypoints = await plan_waypoints(plan, service)
+    return service.validate_plan(waypoints, plan.action_type, plan.from_current)
+
+@router.get("/estimate")
+def estimate(x: Optional[float] = None, y: Optional[float] = None, z: Optional[float] = None,
+             safe_z: bool = False, speed: float = Query(100, gt=0, le=100), service: FarmBotService = Depends(get_service)):
+    return service.estimate_move(x, y, z, safe_z, speed)
 
-@router.post("/grid_travel")
-def grid_travel(start_x: int = 0, start_y: int = 0, width: int = None, length: int = None, rows: int = None, columns: int = None):
-    return farmbot_service.grid_travel(start_x, start_y, width, length, rows, columns)
+@router.post("/estimate")
+async def estimate_plan(plan: PlanRequest, speed: float = Query(100, gt=0, le=100),
+                        service: FarmBotService = Depends(get_service)):
+    waypoints = await plan_waypoints(plan, service)
+    return service.estimate_plan(waypoints, speed)
 
 @router.post("/lock")
-def lock():
-    return farmbot_service.lock()
+async def lock(service: FarmBotService = Depends(get_service)):
+    return await service.lock()
 
 @router.post("/unlock")
-def unlock():
-    return farmbot_service.unlock()
+def unlock(service: FarmBotService = Depends(get_service)):
+    return service.unlock()
 
 @router.get("/logs")
-def logs():
-    return farmbot_service.get_logs()
+async def logs(
+    since: Optional[float] = Query(None, description="Horodatage Unix (s) : seulement les journaux plus récents"),
+    limit: Optional[int] = Query(None, ge=1),
+    type: Optional[List[str]] = Query(None),
+    verbosity: Optional[int] = Query(None, ge=0),
+    service: FarmBotService = Depends(get_service),
+):
+    return await service.get_logs(since, limit, type, verbosity)
 
 @router.post("/go_home")
-def go_home():
-    return farmbot_service.goto_home()
+async def go_home(request: Request, client_id: Optional[str] = Query(None),
+                  service: FarmBotService = Depends(get_service)):
+    return await service.goto_home(client_key(request, client_id))
 
 @router.get("/live_status")
-def live_status():
-    return farmbot_service.get_current_status()
+def live_status(request: Request, service: FarmBotService = Depends(get_service)):
+    snapshot = service.snapshot
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if snapshot.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+@router.get("/live_status/changes")
+def live_status_changes(since: int = Query(0, ge=0), service: FarmBotService = Depends(get_service)):
+    return service.snapshot.changes_since(since)
+
+@router.get("/live_status/stream")
+async def live_status_stream(request: Request, service: FarmBotService = Depends(get_service)):
+    """
+    Flux Server-Sent Events : un snapshot complet, puis uniquement les deltas.
+    """
+    async def events():
+        subscription = service.broadcaster.subscribe()
+        try:
+            while not await request.is_disconnected():
+                message = await subscription.next(timeout=15)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message['data'])}\n\n"
+        finally:
+            subscription.close()
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+@router.websocket("/ws/live_status")
+async def live_status_ws(websocket: WebSocket, service: FarmBotService = Depends(get_service)):
+    await websocket.accept()
+    subscription = service.broadcaster.subscribe()
+    try:
+        while True:
+            message = await subscription.next()
+            # Un client qui ne lit plus est déconnecté plutôt que de bloquer le flux
+            await asyncio.wait_for(
+                websocket.send_json(message),
+                service.broadcaster.send_timeout,
+            )
+    except (WebSocketDisconnect, asyncio.TimeoutError, RuntimeError):
+        pass
+    finally:
+        subscription.close()
 
 @router.post("/take_photo")
-async def take_photo():
-    print("Taking photo")
-    return await farmbot_service.take_photo()
+async def take_photo(service: FarmBotService = Depends(get_service)):
+    return await service.take_photo()
+
+@router.get("/photos/{image_id}")
+async def photo(image_id: int, service: FarmBotService = Depends(get_service)):
+    return await _photo_file(image_id, False, service)
+
+@router.get("/photos/{image_id}/thumbnail")
+async def photo_thumbnail(image_id: int, service: FarmBotService = Depends(get_service)):
+    return await _photo_file(image_id, True, service)
+
+async def _photo_file(image_id: int, thumbnail: bool, service: FarmBotService):
+    path = await service.photo_path(image_id, thumbnail)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Photo not found")
+    # Une photo ne change jamais pour un id donné
+    return FileResponse(path, media_type="image/jpeg", headers={"Cache-Control": "public, max-age=31536000, immutable"})
 
 @router.get("/zones")
-def get_zones():
-    return farmbot_service.zone_manager.get_all_zones()
+def get_zones(service: FarmBotService = Depends(get_service)):
+    return service.zone_manager.get_all_zones()
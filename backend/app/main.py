@@ -1,13 +1,31 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.api.routes import router
+from app.api.routes import fleet, fleet_router, router
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 import os
 from starlette.requests import Request
+from app.utils.web_api import WebAPIError
+from app.utils.metrics import MetricsMiddleware
+from app.utils.static_files import KioskStaticFiles
+from app.utils.structured_log import RequestIdMiddleware, configure_logging, shutdown_logging
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Journaux JSON écrits par un thread dédié (voir app/utils/structured_log.py)
+    configure_logging()
+    # Le serveur répond tout de suite (voir /ready) pendant que la session du robot
+    # par défaut s'ouvre en arrière-plan
+    warm = asyncio.create_task(fleet.warm())
+    yield
+    warm.cancel()
+    # Ferme proprement les connexions MQTT et HTTP de chaque robot
+    await fleet.close_all()
+    shutdown_logging()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,7 +34,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Durée de chaque requête, par route (voir /metrics)
+app.add_middleware(MetricsMiddleware)
+# Ajouté en dernier = le plus externe : l'identifiant de requête couvre tout le reste
+app.add_middleware(RequestIdMiddleware)
 
+app.include_router(fleet_router)
+# Robot par défaut à la racine (compatibilité des kiosques), chaque robot de la flotte sous /devices/{device_id}
 app.include_router(router)
+app.include_router(router, prefix="/devices/{device_id}")
+
+
+@app.exception_handler(WebAPIError)
+async def web_api_error_handler(request: Request, exc: WebAPIError):
+    # Erreur de l'API Web FarmBot (après les nouveaux essais) : passerelle en échec
+    return JSONResponse(status_code=502, content={"error": exc.message, "upstream_status": exc.status_code})
+
 
-app.mount("/", StaticFiles(directory="app/static", html=True), name="static")
\ No newline at end of file
+# Bundle du kiosque : variantes précompressées, cache long des fichiers à empreinte (voir app/utils/static_files.py)
+app.mount("/", KioskStaticFiles(directory="app/static", html=True), name="static")
\ No newline at end of file
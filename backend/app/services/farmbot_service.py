@@ -1,59 +1,331 @@
 from farmbot import Farmbot
-from app.utils.auth import load_token
+from app.utils.auth import TOKEN_FILE, load_token
 import time
-from functools import lru_cache
 from app.utils.mqtt_client import FarmbotMQTTClient
 import asyncio
+import logging
+import os
+from contextlib import contextmanager
 from app.utils.zones import ZoneManager
-
+from app.utils.status_broadcaster import StatusBroadcaster
+from app.utils.status_snapshot import StatusSnapshot
+from app.services.job_manager import JobCancelled, JobManager
+from app.services.motion_dispatcher import MotionDispatcher
+from app.utils.route_planner import RoutePlanner
+from app.utils.motion_model import MotionModel
+from app.utils.cache import TTLCache
+from app.utils.web_api import WebAPIClient
+from app.utils.image_cache import ImageCache
+from app.utils.log_buffer import LogBuffer
+from app.utils.metrics import REGISTRY
+from app.utils.device_config import DeviceConfigCache
+
+# Rayon (mm) de l'empreinte de la tête d'outil utilisé pour le test de collision avec les zones
+FOOTPRINT_RADIUS = float(os.getenv("FARMBOT_FOOTPRINT_RADIUS", "0"))
+
+# Dossier et taille max du cache local des photos
+IMAGE_CACHE_DIR = os.getenv("FARMBOT_IMAGE_CACHE_DIR", "app/cache/images")
+IMAGE_CACHE_BYTES = int(os.getenv("FARMBOT_IMAGE_CACHE_MB", "200")) * 1024 * 1024
+
+# Dernière configuration connue de chaque robot (safe_z, taille du jardin, mcu_params)
+DEVICE_CONFIG_DIR = os.getenv("FARMBOT_DEVICE_CONFIG_DIR", "app/cache/devices")
+
+# Délai (s) de chaque étape du démarrage d'une session (connexion MQTT, safe_z, taille du jardin)
+STARTUP_TIMEOUT = float(os.getenv("FARMBOT_STARTUP_TIMEOUT", "10"))
+MQTT_RETRY_MAX = 60.0
+
+# Durée de vie (s) et fenêtre 'stale-while-revalidate' (s) par ressource de l'API Web
+CACHE_POLICY = {
+    "device": (10, 60),
+    "images": (5, 0),
+    "garden_size": (3600, 24 * 3600),
+    "fbos_config": (3600, 24 * 3600),
+}
+
+logger = logging.getLogger(__name__)
+
+WAIT_UNTIL_IDLE = REGISTRY.histogram(
+    "farmbot_wait_until_idle_seconds", "Attente du retour à l'état 'idle' après un mouvement", ("outcome",))
+STARTUP_STEP = REGISTRY.histogram(
+    "farmbot_startup_step_seconds", "Durée des étapes du démarrage d'une session", ("step", "outcome"))
 
 
 class FarmBotService:
-    def __init__(self):
-        self.fb = Farmbot()
-        self.token = load_token()
+    def __init__(self, token_path=TOKEN_FILE, zones_path="app/utils/zones.json", image_cache_dir=IMAGE_CACHE_DIR,
+                 farmbot=None, mqtt_factory=FarmbotMQTTClient, api=None, token=None, device_config_path=None):
+        """
+        Aucun appel réseau ici : la connexion MQTT et la configuration du robot sont
+        chargées par `start()`.
+        """
+        # farmbot / mqtt_factory / api / token : remplaçables par des doublures locales (bancs d'essai, simulateur)
+        self.fb = farmbot or Farmbot()
+        self.token = token or load_token(token_path)
         self.fb.set_token(self.token)
+        # Client asynchrone (pool de connexions) pour toutes les lectures de l'API Web
+        self.api = api or WebAPIClient(self.token)
         self.stop = False
         self.status_data = {}
+        self.footprint_radius = FOOTPRINT_RADIUS
+        self.cache = TTLCache(max_size=64)
+        self.image_cache = ImageCache(image_cache_dir, IMAGE_CACHE_BYTES)
+        self._status_waiters = []
         
-        self.safe_height = self.fb.safe_z()
+        # Journaux du robot reçus par MQTT, gardés en mémoire (taille bornée)
+        self.logs = LogBuffer()
+        self._seed_task = None
+
+        # Configuration gardée du démarrage précédent, utilisée avant la réponse du nuage
+        self.device_config = DeviceConfigCache(device_config_path)
+        self.safe_height = self.device_config.get("safe_z")
+        # État de chaque dépendance : pending, cached (valeur du démarrage précédent), ready ou failed
+        self.readiness = {"mqtt": "pending", "safe_z": "pending", "garden_size": "pending", "status": "pending"}
+        self._startup_tasks = []
         
         # Load zones from file
         self.zone_manager = ZoneManager()
-        self.zone_manager.load_from_file("app/utils/zones.json")
+        self.zone_manager.load_from_file(zones_path)
+        self.route_planner = RoutePlanner(self.zone_manager, radius=self.footprint_radius)
+        
+        # Résumé versionné du statut (JSON pré-sérialisé + ETag) et diffusion en direct (SSE / WebSocket)
+        self.snapshot = StatusSnapshot()
+        self.snapshot.update(self.get_current_status())
+        self.broadcaster = StatusBroadcaster()
+        
+        # Travaux de mouvement longs exécutés en arrière-plan; toutes les commandes de
+        # mouvement passent par un seul répartiteur (file, remplacement, arrêt d'urgence)
+        self.jobs = JobManager()
+        self.dispatcher = MotionDispatcher()
+        self._loop = None
         
-        # Initialize MQTT client
-        self.mqtt = FarmbotMQTTClient(on_status=self._update_status)
-        self.mqtt.connect()
+        # Modèle cinématique, reconstruit seulement quand les mcu_params changent
+        self._motion_model = None
+        self._motion_key = None
+        
+        # Initialize MQTT client (connecté par start())
+        self.mqtt = mqtt_factory(on_status=self._update_status, on_log=self.logs.append, token_path=token_path)
         
         self._idle_event = asyncio.Event()
         if not self.is_busy():
             self._idle_event.set()
  
+    def is_active(self) -> bool:
+        """Un travail, une commande de mouvement ou un client en direct utilise encore la session."""
+        running_job = any(not job.done for job in self.jobs.jobs.values())
+        return running_job or not self.dispatcher.idle or self.broadcaster.client_count > 0
+
+    async def start(self, timeout: float = STARTUP_TIMEOUT):
+        """
+        Démarre la session : connexion MQTT, hauteur sécuritaire et taille du jardin en même
+        temps, chacune avec son délai. Avec la configuration gardée au démarrage précédent,
+        la session est utilisable tout de suite et ces valeurs sont rafraîchies en arrière-plan;
+        sinon on les attend, et une erreur fait échouer l'ouverture (réessayée à la requête suivante).
+        La connexion MQTT n'est jamais bloquante : elle est réessayée tant qu'elle échoue.
+        """
+        self._loop = asyncio.get_running_loop()
+        if self.safe_height is not None:
+            self.readiness["safe_z"] = "cached"
+        garden = self.device_config.get("garden_size")
+        if garden is not None:
+            self.cache.set("garden_size", garden, *CACHE_POLICY["garden_size"])
+            self.readiness["garden_size"] = "cached"
+
+        mqtt = asyncio.ensure_future(self._connect_mqtt())
+        steps = {
+            "safe_z": asyncio.ensure_future(self._startup_step("safe_z", self._refresh_safe_z, timeout)),
+            "garden_size": asyncio.ensure_future(self._startup_step("garden_size", self._refresh_garden_size, timeout)),
+        }
+        self._startup_tasks = [mqtt, *steps.values()]
+
+        required = [task for name, task in steps.items() if self.readiness[name] == "pending"]
+        if required:
+            await asyncio.gather(*required)
+        await asyncio.wait([mqtt], timeout=timeout)
+
+    async def _startup_step(self, name: str, step, timeout: float):
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(step(), timeout)
+        except Exception as e:
+            STARTUP_STEP.labels(name, "failed").observe(time.perf_counter() - started)
+            logger.warning("Startup step failed", extra={"step": name, "error": str(e) or type(e).__name__,
+                                                         "cached": self.readiness[name] == "cached"})
+            if self.readiness[name] != "cached":
+                self.readiness[name] = "failed"
+                raise
+            return
+        STARTUP_STEP.labels(name, "ok").observe(time.perf_counter() - started)
+        self.readiness[name] = "ready"
+
+    async def _refresh_safe_z(self):
+        # Même lecture que fb.safe_z(), par le client asynchrone (pool, nouveaux essais, cache)
+        config = await self._cached_api_get("fbos_config")
+        self.safe_height = config["safe_height"]
+        self.device_config.save(safe_z=self.safe_height)
+
+    async def _refresh_garden_size(self):
+        self.cache.set("garden_size", await self._load_garden_size(), *CACHE_POLICY["garden_size"])
+
+    async def _connect_mqtt(self):
+        # Pas de wait_for ici : un connect() encore en cours dans son thread ne doit pas être doublé
+        delay = 1.0
+        started = time.perf_counter()
+        while True:
+            try:
+                await asyncio.to_thread(self.mqtt.connect)
+                break
+            except Exception as e:
+                self.readiness["mqtt"] = "failed"
+                logger.warning("MQTT connection failed", extra={"error": str(e), "retry_in": delay})
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MQTT_RETRY_MAX)
+        STARTUP_STEP.labels("mqtt", "ok").observe(time.perf_counter() - started)
+        self.readiness["mqtt"] = "ready"
+
+    def is_ready(self) -> bool:
+        """Utilisable par les kiosques : configuration connue (même gardée) et MQTT connecté."""
+        return (self.readiness["mqtt"] == "ready"
+                and all(self.readiness[name] in ("ready", "cached") for name in ("safe_z", "garden_size")))
+
+    async def close(self):
+        """Ferme la session du robot (MQTT, connexions HTTP, file de mouvements)."""
+        for task in self._startup_tasks:
+            task.cancel()
+        self.jobs.cancel_all()
+        self.dispatcher.close()
+        await asyncio.to_thread(self.mqtt.stop)
+        await self.api.aclose()
+
     def is_busy(self):
         return self.status_data.get("informational_settings", {}).get("busy", True)
        
     def _update_status(self, payload):
+        previous = self.status_data.get("informational_settings", {})
         self.status_data = payload
+        self.readiness["status"] = "ready"
+        params = payload.get("mcu_params")
+        if params and params != self.device_config.get("mcu_params"):
+            self.device_config.save(mcu_params=params)
+        self._invalidate_cache_from_status(previous, payload.get("informational_settings", {}))
         busy = payload.get("informational_settings", {}).get("busy", True)
 
-        if busy:
-            self._idle_event.clear()
+        # Appelé depuis le thread MQTT : l'Event asyncio doit être modifié dans sa boucle
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._set_idle, not busy)
         else:
+            self._set_idle(not busy)
+
+        # Seuls les changements visibles par les kiosques créent une version et sont diffusés
+        if self.snapshot.update(self.get_current_status()) is not None:
+            self.broadcaster.publish(self.snapshot.summary)
+
+        if loop is not None and not loop.is_closed() and self._status_waiters:
+            loop.call_soon_threadsafe(self._wake_status_waiters)
+
+    def _wake_status_waiters(self):
+        waiters, self._status_waiters = self._status_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_for_status(self, predicate, timeout: float):
+        """
+        Attend un statut MQTT pour lequel `predicate(status_data)` retourne une valeur non nulle.
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            result = predicate(self.status_data)
+            if result:
+                return result
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError("Statut attendu non reçu dans le délai imparti.")
+            waiter = loop.create_future()
+            self._status_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _invalidate_cache_from_status(self, previous: dict, info: dict):
+        # Une synchro (ou un cache_bust) signifie que les données de l'API Web ont changé
+        sync_changed = previous.get("sync_status") != info.get("sync_status")
+        cache_bust = info.get("cache_bust") and info.get("cache_bust") != previous.get("cache_bust")
+        if previous and (sync_changed or cache_bust):
+            self.cache.invalidate()
+
+    async def _cached_api_get(self, resource: str, loader=None):
+        """Lecture de l'API Web à travers le cache (les erreurs lèvent WebAPIError et ne sont pas cachées)."""
+        ttl, stale = CACHE_POLICY[resource]
+        loader = loader or (lambda: self.api.get(resource))
+        return await self.cache.get_or_load_async(resource, loader, ttl, stale)
+
+    def _set_idle(self, idle: bool):
+        if idle:
             self._idle_event.set()
+        else:
+            self._idle_event.clear()
             
-    async def wait_until_idle(self, timeout: float = 60.0, check_interval: float = 0.1):
+    async def wait_until_idle(self, timeout: float = 60.0):
             """
             Attend que le robot soit dans l'état 'idle' selon les données MQTT reçues.
             """
-            start = time.time()
-            while time.time() - start < timeout:
-                state = self.status_data.get("state")
-                if state == "idle":
-                    return
-                await asyncio.sleep(check_interval)
+            self._loop = asyncio.get_running_loop()
+            if not self.is_busy():
+                WAIT_UNTIL_IDLE.labels("already_idle").observe(0.0)
+                return True
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._idle_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                WAIT_UNTIL_IDLE.labels("timeout").observe(time.perf_counter() - started)
+                raise TimeoutError("Le robot n’est jamais revenu à l’état 'idle' dans le délai imparti.")
+            WAIT_UNTIL_IDLE.labels("idle").observe(time.perf_counter() - started)
+            return True
+
+    @contextmanager
+    def _movement_timeout(self, seconds: float):
+        """
+        Délai de mouvement de la bibliothèque pour un seul mouvement. C'est un réglage partagé :
+        l'ancienne valeur est rétablie ensuite (les mouvements passent un à un par le répartiteur).
+        """
+        timeouts = self.fb.state.timeout
+        previous = timeouts["movements"]
+        self.fb.set_timeout(seconds, "movements")
+        try:
+            yield
+        finally:
+            self.fb.set_timeout(previous, "movements")
+
+    def motion_model(self) -> MotionModel:
+        # Avant le premier statut : mcu_params gardés au démarrage précédent
+        params = self.status_data.get("mcu_params") or self.device_config.get("mcu_params")
+        key = MotionModel.params_key(params)
+        if self._motion_model is None or key != self._motion_key:
+            self._motion_model = MotionModel(params)
+            self._motion_key = key
+        return self._motion_model
+
+    def current_position(self) -> dict:
+        return self.status_data.get("location_data", {}).get("position", {})
+
+    def position_known(self) -> bool:
+        position = self.current_position()
+        return all(position.get(axis) is not None for axis in ("x", "y", "z"))
+
+    def estimate_move(self, x=None, y=None, z=None, safe_z=False, speed=100):
+        """Durée prévue (s) d'un déplacement depuis la position actuelle."""
+        model = self.motion_model()
+        duration = model.move_time(
+            self.current_position(), {"x": x, "y": y, "z": z},
+            self.safe_height if safe_z else None, speed,
+        )
+        return {"duration": round(duration, 3), "timeout": round(model.timeout_for(duration), 3)}
 
-            raise TimeoutError("Le robot n’est jamais revenu à l’état 'idle' dans le délai imparti.")
+    def estimate_plan(self, waypoints, speed=100):
+        """Durée prévue de chaque segment d'un plan, depuis la position actuelle."""
+        return self.motion_model().plan_time(waypoints, self.current_position(), speed)
 
     def get_current_status(self):
         info = self.status_data.get("informational_settings", {})
@@ -69,8 +341,8 @@ class FarmBotService:
             "locked": info.get("locked", None),
         }
 
-    def get_status(self):
-        return self.fb.api_get("device") # Retrieves FarmBot device status
+    async def get_status(self):
+        return await self._cached_api_get("device") # Retrieves FarmBot device status
 
     def move(self, x=None, y=None, z=None, safe_z=None, speed=None, override=False):
         if not override:
@@ -88,18 +360,36 @@ class FarmBotService:
             return int(value * max_val)
         return value
     
-    async def safe_move_to(self, x=None, y=None, z=None):
-        garden = self.garden_size()
+    async def safe_move_to(self, x=None, y=None, z=None, client_id="anonymous"):
+        """
+        Met le déplacement dans la file du répartiteur. Un nouveau déplacement du même
+        client remplace celui qui attend encore; la position est lue au moment d'exécuter.
+        """
+        garden = await self.garden_size()
         max_x = int(garden["x"])
         max_y = int(garden["y"])
         max_z = int(-garden["z"])
-        
-        print(f"Garden size: {max_x}x{max_y}x{max_z}")
 
         x = self.normalize(x, max_x)
         y = self.normalize(y, max_y)
         z = self.normalize(z, max_z)
-        
+
+        if not self.position_known():
+            return {"status": "error", "message": "Position actuelle inconnue"}
+        estimate = self.estimate_move(x, y, z, safe_z=True)["duration"]
+        command = self.dispatcher.submit(client_id, "move", lambda: self._execute_safe_move(x, y, z), estimate)
+        queue = self.dispatcher.queue_info(command)
+
+        result = await command.wait()
+        return {**result, "queue": queue}
+
+    def _stopped(self) -> dict:
+        return {"status": "stopped", "message": "Arrêt d'urgence : déplacement interrompu"}
+
+    async def _execute_safe_move(self, x=None, y=None, z=None):
+        # Après lock(), aucune phase suivante (approche, déplacement, descente) n'est lancée
+        if self.stop:
+            return self._stopped()
         current = self.status_data.get("location_data", {}).get("position", {})
         current_x = current.get("x")
         current_y = current.get("y")
@@ -112,20 +402,37 @@ class FarmBotService:
         final_y = y if y is not None else current_y
         final_z = z if z is not None else current_z
 
-        crossed_forbidden = self.would_cross_forbidden_zone(final_x, final_y)
-        print(f"Would cross forbidden zone: {crossed_forbidden}")
-        
+        crossings = self.forbidden_crossings(final_x, final_y)
+        crossed_forbidden = bool(crossings)
         final_zone = self.zone_manager.get_zone_at(final_x, final_y)
 
         # ✅ monter automatiquement si on traverse une zone interdite
         do_safe_z = crossed_forbidden or current_z < self.safe_height
-        
-        print(f"Current z: {current_z}, Safe height: {self.safe_height}")
-        print(f"current_z < self.safe_height : {current_z < self.safe_height}")
-        print(f"Safe move: {do_safe_z}")
+
+        # Un seul enregistrement par déplacement, avec tout le contexte de la décision
+        logger.info("Safe move", extra={
+            "target": {"x": final_x, "y": final_y, "z": final_z},
+            "current": {"x": current_x, "y": current_y, "z": current_z},
+            "crossed_forbidden": crossed_forbidden,
+            "safe_height": self.safe_height,
+            "safe_z": do_safe_z,
+            "final_zone": final_zone.type if final_zone else None,
+        })
+
+        # ↗️ Approche à hauteur de travail jusqu'à l'entrée de la zone interdite :
+        # on ne monte à la hauteur sécuritaire que pour la partie du trajet qui en a besoin
+        t_enter = crossings[0]["t_enter"] if crossings else 0.0
+        if t_enter > 0 and current_z < self.safe_height:
+            entry_x = current_x + (final_x - current_x) * t_enter
+            entry_y = current_y + (final_y - current_y) * t_enter
+            logger.debug("Approach to forbidden zone entry", extra={"x": round(entry_x, 1), "y": round(entry_y, 1)})
+            await asyncio.to_thread(self.fb.move, x=entry_x, y=entry_y)
+            if self.stop:
+                return self._stopped()
 
         # 🔁 Déplacement principal (z = safe_z si nécessaire)
-        self.fb.move(
+        await asyncio.to_thread(
+            self.fb.move,
             x=x,
             y=y,
             z=self.safe_height if z is not None and not (final_zone and final_zone.type != "allowed") else z,
@@ -133,11 +440,17 @@ class FarmBotService:
         )
 
         # ❌ Ne pas redescendre si la zone est interdite
+        if self.stop:
+            return self._stopped()
+
         z_descended = False
         if z is not None and (final_zone is None or final_zone.type == "allowed"):
-            if await self.wait_until_idle():
-                print(f"Moving to final position: ({final_x}, {final_y}, {final_z})")
-                self.fb.move(x=None, y=None, z=z)
+            timeout = self.motion_model().timeout_for(0)
+            if await self.wait_until_idle(timeout=timeout):
+                if self.stop:
+                    return self._stopped()
+                logger.debug("Descending to final position", extra={"x": final_x, "y": final_y, "z": final_z})
+                await asyncio.to_thread(self.fb.move, x=None, y=None, z=z)
                 z_descended = True
 
         return {
@@ -148,51 +461,67 @@ class FarmBotService:
         }
 
 
-    def goto_home(self):
-        return self.fb.find_home()
+    async def goto_home(self, client_id="anonymous"):
         # Endpoint : https://my.farm.bot/api/device/find_home
+        # find_home ne dépend pas de la position connue : sans elle, pas de durée prévue
+        estimate = self.estimate_move(0, 0, 0)["duration"] if self.position_known() else 0.0
+        command = self.dispatcher.submit(client_id, "home", lambda: asyncio.to_thread(self.fb.find_home), estimate)
+        return await command.wait()
+
 
+    async def garden_size(self):
+        return await self._cached_api_get("garden_size", self._load_garden_size)
 
-    @lru_cache
-    def garden_size(self):
-        return self.fb.garden_size()
+    async def _load_garden_size(self):
+        config = await self.api.get("firmware_config")
+        size = {
+            axis: config[f"movement_axis_nr_steps_{axis}"] / config[f"movement_step_per_mm_{axis}"]
+            for axis in ("x", "y", "z")
+        }
+        self.device_config.save(garden_size=size)
+        return size
     
     def toast(self, message):
         return self.fb.toast(message)
     
-    def lock(self):
+    async def lock(self):
+        # L'arrêt d'urgence ne passe pas par la file : on la vide et on arrête tout de suite
         self.stop = True
-        self.fb.e_stop()
-        print("Stopping FarmBot")
+        self.jobs.cancel_all()
+        cleared = self.dispatcher.clear("e-stop")
+        await asyncio.to_thread(self.fb.e_stop)
+        logger.warning("Emergency stop", extra={"cleared_commands": cleared})
+        return {"status": "locked", "cleared_commands": cleared}
         
     def unlock(self):
         self.stop = False
         self.fb.unlock()
-        print("Resuming FarmBot")
+        logger.info("Resuming FarmBot")
         
     def would_cross_forbidden_zone(self, x: float, y: float) -> bool:
+        return bool(self.forbidden_crossings(x, y))
+
+    def forbidden_crossings(self, x: float, y: float) -> list:
+        """
+        Zones interdites balayées par la tête d'outil entre la position actuelle et (x, y).
+        Test analytique segment/rectangle : aucune zone étroite ne peut passer entre deux échantillons.
+        """
         current = self.status_data.get("location_data", {}).get("position", {})
         x0 = current.get("x")
         y0 = current.get("y")
 
         if x0 is None or y0 is None:
-            return False  # Si on ne connaît pas la position, on assume que c'est OK
-
-        # On parcourt la trajectoire à pas régulier (ex: tous les 50 mm)
-        steps = 20
-        for i in range(steps + 1):
-            xi = x0 + (x - x0) * i / steps
-            yi = y0 + (y - y0) * i / steps
+            return []  # Si on ne connaît pas la position, on assume que c'est OK
 
-            zone = self.zone_manager.get_zone_at(xi, yi)
-            if zone and zone.type == "forbidden":
-                return True  # ❌ on traverse une zone interdite
-
-        return False  # ✅ pas de zone interdite traversée
+        return self.zone_manager.forbidden_crossings(x0, y0, x, y, self.footprint_radius)
 
     
-    def grid_travel(self, start_x=0, start_y=0, width=None, length=None, rows=None, columns=None, callback=None):
-        garden_size = self.garden_size()
+    async def grid_cells(self, start_x=0, start_y=0, width=None, length=None, rows=None, columns=None):
+        """
+        Calcule les cellules (x, y) d'un parcours en grille, dans l'ordre en zigzag.
+        Retourne (cells, message).
+        """
+        garden_size = await self.garden_size()
         max_x, max_y = garden_size['x'], garden_size['y']
 
         width = width or max_x
@@ -208,9 +537,8 @@ class FarmBotService:
         step_y = (opposite_y - start_y) // (rows - 1) if rows > 1 else 0
         
         message = f"Grid travel: {rows}x{columns} grid, {step_x}x{step_y} steps, starting at ({start_x}, {start_y}), width {width}, length {length}"
-        
-        self.fb.send_message(message, message_type="info")
 
+        cells = []
         for row in range(rows):
             y = start_y + row * step_y
 
@@ -218,35 +546,246 @@ class FarmBotService:
             x_range = range(columns) if row % 2 == 0 else range(columns - 1, -1, -1)
 
             for col in x_range:
-                if self.stop:
-                    print("Stopping grid travel")
-                    return
-                
-                x = start_x + col * step_x
-
-                try:
-                    self.fb.move(x, y)
-
-                    if callback:
-                        callback()
+                cells.append((start_x + col * step_x, y))
 
-                    time.sleep(1)
+        return cells, message
 
-                except Exception as e:
-                    print(f"Error moving to ({x}, {y}): {e}")
+    def current_xy(self):
+        position = self.status_data.get("location_data", {}).get("position", {})
+        if position.get("x") is None or position.get("y") is None:
+            return None
+        return (position["x"], position["y"])
+
+    def plan_route(self, steps):
+        """
+        Réordonne les étapes pour minimiser le temps de déplacement depuis la position actuelle.
+        Retourne (étapes réordonnées, résumé du plan).
+        """
+        model = self.motion_model()
+        self.route_planner.move_time = model.xy_time
+        self.route_planner.z_hop_time = (
+            2 * model.axis_time("z", self.safe_height - (self.current_position().get("z") or 0.0))
+        )
+        plan = self.route_planner.plan([(s["x"], s["y"]) for s in steps], self.current_xy())
+        ordered = [steps[i] for i in plan["order"]]
+        summary = {k: v for k, v in plan.items() if k != "order"}
+        return ordered, summary
+
+    async def start_grid_travel(self, start_x=0, start_y=0, width=None, length=None, rows=None, columns=None,
+                          order="zigzag"):
+        """
+        Lance un parcours en grille en arrière-plan et retourne le travail (avec son id) immédiatement.
+        `order` : "zigzag" (ordre d'origine) ou "optimal" (ordre calculé par le planificateur).
+        """
+        cells, message = await self.grid_cells(start_x, start_y, width, length, rows, columns)
+        params = {
+            "start_x": start_x, "start_y": start_y, "width": width,
+            "length": length, "rows": rows, "columns": columns, "order": order,
+        }
+        steps = [{"x": x, "y": y} for x, y in cells]
+        if order == "optimal":
+            steps, params["route"] = self.plan_route(steps)
+
+        return self._start_steps_job("grid_travel", params, steps, message)
+
+    async def start_visit_points(self, pointer_type="Plant", point_ids=None):
+        """
+        Visite les points du jardin (ex. toutes les plantes) dans l'ordre le plus rapide.
+        """
+        points = await self.api.get("points")
+
+        if point_ids:
+            wanted = set(point_ids)
+            points = [p for p in points if p.get("id") in wanted]
+        elif pointer_type:
+            points = [p for p in points if p.get("pointer_type") == pointer_type]
+
+        steps = [{"x": p["x"], "y": p["y"], "point_id": p.get("id"), "name": p.get("name")} for p in points]
+        steps, route = self.plan_route(steps)
+        params = {"pointer_type": pointer_type, "point_ids": point_ids, "route": route}
+        message = f"Visiting {len(steps)} points (estimated {route['cost']:.0f} s)"
+
+        return self._start_steps_job("visit_points", params, steps, message)
+
+    def _start_steps_job(self, kind, params, steps, message):
+        async def runner(job):
+            await asyncio.to_thread(self.fb.send_message, message, message_type="info")
+            await self._visit_steps(job)
+
+        return self.jobs.submit(kind, params, steps, runner)
+
+    async def _visit_steps(self, job):
+        """
+        Visite chaque étape du travail : on passe à la suivante dès que le robot est
+        de nouveau 'idle', sans pause fixe. Les délais d'attente suivent la durée prévue
+        de chaque mouvement, pour détecter un blocage en quelques secondes.
+        """
+        for index, step in enumerate(job.steps):
+            job.check_cancelled()
+            if self.stop:
+                logger.info("Stopping job after emergency stop", extra={"job_id": job.id})
+                raise JobCancelled()
+
+            job.start_step(index)
+            try:
+                # Même décision que _execute_safe_move : hauteur sécuritaire si le segment traverse
+                # une zone interdite ou si le robot est plus bas qu'elle
+                current_z = self.current_position().get("z")
+                lifted = self.would_cross_forbidden_zone(step["x"], step["y"]) or (
+                    current_z is not None and current_z < self.safe_height)
+                estimate = self.estimate_move(step["x"], step["y"], safe_z=lifted)
+                step["estimated"] = estimate["duration"]
+
+                async def move(step=step, estimate=estimate):
+                    # Même chemin qu'un déplacement du kiosque : test des zones interdites et hauteur sécuritaire
+                    move_start = time.time()
+                    with self._movement_timeout(estimate["timeout"]):
+                        result = await self._execute_safe_move(step["x"], step["y"])
+                    if result["status"] != "moved":
+                        raise RuntimeError(result["message"])
+                    move_time = time.time() - move_start
+                    await self.wait_until_idle(timeout=self.motion_model().timeout_for(0))
+                    return {**result, "move_time": move_time,
+                            "settle_time": time.time() - move_start - move_time}
+
+                command = self.dispatcher.submit(f"job:{job.id}", "move", move, estimate["duration"], replace=False)
+                submitted = time.time()
+                result = await command.wait()
+                if command.status == "cancelled":
+                    raise JobCancelled()
+                if command.status == "failed":
+                    raise RuntimeError(result["message"])
+                queue_wait = command.started_at - submitted
+                job.finish_step(index, queue_wait=queue_wait, move_time=result["move_time"],
+                                settle_time=result["settle_time"])
+
+            except JobCancelled:
+                raise
+            except Exception as e:
+                logger.error("Job step failed", extra={"job_id": job.id, "x": step["x"], "y": step["y"],
+                                                       "error": str(e)})
+                step["error"] = str(e)
+                job.finish_step(index, status="error")
+
+    def validate_plan(self, waypoints, action_type="move", from_current=True):
+        """
+        Valide tout un plan d'un coup avant de bouger : zone de chaque point,
+        opération permise ou non et segments qui traversent une zone interdite.
+        """
+        start = None
+        if from_current:
+            start = self.status_data.get("location_data", {}).get("position", {})
+        return self.zone_manager.validate_plan(
+            waypoints, self.safe_height, action_type, start, self.footprint_radius
+        )
                     
-    def get_logs(self):
+    async def get_logs(self, since=None, limit=None, types=None, verbosity=None):
+        """
+        Journaux servis depuis la mémoire. L'API Web n'est lue qu'une fois, pour amorcer
+        le tampon; ensuite il est tenu à jour par le sujet MQTT des journaux.
+        """
+        if not self.logs.seeded:
+            task = self._seed_task
+            # Un amorçage annulé (arrêt, éviction) ou en échec est relancé
+            if task is None or (task.done() and (task.cancelled() or task.exception())):
+                self._seed_task = asyncio.ensure_future(self._seed_logs())
+            await asyncio.shield(self._seed_task)
+        return self.logs.query(since, limit, types, verbosity)
+
+    async def _seed_logs(self):
         # Endpoint : https://my.farm.bot/api/logs
-        return self.fb.api_get("logs")
-    
-    async def take_photo(self):
-        images = self.fb.take_photo()
-        await asyncio.sleep(5)
+        self.logs.extend(await self.api.get("logs"))
+        self.logs.seeded = True
+
+    @staticmethod
+    def _image_jobs(status: dict) -> dict:
+        jobs = status.get("jobs") or {}
+        return {name: job for name, job in jobs.items() if isinstance(job, dict) and job.get("type") == "image"}
+
+    async def take_photo(self, timeout: float = 30.0):
+        """
+        Prend une photo et attend que son envoi soit terminé (entrée 'jobs' du statut MQTT)
+        au lieu d'une pause fixe, puis la met en cache localement.
+        """
+        before = {name: job.get("updated_at") for name, job in self._image_jobs(self.status_data).items()}
+
+        def uploaded(status):
+            for name, job in self._image_jobs(status).items():
+                is_new = name not in before or job.get("updated_at") != before[name]
+                if is_new and (job.get("status") == "Complete" or job.get("percent") == 100):
+                    return name
+            return None
+
         try:
-            images = self.fb.api_get("images")
-            if not images:
+            await asyncio.to_thread(self.fb.take_photo)
+            try:
+                job_name = await self.wait_for_status(uploaded, timeout)
+            except TimeoutError:
+                job_name = None  # FarmBot OS qui ne publie pas les jobs : on prend la plus récente
+
+            record = await self._find_image_record(job_name)
+            if record is None:
                 return {"error": "No images found"}
-            latest = sorted(images, key=lambda img: img["created_at"], reverse=True)[0]
-            return {"url": latest.get("attachment_url")}
+            return await self._photo_response(record)
         except Exception as e:
             return {"error": str(e)}
+
+    @staticmethod
+    def _is_processed(record) -> bool:
+        # Avant son traitement par l'API Web, attachment_url pointe vers une image provisoire
+        return bool(record.get("attachment_processed_at"))
+
+    async def _find_image_record(self, job_name, attempts: int = 3):
+        # L'enregistrement peut apparaître dans l'API un peu après la fin de l'envoi,
+        # et n'est définitif qu'une fois traité
+        record, images = None, []
+        for attempt in range(attempts):
+            self.cache.invalidate("images")
+            images = await self._cached_api_get("images")
+            if images:
+                if job_name is None:
+                    record = max(images, key=lambda img: img["created_at"])
+                else:
+                    record = next((image for image in images
+                                   if (image.get("meta") or {}).get("name") == job_name), None)
+            if record is not None and self._is_processed(record):
+                return record
+            if attempt < attempts - 1:
+                await asyncio.sleep(1 + attempt)
+        if record is None and images:
+            record = max(images, key=lambda img: img["created_at"])
+        return record
+
+    async def _photo_response(self, record):
+        image_id = record["id"]
+        if not self._is_processed(record):
+            # Pas de cache local (servi comme immuable) pour une image provisoire
+            return {"url": record.get("attachment_url"), "id": image_id, "processing": True}
+        if not self.image_cache.has(image_id):
+            try:
+                await self.cache_image(record)
+            except Exception as e:
+                logger.warning("Image cache failed", extra={"image_id": image_id, "error": str(e)})
+                return {"url": record.get("attachment_url"), "id": image_id}
+
+        response = {"url": f"/photos/{image_id}", "id": image_id, "remote_url": record.get("attachment_url")}
+        if self.image_cache.path(image_id, thumbnail=True):
+            response["thumbnail_url"] = f"/photos/{image_id}/thumbnail"
+        return response
+
+    async def cache_image(self, record):
+        data = await self.api.download(record["attachment_url"])
+        await asyncio.to_thread(self.image_cache.store, record["id"], data)
+
+    async def photo_path(self, image_id: int, thumbnail: bool = False):
+        """Chemin local d'une photo, téléchargée depuis le nuage une seule fois."""
+        path = self.image_cache.path(image_id, thumbnail)
+        if path is None and not self.image_cache.has(image_id):
+            record = await self.api.get("images", image_id)
+            if not self._is_processed(record):
+                return None
+            await self.cache_image(record)
+            path = self.image_cache.path(image_id, thumbnail)
+        if path is None and thumbnail:
+            path = self.image_cache.path(image_id)  # Pas de vignette (Pillow absent)
+        return path
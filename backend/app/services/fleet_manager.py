@@ -0,0 +1,228 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from app.services.farmbot_service import DEVICE_CONFIG_DIR, IMAGE_CACHE_DIR, FarmBotService
+from app.services.simulator import simulated_service
+from app.utils.auth import TOKEN_FILE
+
+# Fichier de configuration de la flotte et délai (s) avant de fermer une session inutilisée
+FLEET_CONFIG = os.getenv("FARMBOT_FLEET_CONFIG", "fleet.json")
+FLEET_IDLE_TIMEOUT = float(os.getenv("FARMBOT_FLEET_IDLE_TIMEOUT", "900"))
+
+# Sans fleet.json : FARMBOT_SIMULATOR=<speedup> remplace le robot par défaut par un robot simulé
+SIMULATOR_SPEEDUP = os.getenv("FARMBOT_SIMULATOR")
+
+DEFAULT_DEVICE = "default"
+WARM_RETRY_MAX = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownDevice(Exception):
+    def __init__(self, device_id: str):
+        super().__init__(f"Robot inconnu : {device_id}")
+        self.device_id = device_id
+
+
+class DeviceSession:
+    def __init__(self, device_id: str, service: FarmBotService):
+        self.device_id = device_id
+        self.service = service
+        self.created_at = time.time()
+        self.last_used = time.monotonic()
+
+    def to_dict(self) -> dict:
+        return {
+            "device_id": self.device_id,
+            "created_at": self.created_at,
+            "idle_for": round(time.monotonic() - self.last_used, 1),
+            "open": True,
+            "active": self.service.is_active(),
+        }
+
+
+class FleetManager:
+    """
+    Une session FarmBotService par robot (jeton, connexion MQTT, caches et zones propres),
+    créée à la première requête et fermée après `idle_timeout` secondes sans requête
+    ni travail, mouvement ou client en direct. La session du robot par défaut, ouverte au
+    démarrage (warm), reste ouverte.
+
+    fleet.json :
+        {"devices": {"serre-1": {"token": "tokens/serre-1.json", "zones": "app/utils/zones_serre-1.json"},
+                     "banc": {"simulator": {"speedup": 60, "points": "../backups/2025-05-21_16-23-47/points.json"}}}}
+
+    Sans fleet.json, un seul robot "default" utilise le jeton et les zones habituels.
+    Un robot avec une clé "simulator" est simulé dans le processus (app/services/simulator.py).
+    La dernière configuration connue de chaque robot est gardée dans
+    DEVICE_CONFIG_DIR/<device_id>.json (clé "device_config" pour la changer).
+    """
+
+    def __init__(self, config_path: str = FLEET_CONFIG, idle_timeout: float = FLEET_IDLE_TIMEOUT,
+                 factory: Callable[..., FarmBotService] = FarmBotService):
+        self.idle_timeout = idle_timeout
+        self.factory = factory
+        self.devices = self._load_config(config_path)
+        self.sessions: Dict[str, DeviceSession] = {}
+        self._opening: Dict[str, asyncio.Future] = {}
+        self.errors: Dict[str, str] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _load_config(path: str) -> Dict[str, dict]:
+        if not os.path.exists(path):
+            config = {"token": TOKEN_FILE, "zones": "app/utils/zones.json",
+                      "device_config": os.path.join(DEVICE_CONFIG_DIR, f"{DEFAULT_DEVICE}.json")}
+            if SIMULATOR_SPEEDUP:
+                config["simulator"] = {"speedup": float(SIMULATOR_SPEEDUP)}
+            return {DEFAULT_DEVICE: config}
+        with open(path, "r") as f:
+            devices = json.load(f)["devices"]
+        for device_id, config in devices.items():
+            config.setdefault("token", TOKEN_FILE)
+            config.setdefault("zones", "app/utils/zones.json")
+            config.setdefault("image_cache", os.path.join(IMAGE_CACHE_DIR, device_id))
+            config.setdefault("device_config", os.path.join(DEVICE_CONFIG_DIR, f"{device_id}.json"))
+        return devices
+
+    @property
+    def default_device(self) -> str:
+        return DEFAULT_DEVICE if DEFAULT_DEVICE in self.devices else next(iter(self.devices))
+
+    async def get(self, device_id: Optional[str] = None) -> FarmBotService:
+        device_id = device_id or self.default_device
+        if device_id not in self.devices:
+            raise UnknownDevice(device_id)
+        self._ensure_sweeper()
+
+        session = self.sessions.get(device_id)
+        if session is None:
+            # Une seule ouverture par robot, même si plusieurs requêtes arrivent en même temps
+            opening = self._opening.get(device_id)
+            if opening is None:
+                opening = asyncio.ensure_future(self._open(device_id))
+                self._opening[device_id] = opening
+                opening.add_done_callback(lambda _: self._opening.pop(device_id, None))
+            session = await asyncio.shield(opening)
+
+        session.last_used = time.monotonic()
+        return session.service
+
+    async def _open(self, device_id: str) -> DeviceSession:
+        config = self.devices[device_id]
+        kwargs = {"token_path": config["token"], "zones_path": config["zones"]}
+        if "image_cache" in config:
+            kwargs["image_cache_dir"] = config["image_cache"]
+        if "device_config" in config:
+            kwargs["device_config_path"] = config["device_config"]
+        factory = self.factory
+        if "simulator" in config:
+            simulator = config["simulator"]
+            factory = partial(simulated_service, speedup=simulator.get("speedup", 1.0),
+                              points_path=simulator.get("points"))
+        logger.info("Opening FarmBot session", extra={"device_id": device_id, "simulated": "simulator" in config})
+        started = time.perf_counter()
+        # Le constructeur lit des fichiers (jeton, zones) : hors de la boucle asyncio
+        service = None
+        try:
+            service = await asyncio.to_thread(factory, **kwargs)
+            await service.start()
+        except Exception as e:
+            self.errors[device_id] = str(e) or type(e).__name__
+            logger.error("FarmBot session failed to start", extra={"device_id": device_id, "error": self.errors[device_id]})
+            if service is not None:
+                await service.close()
+            raise
+        self.errors.pop(device_id, None)
+        logger.info("FarmBot session ready", extra={"device_id": device_id, "readiness": dict(service.readiness),
+                                                    "duration": round(time.perf_counter() - started, 3)})
+        session = self.sessions[device_id] = DeviceSession(device_id, service)
+        return session
+
+    async def warm(self):
+        """
+        Ouvre la session du robot par défaut dès le démarrage du serveur, sans attendre la
+        première requête d'un kiosque. Réessaie tant que l'ouverture échoue.
+        """
+        delay = 1.0
+        while True:
+            try:
+                await self.get()
+                return
+            except Exception:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, WARM_RETRY_MAX)
+
+    def _ensure_sweeper(self):
+        if self.idle_timeout > 0 and (self._sweeper is None or self._sweeper.done()):
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 4, 1.0))
+            await self.evict_idle()
+
+    async def evict_idle(self) -> int:
+        """Ferme les sessions inutilisées, sauf celle du robot par défaut : /ready en dépend."""
+        now = time.monotonic()
+        idle = [s for s in self.sessions.values()
+                if s.device_id != self.default_device
+                and now - s.last_used > self.idle_timeout and not s.service.is_active()]
+        for session in idle:
+            await self.close(session.device_id)
+        return len(idle)
+
+    async def close(self, device_id: str):
+        session = self.sessions.pop(device_id, None)
+        if session is not None:
+            logger.info("Closing FarmBot session", extra={"device_id": device_id})
+            await session.service.close()
+
+    async def close_all(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        for device_id in list(self.sessions):
+            await self.close(device_id)
+
+    def metrics(self):
+        """Jauges par robot, lues à chaque collecte de /metrics."""
+        sessions = list(self.sessions.values())
+        yield "farmbot_fleet_sessions_open", "Sessions de robot ouvertes", "gauge", [({}, len(sessions))]
+        per_device = [
+            ("farmbot_motion_queue_depth", "Commandes de mouvement en cours ou en attente",
+             lambda s: s.service.dispatcher.depth),
+            ("farmbot_live_clients", "Clients en direct (SSE / WebSocket)",
+             lambda s: s.service.broadcaster.client_count),
+            ("farmbot_jobs_running", "Travaux de mouvement non terminés",
+             lambda s: sum(1 for job in s.service.jobs.jobs.values() if not job.done)),
+            ("farmbot_log_buffer_entries", "Journaux gardés en mémoire", lambda s: len(s.service.logs)),
+            ("farmbot_status_version", "Version du résumé de statut (change à chaque statut visible)",
+             lambda s: s.service.snapshot.version),
+        ]
+        for name, help, value in per_device:
+            yield name, help, "gauge", [({"device": s.device_id}, value(s)) for s in sessions]
+
+    def readiness(self) -> dict:
+        """État de chaque robot et de ses dépendances; prêt quand le robot par défaut l'est."""
+        devices = {}
+        for device_id in self.devices:
+            session = self.sessions.get(device_id)
+            if session is not None:
+                devices[device_id] = {"ready": session.service.is_ready(), **session.service.readiness}
+            else:
+                state = "opening" if device_id in self._opening else "closed"
+                devices[device_id] = {"ready": False, "session": state, "error": self.errors.get(device_id)}
+        return {"ready": devices[self.default_device]["ready"], "devices": devices}
+
+    def describe(self) -> list:
+        return [
+            self.sessions[device_id].to_dict() if device_id in self.sessions
+            else {"device_id": device_id, "active": False, "open": False}
+            for device_id in self.devices
+        ]
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, kind: str, params: dict, steps: List[dict]):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.steps = [{**step, "status": "pending"} for step in steps]
+        self.status = "pending"  # "pending", "running", "completed", "cancelled" ou "failed"
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.cancel_requested = False
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "cancelled", "failed")
+
+    def check_cancelled(self):
+        if self.cancel_requested:
+            raise JobCancelled()
+
+    def start_step(self, index: int):
+        step = self.steps[index]
+        step["status"] = "running"
+        step["started_at"] = time.time()
+
+    def finish_step(self, index: int, status: str = "done", **timings):
+        step = self.steps[index]
+        step["status"] = status
+        step["finished_at"] = time.time()
+        step["duration"] = round(step["finished_at"] - step["started_at"], 3)
+        step.update({k: round(v, 3) for k, v in timings.items()})
+
+    def to_dict(self) -> dict:
+        completed = sum(1 for s in self.steps if s["status"] in ("done", "error"))
+        end = self.finished_at or time.time()
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "error": self.error,
+            "progress": {
+                "completed": completed,
+                "total": len(self.steps),
+                "percent": round(100 * completed / len(self.steps), 1) if self.steps else 100.0,
+            },
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed": round(end - self.started_at, 3) if self.started_at else None,
+            "steps": self.steps,
+        }
+
+
+class JobManager:
+    """
+    Exécute les travaux de mouvement longs (grid_travel, ...) comme tâches asyncio.
+    La requête HTTP reçoit l'identifiant tout de suite; la progression se lit avec get().
+    """
+
+    def __init__(self, max_history: int = 50):
+        self.max_history = max_history
+        self.jobs: Dict[str, Job] = {}
+
+    def submit(self, kind: str, params: dict, steps: List[dict],
+               runner: Callable[[Job], Awaitable[None]]) -> Job:
+        job = Job(kind, params, steps)
+        self.jobs[job.id] = job
+        self._prune()
+        job.task = asyncio.get_running_loop().create_task(self._run(job, runner))
+        return job
+
+    async def _run(self, job: Job, runner: Callable[[Job], Awaitable[None]]):
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            await runner(job)
+            job.status = "cancelled" if job.cancel_requested else "completed"
+        except (JobCancelled, asyncio.CancelledError):
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error("Job failed", exc_info=e, extra={"job_id": job.id, "kind": job.kind})
+        finally:
+            job.finished_at = time.time()
+            for step in job.steps:
+                if step["status"] in ("pending", "running"):
+                    step["status"] = "skipped"
+            logger.info("Job finished", extra={"job_id": job.id, "kind": job.kind, "status": job.status,
+                                               "steps": len(job.steps),
+                                               "elapsed": round(job.finished_at - job.started_at, 3)})
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def list(self) -> List[dict]:
+        return [
+            {k: v for k, v in job.to_dict().items() if k != "steps"}
+            for job in self.jobs.values()
+        ]
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Annule un travail sans arrêt d'urgence : le mouvement en cours se termine,
+        les cellules suivantes ne sont pas visitées.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.done:
+            return job
+        job.cancel_requested = True
+        return job
+
+    def cancel_all(self):
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+
+    def _prune(self):
+        finished = [j for j in self.jobs.values() if j.done]
+        excess = len(self.jobs) - self.max_history
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(excess, 0)]:
+            del self.jobs[job.id]
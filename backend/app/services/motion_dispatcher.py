@@ -0,0 +1,205 @@
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, List, Optional
+
+from app.utils.metrics import REGISTRY
+from app.utils.structured_log import MOVE_ID, REQUEST_ID
+
+logger = logging.getLogger(__name__)
+
+# Priorité par défaut (plus petit = passe avant)
+PRIORITY_NORMAL = 10
+
+MOTION_QUEUE_WAIT = REGISTRY.histogram(
+    "farmbot_motion_queue_wait_seconds", "Attente d'une commande de mouvement dans la file", ("kind",))
+MOTION_ESTIMATED = REGISTRY.histogram(
+    "farmbot_motion_estimated_seconds", "Durée prévue (modèle cinématique) des commandes exécutées", ("kind",))
+MOTION_ACTUAL = REGISTRY.histogram(
+    "farmbot_motion_actual_seconds", "Durée réelle des commandes de mouvement", ("kind", "status"))
+MOTION_RATIO = REGISTRY.histogram(
+    "farmbot_motion_actual_over_estimate", "Durée réelle / durée prévue d'un mouvement", ("kind",),
+    buckets=(0.5, 0.8, 0.9, 1.0, 1.1, 1.25, 1.5, 2.0, 3.0, 5.0, 10.0))
+
+
+class MotionCommand:
+    def __init__(self, client_id: str, kind: str, run: Callable[[], Awaitable], estimate: float,
+                 priority: int, seq: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.client_id = client_id
+        self.kind = kind
+        self.run = run
+        self.estimate = estimate
+        self.priority = priority
+        self.seq = seq
+        self.status = "queued"  # "queued", "running", "done", "failed", "superseded" ou "cancelled"
+        self.enqueued_at = time.time()
+        self.started_at: Optional[float] = None
+        # Requête HTTP qui a soumis la commande (le worker tourne dans une autre tâche)
+        self.request_id = REQUEST_ID.get()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def resolve(self, status: str, result=None):
+        self.status = status
+        if not self.future.done():
+            self.future.set_result(result)
+
+    async def wait(self):
+        return await asyncio.shield(self.future)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "client_id": self.client_id,
+            "kind": self.kind,
+            "status": self.status,
+            "estimate": round(self.estimate, 3),
+            "enqueued_at": self.enqueued_at,
+            "started_at": self.started_at,
+        }
+
+
+class MotionDispatcher:
+    """
+    Seul propriétaire du canal de mouvement du robot : les commandes passent une à une.
+
+    - un nouveau déplacement d'un client remplace son déplacement encore en attente
+      (on n'exécute pas un arriéré de vieilles touches d'écran)
+    - l'arrêt d'urgence ne fait pas la file : il vide la file et part tout de suite
+    - chaque commande connaît sa position dans la file et son heure de départ prévue
+    """
+
+    def __init__(self):
+        self._queue: List[MotionCommand] = []
+        self._current: Optional[MotionCommand] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._seq = itertools.count()
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    def submit(self, client_id: str, kind: str, run: Callable[[], Awaitable], estimate: float = 0.0,
+               priority: int = PRIORITY_NORMAL, replace: bool = True) -> MotionCommand:
+        self._ensure_worker()
+        command = MotionCommand(client_id, kind, run, estimate, priority, next(self._seq))
+
+        if replace:
+            for index, pending in enumerate(self._queue):
+                if pending.client_id == client_id and pending.kind == kind:
+                    # Garde la place dans la file de l'ancienne commande
+                    command.seq = pending.seq
+                    self._queue[index] = command
+                    pending.resolve("superseded", {"status": "superseded", "by": command.id})
+                    break
+            else:
+                self._queue.append(command)
+        else:
+            self._queue.append(command)
+
+        self._queue.sort(key=lambda c: (c.priority, c.seq))
+        self._wakeup.set()
+        return command
+
+    def clear(self, reason: str = "cancelled") -> int:
+        """Vide la file (les commandes en attente sont résolues comme annulées)."""
+        pending, self._queue = self._queue, []
+        for command in pending:
+            command.resolve("cancelled", {"status": "cancelled", "reason": reason})
+        return len(pending)
+
+    @property
+    def idle(self) -> bool:
+        return self._current is None and not self._queue
+
+    @property
+    def depth(self) -> int:
+        """Commandes en cours + en attente."""
+        return len(self._queue) + (self._current is not None)
+
+    def close(self):
+        self.clear("shutdown")
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def position(self, command: MotionCommand) -> Optional[int]:
+        """0 = en cours d'exécution, 1 = prochaine, ... ; None si plus dans la file."""
+        if command is self._current:
+            return 0
+        try:
+            return self._queue.index(command) + 1
+        except ValueError:
+            return None
+
+    def expected_start(self, command: MotionCommand) -> Optional[float]:
+        position = self.position(command)
+        if position is None:
+            return None
+        if position == 0:
+            return command.started_at
+        start = time.time()
+        if self._current is not None and self._current.started_at is not None:
+            start += max(0.0, self._current.estimate - (time.time() - self._current.started_at))
+        for ahead in self._queue[:position - 1]:
+            start += ahead.estimate
+        return start
+
+    def queue_info(self, command: MotionCommand) -> dict:
+        return {
+            "command_id": command.id,
+            "position": self.position(command),
+            "expected_start": self.expected_start(command),
+        }
+
+    def snapshot(self) -> dict:
+        def describe(command):
+            return {**command.to_dict(), **self.queue_info(command)}
+        return {
+            "current": describe(self._current) if self._current else None,
+            "queued": [describe(c) for c in self._queue],
+        }
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            command = self._current = self._queue.pop(0)
+            command.status = "running"
+            command.started_at = time.time()
+            MOTION_QUEUE_WAIT.labels(command.kind).observe(command.started_at - command.enqueued_at)
+            # Les journaux du mouvement (y compris dans les threads de fb.move) portent ces identifiants
+            request_token = REQUEST_ID.set(command.request_id)
+            move_token = MOVE_ID.set(command.id)
+            started = time.perf_counter()
+            try:
+                result = await command.run()
+                command.resolve("done", result)
+            except asyncio.CancelledError:
+                # close() : la commande en cours ne doit pas laisser son appelant attendre pour toujours
+                command.resolve("cancelled", {"status": "cancelled", "reason": "shutdown"})
+                raise
+            except Exception as e:
+                logger.error("Motion command failed", exc_info=e,
+                             extra={"kind": command.kind, "client_id": command.client_id})
+                command.resolve("failed", {"status": "error", "message": str(e)})
+            finally:
+                self._current = None
+                self._observe(command, time.perf_counter() - started)
+                MOVE_ID.reset(move_token)
+                REQUEST_ID.reset(request_token)
+
+    @staticmethod
+    def _observe(command: MotionCommand, duration: float):
+        # Prévu vs réel : un rapport qui dérive signale des mcu_params ou une attente 'idle' à revoir
+        MOTION_ACTUAL.labels(command.kind, command.status).observe(duration)
+        if command.status == "done" and command.estimate > 0:
+            MOTION_ESTIMATED.labels(command.kind).observe(command.estimate)
+            MOTION_RATIO.labels(command.kind).observe(duration / command.estimate)
@@ -0,0 +1,431 @@
+# app/services/simulator.py
+"""
+Robot simulé dans le processus, pour développer et tester la charge sans FarmBot ni nuage.
+
+Chaque pièce a la même interface que ce qu'elle remplace dans FarmBotService :
+- SimulatedFarmbot   ~ farmbot.Farmbot (move, find_home, e_stop, safe_z, take_photo, ...)
+- StatusBus + SimulatedMQTTClient ~ broker MQTT + FarmbotMQTTClient
+- SimulatedWebAPI    ~ WebAPIClient (device, firmware_config, fbos_config, points, logs, images)
+
+Les déplacements suivent les profils trapézoïdaux du firmware (MotionModel, mêmes mcu_params
+que ceux publiés dans le statut). Avec `speedup` > 1, le temps simulé avance plus vite que
+le temps réel : un parcours d'une heure se joue en quelques secondes.
+"""
+import itertools
+import json
+import queue
+import random
+import threading
+import time
+import types
+from typing import Dict, List, Optional
+
+from app.utils.motion_model import AXES, DEFAULT_PARAMS, MotionModel
+from app.utils.web_api import WebAPIError
+
+# Dimensions du jardin simulé (mm) et hauteur sécuritaire par défaut
+GARDEN = {"x": 2959.0, "y": 1340.0, "z": 500.0}
+SAFE_HEIGHT = 0.0
+
+# Intervalle (s simulées) entre deux statuts publiés, au repos et pendant un mouvement
+STATUS_INTERVAL = 1.0
+MOVING_STATUS_INTERVAL = 0.25
+# Intervalle réel minimal entre deux statuts (un speedup élevé ne doit pas inonder le bus)
+MIN_REAL_INTERVAL = 0.02
+
+# Durée (s simulées) de la prise et de l'envoi d'une photo
+PHOTO_DURATION = 4.0
+
+SIMULATED_TOKEN = {
+    "token": {
+        "encoded": "simulated.jwt.token",
+        "unencoded": {"iss": "//simulator.local:80", "mqtt": "simulator.local", "bot": "device_0"},
+    },
+    "user": {"device_id": 0},
+}
+
+# Contenu servi pour chaque photo simulée : un JPEG vide (début + fin d'image), sans vignette
+PLACEHOLDER_JPEG = b"\xff\xd8\xff\xd9"
+
+
+class SimClock:
+    """Temps simulé : avance `speedup` fois plus vite que le temps réel."""
+
+    def __init__(self, speedup: float = 1.0):
+        self.speedup = max(float(speedup), 1e-6)
+        self._origin = time.monotonic()
+
+    def now(self) -> float:
+        """Secondes simulées depuis le démarrage du simulateur."""
+        return (time.monotonic() - self._origin) * self.speedup
+
+    def real(self, sim_seconds: float) -> float:
+        return sim_seconds / self.speedup
+
+    def wait(self, event: threading.Event, sim_seconds: float) -> bool:
+        """Attend `sim_seconds` simulées; retourne True si `event` est levé avant."""
+        return event.wait(max(self.real(sim_seconds), 0.0))
+
+
+class StatusBus:
+    """
+    Remplace le broker MQTT : les messages sont livrés aux abonnés, dans l'ordre,
+    depuis un thread dédié (comme la boucle réseau de paho).
+    """
+
+    def __init__(self):
+        self.subscribers = []
+        self.published = 0
+        self.retained = {}  # Dernier statut publié, livré à chaque nouvel abonné (message MQTT retenu)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._deliver, name="sim-status-bus", daemon=True)
+        self._thread.start()
+
+    def publish(self, topic: str, payload: dict):
+        self.published += 1
+        if topic.endswith("/status"):
+            self.retained[topic] = payload
+        self._queue.put((topic, payload, None))
+
+    def subscribe(self, client):
+        self.subscribers.append(client)
+        for topic, payload in list(self.retained.items()):
+            self._queue.put((topic, payload, client))
+
+    def _deliver(self):
+        while True:
+            topic, payload, target = self._queue.get()
+            for client in [target] if target is not None else list(self.subscribers):
+                client.deliver(topic, payload)
+
+
+class SimulatedMQTTClient:
+    """Même interface que FarmbotMQTTClient, abonné au StatusBus."""
+
+    def __init__(self, bus: StatusBus, on_status=None, on_log=None, token_path=None):
+        self.bus = bus
+        self.on_status = on_status
+        self.on_log = on_log
+        self.connected = False
+
+    def connect(self):
+        self.bus.subscribe(self)
+        self.connected = True
+
+    def deliver(self, topic: str, payload: dict):
+        if topic.endswith("/logs"):
+            if self.on_log:
+                self.on_log(payload)
+        elif self.on_status:
+            self.on_status(payload)
+
+    def stop(self):
+        if self.connected:
+            self.bus.subscribers.remove(self)
+            self.connected = False
+
+
+def generate_points(count: int = 300, seed: int = 1, garden: Dict[str, float] = GARDEN) -> List[dict]:
+    """Plantes réparties dans le jardin (reproductibles pour une même graine)."""
+    rng = random.Random(seed)
+    return [
+        {"id": i + 1, "pointer_type": "Plant", "name": f"Plant {i + 1}",
+         "x": rng.randint(0, int(garden["x"])), "y": rng.randint(0, int(garden["y"])), "z": 0,
+         "radius": 25, "openfarm_slug": "lettuce", "meta": {}}
+        for i in range(count)
+    ]
+
+
+class SimulatedFarmbot:
+    """
+    Portique simulé. `move` bloque pendant la durée du mouvement (comme la bibliothèque,
+    qui attend la réponse du robot) et publie pendant ce temps des statuts réalistes :
+    busy, position interpolée, axis_states, jobs.
+    """
+
+    def __init__(self, bus: StatusBus, clock: SimClock, params: Optional[Dict[str, float]] = None,
+                 garden: Dict[str, float] = GARDEN, safe_height: float = SAFE_HEIGHT,
+                 status_interval: float = STATUS_INTERVAL, device: str = "device_0"):
+        self.bus = bus
+        self.clock = clock
+        self.garden = garden
+        self.safe_height = safe_height
+        self.status_interval = status_interval
+        self.device = device
+        self.params = {**DEFAULT_PARAMS, **(params or {})}
+        for axis in AXES:
+            self.params.setdefault(f"movement_axis_nr_steps_{axis}",
+                                   garden[axis] * self.params[f"movement_step_per_mm_{axis}"])
+        self.model = MotionModel(self.params)
+
+        self.position = {axis: 0.0 for axis in AXES}
+        self.axis_states = {axis: "idle" for axis in AXES}
+        self.busy = False
+        self.locked = False
+        self.jobs: Dict[str, dict] = {}
+        self.moves = 0
+        self.move_timeouts = 0  # appels à move() rendus avant la fin du mouvement
+        self.travel_time = 0.0  # secondes simulées passées en mouvement
+        self.on_image = None  # rappel(job_name) : l'API Web simulée enregistre la photo
+        # Délais (s) de la bibliothèque, mêmes clés et valeurs par défaut que farmbot.Farmbot
+        self.state = types.SimpleNamespace(timeout={"api": 15, "listen": 15, "movements": 120})
+
+        self._log_ids = itertools.count(1)
+        self._motion_lock = threading.Lock()
+        self._estop = threading.Event()
+        self._closed = threading.Event()
+        self._telemetry = threading.Thread(target=self._publish_periodically, name="sim-telemetry", daemon=True)
+        self._telemetry.start()
+
+    # === Statut publié ===
+    def status(self) -> dict:
+        return {
+            "informational_settings": {
+                "busy": self.busy, "idle": not self.busy, "locked": self.locked,
+                "sync_status": "synced", "uptime": int(self.clock.now()),
+            },
+            "location_data": {
+                "position": {axis: round(value, 1) for axis, value in self.position.items()},
+                "axis_states": dict(self.axis_states),
+            },
+            "mcu_params": dict(self.params),
+            "jobs": {name: dict(job) for name, job in self.jobs.items()},
+        }
+
+    def publish_status(self):
+        self.bus.publish(f"bot/{self.device}/status", self.status())
+
+    def publish_log(self, message: str, message_type: str = "info"):
+        self.bus.publish(f"bot/{self.device}/logs", {
+            "id": next(self._log_ids), "created_at": time.time(), "message": message,
+            "type": message_type, "verbosity": 1,
+        })
+
+    def _publish_periodically(self):
+        while not self._closed.is_set():
+            if not self.busy:
+                self.publish_status()
+            self._closed.wait(max(self.clock.real(self.status_interval), MIN_REAL_INTERVAL))
+
+    # === Mouvement ===
+    def _travel(self, target: Dict[str, float], speed: float):
+        start = dict(self.position)
+        duration = self.model.move_time(start, target, None, speed)
+        moving = [axis for axis in AXES if target[axis] != start[axis]]
+        self.axis_states.update({axis: "moving" for axis in moving})
+        tick = max(MOVING_STATUS_INTERVAL, self.clock.speedup * MIN_REAL_INTERVAL)
+        elapsed = 0.0
+        try:
+            while elapsed < duration:
+                step = min(tick, duration - elapsed)
+                if self.clock.wait(self._estop, step):
+                    return False
+                elapsed += step
+                # Interpolation linéaire : seule la durée totale suit le profil trapézoïdal
+                fraction = elapsed / duration
+                for axis in moving:
+                    self.position[axis] = start[axis] + (target[axis] - start[axis]) * fraction
+                self.publish_status()
+            self.position.update(target)
+            return True
+        finally:
+            self.travel_time += elapsed
+            self.axis_states.update({axis: "idle" for axis in moving})
+
+    def _clamp(self, axis: str, value: float) -> float:
+        # Z est négatif vers le bas : 0 en haut, -garden["z"] au plus bas
+        low, high = (-self.garden["z"], 0.0) if axis == "z" else (0.0, self.garden[axis])
+        return min(max(float(value), low), high)
+
+    def move(self, x=None, y=None, z=None, safe_z=None, speed=None):
+        """
+        Comme la bibliothèque : rend la main après state.timeout["movements"] secondes (simulées)
+        sans erreur, même si le portique bouge encore.
+        """
+        motion = threading.Thread(target=self._move, args=(x, y, z, safe_z, speed), name="sim-move", daemon=True)
+        motion.start()
+        motion.join(self.clock.real(self.state.timeout["movements"]))
+        if motion.is_alive():
+            self.move_timeouts += 1
+
+    def _move(self, x=None, y=None, z=None, safe_z=None, speed=None):
+        with self._motion_lock:
+            if self.locked:
+                self.publish_log("Move ignored: device is locked", "error")
+                return
+            self._estop.clear()
+            target = {axis: self.position[axis] if value is None else self._clamp(axis, value)
+                      for axis, value in zip(AXES, (x, y, z))}
+            legs = [target]
+            if safe_z:
+                legs = [{**self.position, "z": self.safe_height},
+                        {**target, "z": self.safe_height},
+                        target]
+
+            self.busy = True
+            self.publish_status()
+            try:
+                for leg in legs:
+                    if not self._travel(leg, speed or 100):
+                        break
+                self.moves += 1
+            finally:
+                self.busy = False
+                self.publish_status()
+
+    def find_home(self):
+        self.move(0, 0, 0)
+
+    def e_stop(self):
+        self.locked = True
+        self._estop.set()
+        self.publish_log("Emergency stop", "error")
+        self.publish_status()
+
+    def unlock(self):
+        self.locked = False
+        self.publish_status()
+
+    # === Reste de l'interface farmbot.Farmbot ===
+    def set_token(self, token):
+        pass
+
+    def set_timeout(self, duration, key="listen"):
+        keys = list(self.state.timeout) if key == "all" else [key]
+        for timeout_key in keys:
+            self.state.timeout[timeout_key] = duration
+
+    def safe_z(self):
+        return self.safe_height
+
+    def toast(self, message):
+        self.publish_log(message, "toast")
+
+    def send_message(self, message, message_type="info", channels=None):
+        self.publish_log(message, message_type)
+
+    def take_photo(self):
+        # Le job 'image' progresse dans le statut, comme l'envoi d'une vraie photo
+        name = f"sim_photo_{int(time.time() * 1000)}.jpg"
+        threading.Thread(target=self._upload_photo, args=(name,), daemon=True).start()
+
+    def _upload_photo(self, name: str):
+        for percent in (0, 50, 100):
+            # Copie à l'écriture : le thread de télémétrie peut lire self.jobs en même temps
+            self.jobs = {**self.jobs, name: {"type": "image", "status": "Complete" if percent == 100 else "working",
+                                             "percent": percent, "updated_at": time.time()}}
+            if percent == 100 and self.on_image:
+                self.on_image(name)
+            self.publish_status()
+            if percent < 100:
+                self._closed.wait(self.clock.real(PHOTO_DURATION / 2))
+
+    def close(self):
+        self._closed.set()
+        self._estop.set()
+
+
+class SimulatedWebAPI:
+    """Même interface que WebAPIClient, avec les données du jardin simulé en mémoire."""
+
+    def __init__(self, bot: SimulatedFarmbot, points: Optional[List[dict]] = None, logs: int = 50):
+        self.bot = bot
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+        self._ids = itertools.count(1000)
+        now = time.time()
+        self.records = {
+            "device": {"id": 0, "name": "Simulated FarmBot", "fbos_version": "simulator"},
+            "firmware_config": {name: value for name, value in bot.params.items() if name.startswith("movement_")},
+            "fbos_config": {"safe_height": bot.safe_height},
+            "points": points if points is not None else generate_points(),
+            "logs": [{"id": -i, "created_at": now - 60 * i, "message": f"Simulated log {i}",
+                      "type": "info", "verbosity": 1} for i in range(1, logs + 1)],
+            "images": [],
+        }
+        bot.on_image = self._add_image
+
+    def _add_image(self, job_name: str):
+        image_id = next(self._ids)
+        self.records["images"].append({
+            "id": image_id, "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+            "attachment_url": f"sim://images/{image_id}.jpg",
+            "attachment_processed_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+            "meta": {"name": job_name, **{axis: self.bot.position[axis] for axis in AXES}},
+        })
+
+    async def get(self, endpoint: str, database_id=None, params: Optional[dict] = None):
+        self.upstream_calls += 1
+        records = self.records.get(endpoint, [])
+        if database_id is None:
+            # Copie : l'appelant ne doit pas modifier les données du simulateur
+            return json.loads(json.dumps(records))
+        for record in records:
+            if record.get("id") == database_id:
+                return dict(record)
+        raise WebAPIError(404, f"GET {endpoint}/{database_id}: HTTP 404")
+
+    async def post(self, endpoint: str, payload: Optional[dict] = None):
+        self.upstream_calls += 1
+        record = {**(payload or {}), "id": next(self._ids)}
+        self.records.setdefault(endpoint, []).append(record)
+        return record
+
+    async def patch(self, endpoint: str, payload: dict, database_id=None):
+        self.upstream_calls += 1
+        for record in self.records.get(endpoint, []):
+            if record.get("id") == database_id:
+                record.update(payload)
+                return dict(record)
+        if isinstance(self.records.get(endpoint), dict):
+            self.records[endpoint].update(payload)
+            return dict(self.records[endpoint])
+        return None
+
+    async def delete(self, endpoint: str, database_id=None):
+        self.upstream_calls += 1
+        self.records[endpoint] = [r for r in self.records.get(endpoint, []) if r.get("id") != database_id]
+
+    async def download(self, url: str) -> bytes:
+        return PLACEHOLDER_JPEG
+
+    async def aclose(self):
+        self.bot.close()
+
+
+class SimulatedBackend:
+    """Le robot, son bus de statut et son API Web simulés, prêts à brancher sur FarmBotService."""
+
+    def __init__(self, speedup: float = 1.0, points: Optional[List[dict]] = None,
+                 params: Optional[Dict[str, float]] = None, safe_height: float = SAFE_HEIGHT,
+                 status_interval: float = STATUS_INTERVAL):
+        self.clock = SimClock(speedup)
+        self.bus = StatusBus()
+        self.bot = SimulatedFarmbot(self.bus, self.clock, params, safe_height=safe_height,
+                                    status_interval=status_interval)
+        self.api = SimulatedWebAPI(self.bot, points)
+
+    def mqtt_factory(self, **kwargs) -> SimulatedMQTTClient:
+        return SimulatedMQTTClient(self.bus, **kwargs)
+
+    def service_kwargs(self) -> dict:
+        """Arguments à passer à FarmBotService (en plus de zones_path, image_cache_dir, ...)."""
+        return {"farmbot": self.bot, "api": self.api, "mqtt_factory": self.mqtt_factory,
+                "token": SIMULATED_TOKEN}
+
+
+def load_points(path: str) -> List[dict]:
+    """Points d'une sauvegarde (ex. backups/<date>/points.json) pour simuler un vrai jardin."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def simulated_service(speedup: float = 1.0, points_path: Optional[str] = None, **kwargs):
+    """FarmBotService complet branché sur un robot simulé (à démarrer avec `await service.start()`)."""
+    from app.services.farmbot_service import FarmBotService
+
+    backend = SimulatedBackend(speedup, load_points(points_path) if points_path else None)
+    kwargs.pop("token_path", None)
+    service = FarmBotService(**kwargs, **backend.service_kwargs())
+    backend.bot.publish_status()
+    return service
@@ -1 +1 @@
-import{_ as o,c as s,a as t,o as a}from"./index-Ted7AThh.js";const n={},c={class:"about"};function r(_,e){return a(),s("div",c,e[0]||(e[0]=[t("h1",null,"This is an about page",-1)]))}const l=o(n,[["render",r]]);export{l as default};
+import{_ as o,c as s,a as t,o as a}from"./index-yzr-ruYb.js";const n={},c={class:"about"};function r(_,e){return a(),s("div",c,e[0]||(e[0]=[t("h1",null,"This is an about page",-1)]))}const l=o(n,[["render",r]]);export{l as default};
@@ -1,4 +1,4 @@
-const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/AboutView-BOLUizkE.js","assets/AboutView-CSIvawM9.css"])))=>i.map(i=>d[i]);
+const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/AboutView-PlSwkyS7.js","assets/AboutView-CSIvawM9.css"])))=>i.map(i=>d[i]);
 (function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const s of document.querySelectorAll('link[rel="modulepreload"]'))r(s);new MutationObserver(s=>{for(const o of s)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(s){const o={};return s.integrity&&(o.integrity=s.integrity),s.referrerPolicy&&(o.referrerPolicy=s.referrerPolicy),s.crossOrigin==="use-credentials"?o.credentials="include":s.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(s){if(s.ep)return;s.ep=!0;const o=n(s);fetch(s.href,o)}})();/**
 * @vue/shared v3.5.14
 * (c) 2018-present Yuxi (Evan) You and Vue contributors
@@ -24,8 +24,8 @@ const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/AboutView-BOLUi
 `)}getSetCookie(){return this.get("set-cookie")||[]}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(t){return t instanceof this?t:new this(t)}static concat(t,...n){const r=new this(t);return n.forEach(s=>r.set(s)),r}static accessor(t){const r=(this[io]=this[io]={accessors:{}}).accessors,s=this.prototype;function o(i){const l=en(i);r[l]||(Xa(s,i),r[l]=!0)}return y.isArray(t)?t.forEach(o):o(t),this}};Te.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);y.reduceDescriptors(Te.prototype,({value:e},t)=>{let n=t[0].toUpperCase()+t.slice(1);return{get:()=>e,set(r){this[n]=r}}});y.freezeMethods(Te);function Ar(e,t){const n=this||xn,r=t||n,s=Te.from(r.headers);let o=r.data;return y.forEach(e,function(l){o=l.call(n,o,s.normalize(),t?t.status:void 0)}),s.normalize(),o}function il(e){return!!(e&&e.__CANCEL__)}function Gt(e,t,n){B.call(this,e??"canceled",B.ERR_CANCELED,t,n),this.name="CanceledError"}y.inherits(Gt,B,{__CANCEL__:!0});function ll(e,t,n){const r=n.config.validateStatus;!n.status||!r||r(n.status)?e(n):t(new B("Request failed with status code "+n.status,[B.ERR_BAD_REQUEST,B.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n))}function Ya(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}function Qa(e,t){e=e||10;const n=new Array(e),r=new Array(e);let s=0,o=0,i;return t=t!==void 0?t:1e3,function(c){const a=Date.now(),u=r[o];i||(i=a),n[s]=c,r[s]=a;let f=o,p=0;for(;f!==s;)p+=n[f++],f=f%e;if(s=(s+1)%e,s===o&&(o=(o+1)%e),a-i<t)return;const g=u&&a-u;return g?Math.round(p*1e3/g):void 0}}function Za(e,t){let n=0,r=1e3/t,s,o;const i=(a,u=Date.now())=>{n=u,s=null,o&&(clearTimeout(o),o=null),e.apply(null,a)};return[(...a)=>{const u=Date.now(),f=u-n;f>=r?i(a,u):(s=a,o||(o=setTimeout(()=>{o=null,i(s)},r-f)))},()=>s&&i(s)]}const Kn=(e,t,n=3)=>{let r=0;const s=Qa(50,250);return Za(o=>{const i=o.loaded,l=o.lengthComputable?o.total:void 0,c=i-r,a=s(c),u=i<=l;r=i;const f={loaded:i,total:l,progress:l?i/l:void 0,bytes:c,rate:a||void 0,estimated:a&&l&&u?(l-i)/a:void 0,event:o,lengthComputable:l!=null,[t?"download":"upload"]:!0};e(f)},n)},lo=(e,t)=>{const n=e!=null;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},co=e=>(...t)=>y.asap(()=>e(...t)),ef=me.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,me.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(me.origin),me.navigator&&/(msie|trident)/i.test(me.navigator.userAgent)):()=>!0,tf=me.hasStandardBrowserEnv?{write(e,t,n,r,s,o){const i=[e+"="+encodeURIComponent(t)];y.isNumber(n)&&i.push("expires="+new Date(n).toGMTString()),y.isString(r)&&i.push("path="+r),y.isString(s)&&i.push("domain="+s),o===!0&&i.push("secure"),document.cookie=i.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read(){return null},remove(){}};function nf(e){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(e)}function rf(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}function cl(e,t,n){let r=!nf(t);return e&&(r||n==!1)?rf(e,t):t}const uo=e=>e instanceof Te?{...e}:e;function Tt(e,t){t=t||{};const n={};function r(a,u,f,p){return y.isPlainObject(a)&&y.isPlainObject(u)?y.merge.call({caseless:p},a,u):y.isPlainObject(u)?y.merge({},u):y.isArray(u)?u.slice():u}function s(a,u,f,p){if(y.isUndefined(u)){if(!y.isUndefined(a))return r(void 0,a,f,p)}else return r(a,u,f,p)}function o(a,u){if(!y.isUndefined(u))return r(void 0,u)}function i(a,u){if(y.isUndefined(u)){if(!y.isUndefined(a))return r(void 0,a)}else return r(void 0,u)}function l(a,u,f){if(f in t)return r(a,u);if(f in e)return r(void 0,a)}const c={url:o,method:o,data:o,baseURL:i,transformRequest:i,transformResponse:i,paramsSerializer:i,timeout:i,timeoutMessage:i,withCredentials:i,withXSRFToken:i,adapter:i,responseType:i,xsrfCookieName:i,xsrfHeaderName:i,onUploadProgress:i,onDownloadProgress:i,decompress:i,maxContentLength:i,maxBodyLength:i,beforeRedirect:i,transport:i,httpAgent:i,httpsAgent:i,cancelToken:i,socketPath:i,responseEncoding:i,validateStatus:l,headers:(a,u,f)=>s(uo(a),uo(u),f,!0)};return y.forEach(Object.keys(Object.assign({},e,t)),function(u){const f=c[u]||s,p=f(e[u],t[u],u);y.isUndefined(p)&&f!==l||(n[u]=p)}),n}const ul=e=>{const t=Tt({},e);let{data:n,withXSRFToken:r,xsrfHeaderName:s,xsrfCookieName:o,headers:i,auth:l}=t;t.headers=i=Te.from(i),t.url=rl(cl(t.baseURL,t.url,t.allowAbsoluteUrls),e.params,e.paramsSerializer),l&&i.set("Authorization","Basic "+btoa((l.username||"")+":"+(l.password?unescape(encodeURIComponent(l.password)):"")));let c;if(y.isFormData(n)){if(me.hasStandardBrowserEnv||me.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if((c=i.getContentType())!==!1){const[a,...u]=c?c.split(";").map(f=>f.trim()).filter(Boolean):[];i.setContentType([a||"multipart/form-data",...u].join("; "))}}if(me.hasStandardBrowserEnv&&(r&&y.isFunction(r)&&(r=r(t)),r||r!==!1&&ef(t.url))){const a=s&&o&&tf.read(o);a&&i.set(s,a)}return t},sf=typeof XMLHttpRequest<"u",of=sf&&function(e){return new Promise(function(n,r){const s=ul(e);let o=s.data;const i=Te.from(s.headers).normalize();let{responseType:l,onUploadProgress:c,onDownloadProgress:a}=s,u,f,p,g,b;function S(){g&&g(),b&&b(),s.cancelToken&&s.cancelToken.unsubscribe(u),s.signal&&s.signal.removeEventListener("abort",u)}let C=new XMLHttpRequest;C.open(s.method.toUpperCase(),s.url,!0),C.timeout=s.timeout;function x(){if(!C)return;const M=Te.from("getAllResponseHeaders"in C&&C.getAllResponseHeaders()),z={data:!l||l==="text"||l==="json"?C.responseText:C.response,status:C.status,statusText:C.statusText,headers:M,config:e,request:C};ll(function(K){n(K),S()},function(K){r(K),S()},z),C=null}"onloadend"in C?C.onloadend=x:C.onreadystatechange=function(){!C||C.readyState!==4||C.status===0&&!(C.responseURL&&C.responseURL.indexOf("file:")===0)||setTimeout(x)},C.onabort=function(){C&&(r(new B("Request aborted",B.ECONNABORTED,e,C)),C=null)},C.onerror=function(){r(new B("Network Error",B.ERR_NETWORK,e,C)),C=null},C.ontimeout=function(){let L=s.timeout?"timeout of "+s.timeout+"ms exceeded":"timeout exceeded";const z=s.transitional||sl;s.timeoutErrorMessage&&(L=s.timeoutErrorMessage),r(new B(L,z.clarifyTimeoutError?B.ETIMEDOUT:B.ECONNABORTED,e,C)),C=null},o===void 0&&i.setContentType(null),"setRequestHeader"in C&&y.forEach(i.toJSON(),function(L,z){C.setRequestHeader(z,L)}),y.isUndefined(s.withCredentials)||(C.withCredentials=!!s.withCredentials),l&&l!=="json"&&(C.responseType=s.responseType),a&&([p,b]=Kn(a,!0),C.addEventListener("progress",p)),c&&C.upload&&([f,g]=Kn(c),C.upload.addEventListener("progress",f),C.upload.addEventListener("loadend",g)),(s.cancelToken||s.signal)&&(u=M=>{C&&(r(!M||M.type?new Gt(null,e,C):M),C.abort(),C=null)},s.cancelToken&&s.cancelToken.subscribe(u),s.signal&&(s.signal.aborted?u():s.signal.addEventListener("abort",u)));const E=Ya(s.url);if(E&&me.protocols.indexOf(E)===-1){r(new B("Unsupported protocol "+E+":",B.ERR_BAD_REQUEST,e));return}C.send(o||null)})},lf=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let r=new AbortController,s;const o=function(a){if(!s){s=!0,l();const u=a instanceof Error?a:this.reason;r.abort(u instanceof B?u:new Gt(u instanceof Error?u.message:u))}};let i=t&&setTimeout(()=>{i=null,o(new B(`timeout ${t} of ms exceeded`,B.ETIMEDOUT))},t);const l=()=>{e&&(i&&clearTimeout(i),i=null,e.forEach(a=>{a.unsubscribe?a.unsubscribe(o):a.removeEventListener("abort",o)}),e=null)};e.forEach(a=>a.addEventListener("abort",o));const{signal:c}=r;return c.unsubscribe=()=>y.asap(l),c}},cf=function*(e,t){let n=e.byteLength;if(n<t){yield e;return}let r=0,s;for(;r<n;)s=r+t,yield e.slice(r,s),r=s},uf=async function*(e,t){for await(const n of af(e))yield*cf(n,t)},af=async function*(e){if(e[Symbol.asyncIterator]){yield*e;return}const t=e.getReader();try{for(;;){const{done:n,value:r}=await t.read();if(n)break;yield r}}finally{await t.cancel()}},ao=(e,t,n,r)=>{const s=uf(e,t);let o=0,i,l=c=>{i||(i=!0,r&&r(c))};return new ReadableStream({async pull(c){try{const{done:a,value:u}=await s.next();if(a){l(),c.close();return}let f=u.byteLength;if(n){let p=o+=f;n(p)}c.enqueue(new Uint8Array(u))}catch(a){throw l(a),a}},cancel(c){return l(c),s.return()}},{highWaterMark:2})},ur=typeof fetch=="function"&&typeof Request=="function"&&typeof Response=="function",al=ur&&typeof ReadableStream=="function",ff=ur&&(typeof TextEncoder=="function"?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),fl=(e,...t)=>{try{return!!e(...t)}catch{return!1}},df=al&&fl(()=>{let e=!1;const t=new Request(me.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t}),fo=64*1024,Wr=al&&fl(()=>y.isReadableStream(new Response("").body)),Wn={stream:Wr&&(e=>e.body)};ur&&(e=>{["text","arrayBuffer","blob","formData","stream"].forEach(t=>{!Wn[t]&&(Wn[t]=y.isFunction(e[t])?n=>n[t]():(n,r)=>{throw new B(`Response type '${t}' is not supported`,B.ERR_NOT_SUPPORT,r)})})})(new Response);const hf=async e=>{if(e==null)return 0;if(y.isBlob(e))return e.size;if(y.isSpecCompliantForm(e))return(await new Request(me.origin,{method:"POST",body:e}).arrayBuffer()).byteLength;if(y.isArrayBufferView(e)||y.isArrayBuffer(e))return e.byteLength;if(y.isURLSearchParams(e)&&(e=e+""),y.isString(e))return(await ff(e)).byteLength},pf=async(e,t)=>{const n=y.toFiniteNumber(e.getContentLength());return n??hf(t)},mf=ur&&(async e=>{let{url:t,method:n,data:r,signal:s,cancelToken:o,timeout:i,onDownloadProgress:l,onUploadProgress:c,responseType:a,headers:u,withCredentials:f="same-origin",fetchOptions:p}=ul(e);a=a?(a+"").toLowerCase():"text";let g=lf([s,o&&o.toAbortSignal()],i),b;const S=g&&g.unsubscribe&&(()=>{g.unsubscribe()});let C;try{if(c&&df&&n!=="get"&&n!=="head"&&(C=await pf(u,r))!==0){let z=new Request(t,{method:"POST",body:r,duplex:"half"}),Q;if(y.isFormData(r)&&(Q=z.headers.get("content-type"))&&u.setContentType(Q),z.body){const[K,ae]=lo(C,Kn(co(c)));r=ao(z.body,fo,K,ae)}}y.isString(f)||(f=f?"include":"omit");const x="credentials"in Request.prototype;b=new Request(t,{...p,signal:g,method:n.toUpperCase(),headers:u.normalize().toJSON(),body:r,duplex:"half",credentials:x?f:void 0});let E=await fetch(b);const M=Wr&&(a==="stream"||a==="response");if(Wr&&(l||M&&S)){const z={};["status","statusText","headers"].forEach(de=>{z[de]=E[de]});const Q=y.toFiniteNumber(E.headers.get("content-length")),[K,ae]=l&&lo(Q,Kn(co(l),!0))||[];E=new Response(ao(E.body,fo,K,()=>{ae&&ae(),S&&S()}),z)}a=a||"text";let L=await Wn[y.findKey(Wn,a)||"text"](E,e);return!M&&S&&S(),await new Promise((z,Q)=>{ll(z,Q,{data:L,headers:Te.from(E.headers),status:E.status,statusText:E.statusText,config:e,request:b})})}catch(x){throw S&&S(),x&&x.name==="TypeError"&&/Load failed|fetch/i.test(x.message)?Object.assign(new B("Network Error",B.ERR_NETWORK,e,b),{cause:x.cause||x}):B.from(x,x&&x.code,e,b)}}),Jr={http:Ta,xhr:of,fetch:mf};y.forEach(Jr,(e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch{}Object.defineProperty(e,"adapterName",{value:t})}});const ho=e=>`- ${e}`,gf=e=>y.isFunction(e)||e===null||e===!1,dl={getAdapter:e=>{e=y.isArray(e)?e:[e];const{length:t}=e;let n,r;const s={};for(let o=0;o<t;o++){n=e[o];let i;if(r=n,!gf(n)&&(r=Jr[(i=String(n)).toLowerCase()],r===void 0))throw new B(`Unknown adapter '${i}'`);if(r)break;s[i||"#"+o]=r}if(!r){const o=Object.entries(s).map(([l,c])=>`adapter ${l} `+(c===!1?"is not supported by the environment":"is not available in the build"));let i=t?o.length>1?`since :
 `+o.map(ho).join(`
 `):" "+ho(o[0]):"as no adapter specified";throw new B("There is no suitable adapter to dispatch the request "+i,"ERR_NOT_SUPPORT")}return r},adapters:Jr};function Or(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Gt(null,e)}function po(e){return Or(e),e.headers=Te.from(e.headers),e.data=Ar.call(e,e.transformRequest),["post","put","patch"].indexOf(e.method)!==-1&&e.headers.setContentType("application/x-www-form-urlencoded",!1),dl.getAdapter(e.adapter||xn.adapter)(e).then(function(r){return Or(e),r.data=Ar.call(e,e.transformResponse,r),r.headers=Te.from(r.headers),r},function(r){return il(r)||(Or(e),r&&r.response&&(r.response.data=Ar.call(e,e.transformResponse,r.response),r.response.headers=Te.from(r.response.headers))),Promise.reject(r)})}const hl="1.9.0",ar={};["object","boolean","number","function","string","symbol"].forEach((e,t)=>{ar[e]=function(r){return typeof r===e||"a"+(t<1?"n ":" ")+e}});const mo={};ar.transitional=function(t,n,r){function s(o,i){return"[Axios v"+hl+"] Transitional option '"+o+"'"+i+(r?". "+r:"")}return(o,i,l)=>{if(t===!1)throw new B(s(i," has been removed"+(n?" in "+n:"")),B.ERR_DEPRECATED);return n&&!mo[i]&&(mo[i]=!0,console.warn(s(i," has been deprecated since v"+n+" and will be removed in the near future"))),t?t(o,i,l):!0}};ar.spelling=function(t){return(n,r)=>(console.warn(`${r} is likely a misspelling of ${t}`),!0)};function yf(e,t,n){if(typeof e!="object")throw new B("options must be an object",B.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let s=r.length;for(;s-- >0;){const o=r[s],i=t[o];if(i){const l=e[o],c=l===void 0||i(l,o,e);if(c!==!0)throw new B("option "+o+" must be "+c,B.ERR_BAD_OPTION_VALUE);continue}if(n!==!0)throw new B("Unknown option "+o,B.ERR_BAD_OPTION)}}const jn={assertOptions:yf,validators:ar},Ge=jn.validators;let At=class{constructor(t){this.defaults=t||{},this.interceptors={request:new oo,response:new oo}}async request(t,n){try{return await this._request(t,n)}catch(r){if(r instanceof Error){let s={};Error.captureStackTrace?Error.captureStackTrace(s):s=new Error;const o=s.stack?s.stack.replace(/^.+\n/,""):"";try{r.stack?o&&!String(r.stack).endsWith(o.replace(/^.+\n.+\n/,""))&&(r.stack+=`
-`+o):r.stack=o}catch{}}throw r}}_request(t,n){typeof t=="string"?(n=n||{},n.url=t):n=t||{},n=Tt(this.defaults,n);const{transitional:r,paramsSerializer:s,headers:o}=n;r!==void 0&&jn.assertOptions(r,{silentJSONParsing:Ge.transitional(Ge.boolean),forcedJSONParsing:Ge.transitional(Ge.boolean),clarifyTimeoutError:Ge.transitional(Ge.boolean)},!1),s!=null&&(y.isFunction(s)?n.paramsSerializer={serialize:s}:jn.assertOptions(s,{encode:Ge.function,serialize:Ge.function},!0)),n.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?n.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:n.allowAbsoluteUrls=!0),jn.assertOptions(n,{baseUrl:Ge.spelling("baseURL"),withXsrfToken:Ge.spelling("withXSRFToken")},!0),n.method=(n.method||this.defaults.method||"get").toLowerCase();let i=o&&y.merge(o.common,o[n.method]);o&&y.forEach(["delete","get","head","post","put","patch","common"],b=>{delete o[b]}),n.headers=Te.concat(i,o);const l=[];let c=!0;this.interceptors.request.forEach(function(S){typeof S.runWhen=="function"&&S.runWhen(n)===!1||(c=c&&S.synchronous,l.unshift(S.fulfilled,S.rejected))});const a=[];this.interceptors.response.forEach(function(S){a.push(S.fulfilled,S.rejected)});let u,f=0,p;if(!c){const b=[po.bind(this),void 0];for(b.unshift.apply(b,l),b.push.apply(b,a),p=b.length,u=Promise.resolve(n);f<p;)u=u.then(b[f++],b[f++]);return u}p=l.length;let g=n;for(f=0;f<p;){const b=l[f++],S=l[f++];try{g=b(g)}catch(C){S.call(this,C);break}}try{u=po.call(this,g)}catch(b){return Promise.reject(b)}for(f=0,p=a.length;f<p;)u=u.then(a[f++],a[f++]);return u}getUri(t){t=Tt(this.defaults,t);const n=cl(t.baseURL,t.url,t.allowAbsoluteUrls);return rl(n,t.params,t.paramsSerializer)}};y.forEach(["delete","get","head","options"],function(t){At.prototype[t]=function(n,r){return this.request(Tt(r||{},{method:t,url:n,data:(r||{}).data}))}});y.forEach(["post","put","patch"],function(t){function n(r){return function(o,i,l){return this.request(Tt(l||{},{method:t,headers:r?{"Content-Type":"multipart/form-data"}:{},url:o,data:i}))}}At.prototype[t]=n(),At.prototype[t+"Form"]=n(!0)});let bf=class pl{constructor(t){if(typeof t!="function")throw new TypeError("executor must be a function.");let n;this.promise=new Promise(function(o){n=o});const r=this;this.promise.then(s=>{if(!r._listeners)return;let o=r._listeners.length;for(;o-- >0;)r._listeners[o](s);r._listeners=null}),this.promise.then=s=>{let o;const i=new Promise(l=>{r.subscribe(l),o=l}).then(s);return i.cancel=function(){r.unsubscribe(o)},i},t(function(o,i,l){r.reason||(r.reason=new Gt(o,i,l),n(r.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(t){if(this.reason){t(this.reason);return}this._listeners?this._listeners.push(t):this._listeners=[t]}unsubscribe(t){if(!this._listeners)return;const n=this._listeners.indexOf(t);n!==-1&&this._listeners.splice(n,1)}toAbortSignal(){const t=new AbortController,n=r=>{t.abort(r)};return this.subscribe(n),t.signal.unsubscribe=()=>this.unsubscribe(n),t.signal}static source(){let t;return{token:new pl(function(s){t=s}),cancel:t}}};function vf(e){return function(n){return e.apply(null,n)}}function wf(e){return y.isObject(e)&&e.isAxiosError===!0}const Gr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Gr).forEach(([e,t])=>{Gr[t]=e});function ml(e){const t=new At(e),n=qi(At.prototype.request,t);return y.extend(n,At.prototype,t,{allOwnKeys:!0}),y.extend(n,t,null,{allOwnKeys:!0}),n.create=function(s){return ml(Tt(e,s))},n}const re=ml(xn);re.Axios=At;re.CanceledError=Gt;re.CancelToken=bf;re.isCancel=il;re.VERSION=hl;re.toFormData=cr;re.AxiosError=B;re.Cancel=re.CanceledError;re.all=function(t){return Promise.all(t)};re.spread=vf;re.isAxiosError=wf;re.mergeConfig=Tt;re.AxiosHeaders=Te;re.formToJSON=e=>ol(y.isHTMLForm(e)?new FormData(e):e);re.getAdapter=dl.getAdapter;re.HttpStatusCode=Gr;re.default=re;const{Axios:yh,AxiosError:bh,CanceledError:vh,isCancel:wh,CancelToken:_h,VERSION:Eh,all:Sh,Cancel:Rh,isAxiosError:xh,spread:Ch,toFormData:Ah,AxiosHeaders:Oh,HttpStatusCode:Th,formToJSON:Ph,getAdapter:Mh,mergeConfig:Nh}=re,Mt=(e,t)=>{const n=e.__vccOpts||e;for(const[r,s]of t)n[r]=s;return n},_f={class:"dashboard"},Ef={class:"section"},Sf={class:"section"},Rf={key:0,class:"error"},xf={key:1},Cf={class:"status-block"},Af={key:0,class:"busy-indicator"},Of={key:1,class:"idle-indicator"},Tf={class:"camera-block"},Pf=["disabled"],Mf={key:0,class:"error"},Nf=["src"],St="http://localhost:8000",Ff={__name:"FarmbotDashboard",setup(e){const t=De(""),n=De(""),r=De({}),s=De(""),o=De(!1),i=De(""),l=De(null),c=De(null),a=De(null);async function u(){n.value="";const x={};if(typeof l.value=="number"&&!isNaN(l.value)&&(x.x=l.value),typeof c.value=="number"&&!isNaN(c.value)&&(x.y=c.value),typeof a.value=="number"&&!isNaN(a.value)&&(x.z=a.value),Object.keys(x).length===0){n.value="❌ Aucune valeur valide à envoyer.";return}const E=await re.post(`${St}/move`,null,{params:x});E.data.status==="error"?n.value=E.data.message:t.value=E.data,console.log(E.data)}async function f(){const x=await re.get(`${St}/status`);t.value=x.data}async function p(){const x=await re.post(`${St}/toast`,null,{params:{message:"Bonjour FarmBot!"}});t.value=x.data}async function g(){n.value="";try{const x=await re.post(`${St}/go_home`);t.value=x.data}catch{n.value="❌ Échec de l’envoi de la commande go_home."}}async function b(){const x=await re.post(`${St}/lock`);t.value=x.data}async function S(){try{const x=await re.get(`${St}/live_status`);r.value=x.data}catch(x){console.error("Erreur de récupération du statut :",x)}}async function C(){o.value=!0,s.value="",i.value="";try{const x=await re.post(`${St}/take_photo`);x.data.url?s.value=x.data.url:i.value=x.data.error||"Aucune URL reçue."}catch(x){i.value="Erreur lors de la prise de photo.",console.error(x)}finally{o.value=!1}}return vi(()=>{S(),setInterval(S,2e3)}),(x,E)=>{var M,L,z,Q,K,ae;return ce(),we("div",_f,[E[12]||(E[12]=D("h1",null,"FarmBot Kiosk",-1)),D("div",Ef,[D("button",{onClick:g},"🏠 Aller à l'origine"),D("button",{onClick:f},"📡 Statut"),D("button",{onClick:p},"📢 Toast"),D("div",Sf,[D("label",null,[E[3]||(E[3]=q(" X: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[0]||(E[0]=de=>l.value=de),placeholder:"Entrer X > 770"},null,512),[[xr,l.value,void 0,{number:!0}]])]),D("label",null,[E[4]||(E[4]=q(" Y: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[1]||(E[1]=de=>c.value=de),placeholder:"Entrer Y"},null,512),[[xr,c.value,void 0,{number:!0}]])]),D("label",null,[E[5]||(E[5]=q(" Z: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[2]||(E[2]=de=>a.value=de),placeholder:"Entrer Z"},null,512),[[xr,a.value,void 0,{number:!0}]])]),D("button",{onClick:u},"📍 Déplacer")]),D("button",{onClick:b},"🛑 Arrêt d'urgence")]),n.value?(ce(),we("p",Rf,Ce(n.value),1)):Pn("",!0),n.value?Pn("",!0):(ce(),we("pre",xf,Ce(t.value),1)),D("pre",null,Ce(t.value),1),D("div",Cf,[E[10]||(E[10]=D("h3",null,"🛰 Statut du FarmBot",-1)),r.value.busy?(ce(),we("div",Af," 🔄 En mouvement... ")):(ce(),we("div",Of," ✅ Prêt ")),D("p",null,[E[6]||(E[6]=D("strong",null,"Busy:",-1)),q(" "+Ce(r.value.busy),1)]),D("p",null,[E[7]||(E[7]=D("strong",null,"Position:",-1)),q(" X="+Ce((M=r.value.position)==null?void 0:M.x)+" Y="+Ce((L=r.value.position)==null?void 0:L.y)+" Z="+Ce((z=r.value.position)==null?void 0:z.z),1)]),D("p",null,[E[8]||(E[8]=D("strong",null,"Axes:",-1)),q(" X="+Ce((Q=r.value.axis_states)==null?void 0:Q.x)+" Y="+Ce((K=r.value.axis_states)==null?void 0:K.y)+" Z="+Ce((ae=r.value.axis_states)==null?void 0:ae.z),1)]),D("p",null,[E[9]||(E[9]=D("strong",null,"Sync:",-1)),q(" "+Ce(r.value.sync_status),1)])]),D("div",Tf,[E[11]||(E[11]=D("h3",null,"📷 Caméra",-1)),D("button",{onClick:C,disabled:o.value},Ce(o.value?"Capture en cours...":"📸 Prendre une photo"),9,Pf),i.value?(ce(),we("div",Mf,Ce(i.value),1)):Pn("",!0),s.value?(ce(),we("img",{key:1,src:s.value,alt:"Photo FarmBot",class:"camera-image"},null,8,Nf)):Pn("",!0)])])}}},Lf=Mt(Ff,[["__scopeId","data-v-c21a89d5"]]),If={__name:"App",setup(e){return(t,n)=>(ce(),Vn(Lf))}},Df="modulepreload",kf=function(e){return"/"+e},go={},jf=function(t,n,r){let s=Promise.resolve();if(n&&n.length>0){let i=function(a){return Promise.all(a.map(u=>Promise.resolve(u).then(f=>({status:"fulfilled",value:f}),f=>({status:"rejected",reason:f}))))};document.getElementsByTagName("link");const l=document.querySelector("meta[property=csp-nonce]"),c=(l==null?void 0:l.nonce)||(l==null?void 0:l.getAttribute("nonce"));s=i(n.map(a=>{if(a=kf(a),a in go)return;go[a]=!0;const u=a.endsWith(".css"),f=u?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${a}"]${f}`))return;const p=document.createElement("link");if(p.rel=u?"stylesheet":Df,u||(p.as="script"),p.crossOrigin="",p.href=a,c&&p.setAttribute("nonce",c),document.head.appendChild(p),u)return new Promise((g,b)=>{p.addEventListener("load",g),p.addEventListener("error",()=>b(new Error(`Unable to preload CSS for ${a}`)))})}))}function o(i){const l=new Event("vite:preloadError",{cancelable:!0});if(l.payload=i,window.dispatchEvent(l),!l.defaultPrevented)throw i}return s.then(i=>{for(const l of i||[])l.status==="rejected"&&o(l.reason);return t().catch(o)})};/*!
+`+o):r.stack=o}catch{}}throw r}}_request(t,n){typeof t=="string"?(n=n||{},n.url=t):n=t||{},n=Tt(this.defaults,n);const{transitional:r,paramsSerializer:s,headers:o}=n;r!==void 0&&jn.assertOptions(r,{silentJSONParsing:Ge.transitional(Ge.boolean),forcedJSONParsing:Ge.transitional(Ge.boolean),clarifyTimeoutError:Ge.transitional(Ge.boolean)},!1),s!=null&&(y.isFunction(s)?n.paramsSerializer={serialize:s}:jn.assertOptions(s,{encode:Ge.function,serialize:Ge.function},!0)),n.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?n.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:n.allowAbsoluteUrls=!0),jn.assertOptions(n,{baseUrl:Ge.spelling("baseURL"),withXsrfToken:Ge.spelling("withXSRFToken")},!0),n.method=(n.method||this.defaults.method||"get").toLowerCase();let i=o&&y.merge(o.common,o[n.method]);o&&y.forEach(["delete","get","head","post","put","patch","common"],b=>{delete o[b]}),n.headers=Te.concat(i,o);const l=[];let c=!0;this.interceptors.request.forEach(function(S){typeof S.runWhen=="function"&&S.runWhen(n)===!1||(c=c&&S.synchronous,l.unshift(S.fulfilled,S.rejected))});const a=[];this.interceptors.response.forEach(function(S){a.push(S.fulfilled,S.rejected)});let u,f=0,p;if(!c){const b=[po.bind(this),void 0];for(b.unshift.apply(b,l),b.push.apply(b,a),p=b.length,u=Promise.resolve(n);f<p;)u=u.then(b[f++],b[f++]);return u}p=l.length;let g=n;for(f=0;f<p;){const b=l[f++],S=l[f++];try{g=b(g)}catch(C){S.call(this,C);break}}try{u=po.call(this,g)}catch(b){return Promise.reject(b)}for(f=0,p=a.length;f<p;)u=u.then(a[f++],a[f++]);return u}getUri(t){t=Tt(this.defaults,t);const n=cl(t.baseURL,t.url,t.allowAbsoluteUrls);return rl(n,t.params,t.paramsSerializer)}};y.forEach(["delete","get","head","options"],function(t){At.prototype[t]=function(n,r){return this.request(Tt(r||{},{method:t,url:n,data:(r||{}).data}))}});y.forEach(["post","put","patch"],function(t){function n(r){return function(o,i,l){return this.request(Tt(l||{},{method:t,headers:r?{"Content-Type":"multipart/form-data"}:{},url:o,data:i}))}}At.prototype[t]=n(),At.prototype[t+"Form"]=n(!0)});let bf=class pl{constructor(t){if(typeof t!="function")throw new TypeError("executor must be a function.");let n;this.promise=new Promise(function(o){n=o});const r=this;this.promise.then(s=>{if(!r._listeners)return;let o=r._listeners.length;for(;o-- >0;)r._listeners[o](s);r._listeners=null}),this.promise.then=s=>{let o;const i=new Promise(l=>{r.subscribe(l),o=l}).then(s);return i.cancel=function(){r.unsubscribe(o)},i},t(function(o,i,l){r.reason||(r.reason=new Gt(o,i,l),n(r.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(t){if(this.reason){t(this.reason);return}this._listeners?this._listeners.push(t):this._listeners=[t]}unsubscribe(t){if(!this._listeners)return;const n=this._listeners.indexOf(t);n!==-1&&this._listeners.splice(n,1)}toAbortSignal(){const t=new AbortController,n=r=>{t.abort(r)};return this.subscribe(n),t.signal.unsubscribe=()=>this.unsubscribe(n),t.signal}static source(){let t;return{token:new pl(function(s){t=s}),cancel:t}}};function vf(e){return function(n){return e.apply(null,n)}}function wf(e){return y.isObject(e)&&e.isAxiosError===!0}const Gr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Gr).forEach(([e,t])=>{Gr[t]=e});function ml(e){const t=new At(e),n=qi(At.prototype.request,t);return y.extend(n,At.prototype,t,{allOwnKeys:!0}),y.extend(n,t,null,{allOwnKeys:!0}),n.create=function(s){return ml(Tt(e,s))},n}const re=ml(xn);re.Axios=At;re.CanceledError=Gt;re.CancelToken=bf;re.isCancel=il;re.VERSION=hl;re.toFormData=cr;re.AxiosError=B;re.Cancel=re.CanceledError;re.all=function(t){return Promise.all(t)};re.spread=vf;re.isAxiosError=wf;re.mergeConfig=Tt;re.AxiosHeaders=Te;re.formToJSON=e=>ol(y.isHTMLForm(e)?new FormData(e):e);re.getAdapter=dl.getAdapter;re.HttpStatusCode=Gr;re.default=re;const{Axios:yh,AxiosError:bh,CanceledError:vh,isCancel:wh,CancelToken:_h,VERSION:Eh,all:Sh,Cancel:Rh,isAxiosError:xh,spread:Ch,toFormData:Ah,AxiosHeaders:Oh,HttpStatusCode:Th,formToJSON:Ph,getAdapter:Mh,mergeConfig:Nh}=re,Mt=(e,t)=>{const n=e.__vccOpts||e;for(const[r,s]of t)n[r]=s;return n},_f={class:"dashboard"},Ef={class:"section"},Sf={class:"section"},Rf={key:0,class:"error"},xf={key:1},Cf={class:"status-block"},Af={key:0,class:"busy-indicator"},Of={key:1,class:"idle-indicator"},Tf={class:"camera-block"},Pf=["disabled"],Mf={key:0,class:"error"},Nf=["src"],St="http://localhost:8000",Ff={__name:"FarmbotDashboard",setup(e){const t=De(""),n=De(""),r=De({}),s=De(""),o=De(!1),i=De(""),l=De(null),c=De(null),a=De(null);async function u(){n.value="";const x={};if(typeof l.value=="number"&&!isNaN(l.value)&&(x.x=l.value),typeof c.value=="number"&&!isNaN(c.value)&&(x.y=c.value),typeof a.value=="number"&&!isNaN(a.value)&&(x.z=a.value),Object.keys(x).length===0){n.value="❌ Aucune valeur valide à envoyer.";return}const E=await re.post(`${St}/move`,null,{params:x});E.data.status==="error"?n.value=E.data.message:t.value=E.data,console.log(E.data)}async function f(){const x=await re.get(`${St}/status`);t.value=x.data}async function p(){const x=await re.post(`${St}/toast`,null,{params:{message:"Bonjour FarmBot!"}});t.value=x.data}async function g(){n.value="";try{const x=await re.post(`${St}/go_home`);t.value=x.data}catch{n.value="❌ Échec de l’envoi de la commande go_home."}}async function b(){const x=await re.post(`${St}/lock`);t.value=x.data}async function S(){try{const x=await re.get(`${St}/live_status`);r.value=x.data}catch(x){console.error("Erreur de récupération du statut :",x)}}async function C(){o.value=!0,s.value="",i.value="";try{const x=await re.post(`${St}/take_photo`);x.data.url?s.value=x.data.url.startsWith("/")?`${St}${x.data.url}`:x.data.url:i.value=x.data.error||"Aucune URL reçue."}catch(x){i.value="Erreur lors de la prise de photo.",console.error(x)}finally{o.value=!1}}return vi(()=>{S(),(()=>{if(!window.EventSource){setInterval(S,2e3);return}const x=new EventSource(`${St}/live_status/stream`);x.addEventListener("snapshot",E=>{r.value=JSON.parse(E.data)}),x.addEventListener("delta",E=>{r.value={...r.value,...JSON.parse(E.data)}}),x.onerror=()=>{S()}})()}),(x,E)=>{var M,L,z,Q,K,ae;return ce(),we("div",_f,[E[12]||(E[12]=D("h1",null,"FarmBot Kiosk",-1)),D("div",Ef,[D("button",{onClick:g},"🏠 Aller à l'origine"),D("button",{onClick:f},"📡 Statut"),D("button",{onClick:p},"📢 Toast"),D("div",Sf,[D("label",null,[E[3]||(E[3]=q(" X: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[0]||(E[0]=de=>l.value=de),placeholder:"Entrer X > 770"},null,512),[[xr,l.value,void 0,{number:!0}]])]),D("label",null,[E[4]||(E[4]=q(" Y: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[1]||(E[1]=de=>c.value=de),placeholder:"Entrer Y"},null,512),[[xr,c.value,void 0,{number:!0}]])]),D("label",null,[E[5]||(E[5]=q(" Z: ")),yr(D("input",{type:"number","onUpdate:modelValue":E[2]||(E[2]=de=>a.value=de),placeholder:"Entrer Z"},null,512),[[xr,a.value,void 0,{number:!0}]])]),D("button",{onClick:u},"📍 Déplacer")]),D("button",{onClick:b},"🛑 Arrêt d'urgence")]),n.value?(ce(),we("p",Rf,Ce(n.value),1)):Pn("",!0),n.value?Pn("",!0):(ce(),we("pre",xf,Ce(t.value),1)),D("pre",null,Ce(t.value),1),D("div",Cf,[E[10]||(E[10]=D("h3",null,"🛰 Statut du FarmBot",-1)),r.value.busy?(ce(),we("div",Af," 🔄 En mouvement... ")):(ce(),we("div",Of," ✅ Prêt ")),D("p",null,[E[6]||(E[6]=D("strong",null,"Busy:",-1)),q(" "+Ce(r.value.busy),1)]),D("p",null,[E[7]||(E[7]=D("strong",null,"Position:",-1)),q(" X="+Ce((M=r.value.position)==null?void 0:M.x)+" Y="+Ce((L=r.value.position)==null?void 0:L.y)+" Z="+Ce((z=r.value.position)==null?void 0:z.z),1)]),D("p",null,[E[8]||(E[8]=D("strong",null,"Axes:",-1)),q(" X="+Ce((Q=r.value.axis_states)==null?void 0:Q.x)+" Y="+Ce((K=r.value.axis_states)==null?void 0:K.y)+" Z="+Ce((ae=r.value.axis_states)==null?void 0:ae.z),1)]),D("p",null,[E[9]||(E[9]=D("strong",null,"Sync:",-1)),q(" "+Ce(r.value.sync_status),1)])]),D("div",Tf,[E[11]||(E[11]=D("h3",null,"📷 Caméra",-1)),D("button",{onClick:C,disabled:o.value},Ce(o.value?"Capture en cours...":"📸 Prendre une photo"),9,Pf),i.value?(ce(),we("div",Mf,Ce(i.value),1)):Pn("",!0),s.value?(ce(),we("img",{key:1,src:s.value,alt:"Photo FarmBot",class:"camera-image"},null,8,Nf)):Pn("",!0)])])}}},Lf=Mt(Ff,[["__scopeId","data-v-c21a89d5"]]),If={__name:"App",setup(e){return(t,n)=>(ce(),Vn(Lf))}},Df="modulepreload",kf=function(e){return"/"+e},go={},jf=function(t,n,r){let s=Promise.resolve();if(n&&n.length>0){let i=function(a){return Promise.all(a.map(u=>Promise.resolve(u).then(f=>({status:"fulfilled",value:f}),f=>({status:"rejected",reason:f}))))};document.getElementsByTagName("link");const l=document.querySelector("meta[property=csp-nonce]"),c=(l==null?void 0:l.nonce)||(l==null?void 0:l.getAttribute("nonce"));s=i(n.map(a=>{if(a=kf(a),a in go)return;go[a]=!0;const u=a.endsWith(".css"),f=u?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${a}"]${f}`))return;const p=document.createElement("link");if(p.rel=u?"stylesheet":Df,u||(p.as="script"),p.crossOrigin="",p.href=a,c&&p.setAttribute("nonce",c),document.head.appendChild(p),u)return new Promise((g,b)=>{p.addEventListener("load",g),p.addEventListener("error",()=>b(new Error(`Unable to preload CSS for ${a}`)))})}))}function o(i){const l=new Event("vite:preloadError",{cancelable:!0});if(l.payload=i,window.dispatchEvent(l),!l.defaultPrevented)throw i}return s.then(i=>{for(const l of i||[])l.status==="rejected"&&o(l.reason);return t().catch(o)})};/*!
   * vue-router v4.5.1
   * (c) 2025 Eduardo San Martin Morote
   * @license MIT
-  */const jt=typeof document<"u";function gl(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function $f(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&gl(e.default)}const G=Object.assign;function Tr(e,t){const n={};for(const r in t){const s=t[r];n[r]=ze(s)?s.map(e):e(s)}return n}const fn=()=>{},ze=Array.isArray,yl=/#/g,zf=/&/g,Hf=/\//g,Uf=/=/g,Bf=/\?/g,bl=/\+/g,Vf=/%5B/g,qf=/%5D/g,vl=/%5E/g,Kf=/%60/g,wl=/%7B/g,Wf=/%7C/g,_l=/%7D/g,Jf=/%20/g;function _s(e){return encodeURI(""+e).replace(Wf,"|").replace(Vf,"[").replace(qf,"]")}function Gf(e){return _s(e).replace(wl,"{").replace(_l,"}").replace(vl,"^")}function Xr(e){return _s(e).replace(bl,"%2B").replace(Jf,"+").replace(yl,"%23").replace(zf,"%26").replace(Kf,"`").replace(wl,"{").replace(_l,"}").replace(vl,"^")}function Xf(e){return Xr(e).replace(Uf,"%3D")}function Yf(e){return _s(e).replace(yl,"%23").replace(Bf,"%3F")}function Qf(e){return e==null?"":Yf(e).replace(Hf,"%2F")}function wn(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Zf=/\/$/,ed=e=>e.replace(Zf,"");function Pr(e,t,n="/"){let r,s={},o="",i="";const l=t.indexOf("#");let c=t.indexOf("?");return l<c&&l>=0&&(c=-1),c>-1&&(r=t.slice(0,c),o=t.slice(c+1,l>-1?l:t.length),s=e(o)),l>-1&&(r=r||t.slice(0,l),i=t.slice(l,t.length)),r=sd(r??t,n),{fullPath:r+(o&&"?")+o+i,path:r,query:s,hash:wn(i)}}function td(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function yo(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function nd(e,t,n){const r=t.matched.length-1,s=n.matched.length-1;return r>-1&&r===s&&Kt(t.matched[r],n.matched[s])&&El(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Kt(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function El(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!rd(e[n],t[n]))return!1;return!0}function rd(e,t){return ze(e)?bo(e,t):ze(t)?bo(t,e):e===t}function bo(e,t){return ze(t)?e.length===t.length&&e.every((n,r)=>n===t[r]):e.length===1&&e[0]===t}function sd(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),r=e.split("/"),s=r[r.length-1];(s===".."||s===".")&&r.push("");let o=n.length-1,i,l;for(i=0;i<r.length;i++)if(l=r[i],l!==".")if(l==="..")o>1&&o--;else break;return n.slice(0,o).join("/")+"/"+r.slice(i).join("/")}const pt={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var _n;(function(e){e.pop="pop",e.push="push"})(_n||(_n={}));var dn;(function(e){e.back="back",e.forward="forward",e.unknown=""})(dn||(dn={}));function od(e){if(!e)if(jt){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),ed(e)}const id=/^[^#]+#/;function ld(e,t){return e.replace(id,"#")+t}function cd(e,t){const n=document.documentElement.getBoundingClientRect(),r=e.getBoundingClientRect();return{behavior:t.behavior,left:r.left-n.left-(t.left||0),top:r.top-n.top-(t.top||0)}}const fr=()=>({left:window.scrollX,top:window.scrollY});function ud(e){let t;if("el"in e){const n=e.el,r=typeof n=="string"&&n.startsWith("#"),s=typeof n=="string"?r?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!s)return;t=cd(s,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function vo(e,t){return(history.state?history.state.position-t:-1)+e}const Yr=new Map;function ad(e,t){Yr.set(e,t)}function fd(e){const t=Yr.get(e);return Yr.delete(e),t}let dd=()=>location.protocol+"//"+location.host;function Sl(e,t){const{pathname:n,search:r,hash:s}=t,o=e.indexOf("#");if(o>-1){let l=s.includes(e.slice(o))?e.slice(o).length:1,c=s.slice(l);return c[0]!=="/"&&(c="/"+c),yo(c,"")}return yo(n,e)+r+s}function hd(e,t,n,r){let s=[],o=[],i=null;const l=({state:p})=>{const g=Sl(e,location),b=n.value,S=t.value;let C=0;if(p){if(n.value=g,t.value=p,i&&i===b){i=null;return}C=S?p.position-S.position:0}else r(g);s.forEach(x=>{x(n.value,b,{delta:C,type:_n.pop,direction:C?C>0?dn.forward:dn.back:dn.unknown})})};function c(){i=n.value}function a(p){s.push(p);const g=()=>{const b=s.indexOf(p);b>-1&&s.splice(b,1)};return o.push(g),g}function u(){const{history:p}=window;p.state&&p.replaceState(G({},p.state,{scroll:fr()}),"")}function f(){for(const p of o)p();o=[],window.removeEventListener("popstate",l),window.removeEventListener("beforeunload",u)}return window.addEventListener("popstate",l),window.addEventListener("beforeunload",u,{passive:!0}),{pauseListeners:c,listen:a,destroy:f}}function wo(e,t,n,r=!1,s=!1){return{back:e,current:t,forward:n,replaced:r,position:window.history.length,scroll:s?fr():null}}function pd(e){const{history:t,location:n}=window,r={value:Sl(e,n)},s={value:t.state};s.value||o(r.value,{back:null,current:r.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function o(c,a,u){const f=e.indexOf("#"),p=f>-1?(n.host&&document.querySelector("base")?e:e.slice(f))+c:dd()+e+c;try{t[u?"replaceState":"pushState"](a,"",p),s.value=a}catch(g){console.error(g),n[u?"replace":"assign"](p)}}function i(c,a){const u=G({},t.state,wo(s.value.back,c,s.value.forward,!0),a,{position:s.value.position});o(c,u,!0),r.value=c}function l(c,a){const u=G({},s.value,t.state,{forward:c,scroll:fr()});o(u.current,u,!0);const f=G({},wo(r.value,c,null),{position:u.position+1},a);o(c,f,!1),r.value=c}return{location:r,state:s,push:l,replace:i}}function md(e){e=od(e);const t=pd(e),n=hd(e,t.state,t.location,t.replace);function r(o,i=!0){i||n.pauseListeners(),history.go(o)}const s=G({location:"",base:e,go:r,createHref:ld.bind(null,e)},t,n);return Object.defineProperty(s,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(s,"state",{enumerable:!0,get:()=>t.state.value}),s}function gd(e){return typeof e=="string"||e&&typeof e=="object"}function Rl(e){return typeof e=="string"||typeof e=="symbol"}const xl=Symbol("");var _o;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(_o||(_o={}));function Wt(e,t){return G(new Error,{type:e,[xl]:!0},t)}function nt(e,t){return e instanceof Error&&xl in e&&(t==null||!!(e.type&t))}const Eo="[^/]+?",yd={sensitive:!1,strict:!1,start:!0,end:!0},bd=/[.+*?^${}()[\]/\\]/g;function vd(e,t){const n=G({},yd,t),r=[];let s=n.start?"^":"";const o=[];for(const a of e){const u=a.length?[]:[90];n.strict&&!a.length&&(s+="/");for(let f=0;f<a.length;f++){const p=a[f];let g=40+(n.sensitive?.25:0);if(p.type===0)f||(s+="/"),s+=p.value.replace(bd,"\\$&"),g+=40;else if(p.type===1){const{value:b,repeatable:S,optional:C,regexp:x}=p;o.push({name:b,repeatable:S,optional:C});const E=x||Eo;if(E!==Eo){g+=10;try{new RegExp(`(${E})`)}catch(L){throw new Error(`Invalid custom RegExp for param "${b}" (${E}): `+L.message)}}let M=S?`((?:${E})(?:/(?:${E}))*)`:`(${E})`;f||(M=C&&a.length<2?`(?:/${M})`:"/"+M),C&&(M+="?"),s+=M,g+=20,C&&(g+=-8),S&&(g+=-20),E===".*"&&(g+=-50)}u.push(g)}r.push(u)}if(n.strict&&n.end){const a=r.length-1;r[a][r[a].length-1]+=.7000000000000001}n.strict||(s+="/?"),n.end?s+="$":n.strict&&!s.endsWith("/")&&(s+="(?:/|$)");const i=new RegExp(s,n.sensitive?"":"i");function l(a){const u=a.match(i),f={};if(!u)return null;for(let p=1;p<u.length;p++){const g=u[p]||"",b=o[p-1];f[b.name]=g&&b.repeatable?g.split("/"):g}return f}function c(a){let u="",f=!1;for(const p of e){(!f||!u.endsWith("/"))&&(u+="/"),f=!1;for(const g of p)if(g.type===0)u+=g.value;else if(g.type===1){const{value:b,repeatable:S,optional:C}=g,x=b in a?a[b]:"";if(ze(x)&&!S)throw new Error(`Provided param "${b}" is an array but it is not repeatable (* or + modifiers)`);const E=ze(x)?x.join("/"):x;if(!E)if(C)p.length<2&&(u.endsWith("/")?u=u.slice(0,-1):f=!0);else throw new Error(`Missing required param "${b}"`);u+=E}}return u||"/"}return{re:i,score:r,keys:o,parse:l,stringify:c}}function wd(e,t){let n=0;for(;n<e.length&&n<t.length;){const r=t[n]-e[n];if(r)return r;n++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function Cl(e,t){let n=0;const r=e.score,s=t.score;for(;n<r.length&&n<s.length;){const o=wd(r[n],s[n]);if(o)return o;n++}if(Math.abs(s.length-r.length)===1){if(So(r))return 1;if(So(s))return-1}return s.length-r.length}function So(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const _d={type:0,value:""},Ed=/[a-zA-Z0-9_]/;function Sd(e){if(!e)return[[]];if(e==="/")return[[_d]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(g){throw new Error(`ERR (${n})/"${a}": ${g}`)}let n=0,r=n;const s=[];let o;function i(){o&&s.push(o),o=[]}let l=0,c,a="",u="";function f(){a&&(n===0?o.push({type:0,value:a}):n===1||n===2||n===3?(o.length>1&&(c==="*"||c==="+")&&t(`A repeatable param (${a}) must be alone in its segment. eg: '/:ids+.`),o.push({type:1,value:a,regexp:u,repeatable:c==="*"||c==="+",optional:c==="*"||c==="?"})):t("Invalid state to consume buffer"),a="")}function p(){a+=c}for(;l<e.length;){if(c=e[l++],c==="\\"&&n!==2){r=n,n=4;continue}switch(n){case 0:c==="/"?(a&&f(),i()):c===":"?(f(),n=1):p();break;case 4:p(),n=r;break;case 1:c==="("?n=2:Ed.test(c)?p():(f(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--);break;case 2:c===")"?u[u.length-1]=="\\"?u=u.slice(0,-1)+c:n=3:u+=c;break;case 3:f(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--,u="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${a}"`),f(),i(),s}function Rd(e,t,n){const r=vd(Sd(e.path),n),s=G(r,{record:e,parent:t,children:[],alias:[]});return t&&!s.record.aliasOf==!t.record.aliasOf&&t.children.push(s),s}function xd(e,t){const n=[],r=new Map;t=Ao({strict:!1,end:!0,sensitive:!1},t);function s(f){return r.get(f)}function o(f,p,g){const b=!g,S=xo(f);S.aliasOf=g&&g.record;const C=Ao(t,f),x=[S];if("alias"in f){const L=typeof f.alias=="string"?[f.alias]:f.alias;for(const z of L)x.push(xo(G({},S,{components:g?g.record.components:S.components,path:z,aliasOf:g?g.record:S})))}let E,M;for(const L of x){const{path:z}=L;if(p&&z[0]!=="/"){const Q=p.record.path,K=Q[Q.length-1]==="/"?"":"/";L.path=p.record.path+(z&&K+z)}if(E=Rd(L,p,C),g?g.alias.push(E):(M=M||E,M!==E&&M.alias.push(E),b&&f.name&&!Co(E)&&i(f.name)),Al(E)&&c(E),S.children){const Q=S.children;for(let K=0;K<Q.length;K++)o(Q[K],E,g&&g.children[K])}g=g||E}return M?()=>{i(M)}:fn}function i(f){if(Rl(f)){const p=r.get(f);p&&(r.delete(f),n.splice(n.indexOf(p),1),p.children.forEach(i),p.alias.forEach(i))}else{const p=n.indexOf(f);p>-1&&(n.splice(p,1),f.record.name&&r.delete(f.record.name),f.children.forEach(i),f.alias.forEach(i))}}function l(){return n}function c(f){const p=Od(f,n);n.splice(p,0,f),f.record.name&&!Co(f)&&r.set(f.record.name,f)}function a(f,p){let g,b={},S,C;if("name"in f&&f.name){if(g=r.get(f.name),!g)throw Wt(1,{location:f});C=g.record.name,b=G(Ro(p.params,g.keys.filter(M=>!M.optional).concat(g.parent?g.parent.keys.filter(M=>M.optional):[]).map(M=>M.name)),f.params&&Ro(f.params,g.keys.map(M=>M.name))),S=g.stringify(b)}else if(f.path!=null)S=f.path,g=n.find(M=>M.re.test(S)),g&&(b=g.parse(S),C=g.record.name);else{if(g=p.name?r.get(p.name):n.find(M=>M.re.test(p.path)),!g)throw Wt(1,{location:f,currentLocation:p});C=g.record.name,b=G({},p.params,f.params),S=g.stringify(b)}const x=[];let E=g;for(;E;)x.unshift(E.record),E=E.parent;return{name:C,path:S,params:b,matched:x,meta:Ad(x)}}e.forEach(f=>o(f));function u(){n.length=0,r.clear()}return{addRoute:o,resolve:a,removeRoute:i,clearRoutes:u,getRoutes:l,getRecordMatcher:s}}function Ro(e,t){const n={};for(const r of t)r in e&&(n[r]=e[r]);return n}function xo(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Cd(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Cd(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const r in e.components)t[r]=typeof n=="object"?n[r]:n;return t}function Co(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Ad(e){return e.reduce((t,n)=>G(t,n.meta),{})}function Ao(e,t){const n={};for(const r in e)n[r]=r in t?t[r]:e[r];return n}function Od(e,t){let n=0,r=t.length;for(;n!==r;){const o=n+r>>1;Cl(e,t[o])<0?r=o:n=o+1}const s=Td(e);return s&&(r=t.lastIndexOf(s,r-1)),r}function Td(e){let t=e;for(;t=t.parent;)if(Al(t)&&Cl(e,t)===0)return t}function Al({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function Pd(e){const t={};if(e===""||e==="?")return t;const r=(e[0]==="?"?e.slice(1):e).split("&");for(let s=0;s<r.length;++s){const o=r[s].replace(bl," "),i=o.indexOf("="),l=wn(i<0?o:o.slice(0,i)),c=i<0?null:wn(o.slice(i+1));if(l in t){let a=t[l];ze(a)||(a=t[l]=[a]),a.push(c)}else t[l]=c}return t}function Oo(e){let t="";for(let n in e){const r=e[n];if(n=Xf(n),r==null){r!==void 0&&(t+=(t.length?"&":"")+n);continue}(ze(r)?r.map(o=>o&&Xr(o)):[r&&Xr(r)]).forEach(o=>{o!==void 0&&(t+=(t.length?"&":"")+n,o!=null&&(t+="="+o))})}return t}function Md(e){const t={};for(const n in e){const r=e[n];r!==void 0&&(t[n]=ze(r)?r.map(s=>s==null?null:""+s):r==null?r:""+r)}return t}const Nd=Symbol(""),To=Symbol(""),Es=Symbol(""),Ol=Symbol(""),Qr=Symbol("");function tn(){let e=[];function t(r){return e.push(r),()=>{const s=e.indexOf(r);s>-1&&e.splice(s,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function yt(e,t,n,r,s,o=i=>i()){const i=r&&(r.enterCallbacks[s]=r.enterCallbacks[s]||[]);return()=>new Promise((l,c)=>{const a=p=>{p===!1?c(Wt(4,{from:n,to:t})):p instanceof Error?c(p):gd(p)?c(Wt(2,{from:t,to:p})):(i&&r.enterCallbacks[s]===i&&typeof p=="function"&&i.push(p),l())},u=o(()=>e.call(r&&r.instances[s],t,n,a));let f=Promise.resolve(u);e.length<3&&(f=f.then(a)),f.catch(p=>c(p))})}function Mr(e,t,n,r,s=o=>o()){const o=[];for(const i of e)for(const l in i.components){let c=i.components[l];if(!(t!=="beforeRouteEnter"&&!i.instances[l]))if(gl(c)){const u=(c.__vccOpts||c)[t];u&&o.push(yt(u,n,r,i,l,s))}else{let a=c();o.push(()=>a.then(u=>{if(!u)throw new Error(`Couldn't resolve component "${l}" at "${i.path}"`);const f=$f(u)?u.default:u;i.mods[l]=u,i.components[l]=f;const g=(f.__vccOpts||f)[t];return g&&yt(g,n,r,i,l,s)()}))}}return o}function Po(e){const t=it(Es),n=it(Ol),r=ke(()=>{const c=Ht(e.to);return t.resolve(c)}),s=ke(()=>{const{matched:c}=r.value,{length:a}=c,u=c[a-1],f=n.matched;if(!u||!f.length)return-1;const p=f.findIndex(Kt.bind(null,u));if(p>-1)return p;const g=Mo(c[a-2]);return a>1&&Mo(u)===g&&f[f.length-1].path!==g?f.findIndex(Kt.bind(null,c[a-2])):p}),o=ke(()=>s.value>-1&&kd(n.params,r.value.params)),i=ke(()=>s.value>-1&&s.value===n.matched.length-1&&El(n.params,r.value.params));function l(c={}){if(Dd(c)){const a=t[Ht(e.replace)?"replace":"push"](Ht(e.to)).catch(fn);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>a),a}return Promise.resolve()}return{route:r,href:ke(()=>r.value.href),isActive:o,isExactActive:i,navigate:l}}function Fd(e){return e.length===1?e[0]:e}const Ld=mi({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:Po,setup(e,{slots:t}){const n=Qn(Po(e)),{options:r}=it(Es),s=ke(()=>({[No(e.activeClass,r.linkActiveClass,"router-link-active")]:n.isActive,[No(e.exactActiveClass,r.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const o=t.default&&Fd(t.default(n));return e.custom?o:Bi("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:s.value},o)}}}),Id=Ld;function Dd(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function kd(e,t){for(const n in t){const r=t[n],s=e[n];if(typeof r=="string"){if(r!==s)return!1}else if(!ze(s)||s.length!==r.length||r.some((o,i)=>o!==s[i]))return!1}return!0}function Mo(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const No=(e,t,n)=>e??t??n,jd=mi({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const r=it(Qr),s=ke(()=>e.route||r.value),o=it(To,0),i=ke(()=>{let a=Ht(o);const{matched:u}=s.value;let f;for(;(f=u[a])&&!f.components;)a++;return a}),l=ke(()=>s.value.matched[i.value]);Nn(To,ke(()=>i.value+1)),Nn(Nd,l),Nn(Qr,s);const c=De();return Fn(()=>[c.value,l.value,e.name],([a,u,f],[p,g,b])=>{u&&(u.instances[f]=a,g&&g!==u&&a&&a===p&&(u.leaveGuards.size||(u.leaveGuards=g.leaveGuards),u.updateGuards.size||(u.updateGuards=g.updateGuards))),a&&u&&(!g||!Kt(u,g)||!p)&&(u.enterCallbacks[f]||[]).forEach(S=>S(a))},{flush:"post"}),()=>{const a=s.value,u=e.name,f=l.value,p=f&&f.components[u];if(!p)return Fo(n.default,{Component:p,route:a});const g=f.props[u],b=g?g===!0?a.params:typeof g=="function"?g(a):g:null,C=Bi(p,G({},b,t,{onVnodeUnmounted:x=>{x.component.isUnmounted&&(f.instances[u]=null)},ref:c}));return Fo(n.default,{Component:C,route:a})||C}}});function Fo(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const $d=jd;function zd(e){const t=xd(e.routes,e),n=e.parseQuery||Pd,r=e.stringifyQuery||Oo,s=e.history,o=tn(),i=tn(),l=tn(),c=ic(pt);let a=pt;jt&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const u=Tr.bind(null,w=>""+w),f=Tr.bind(null,Qf),p=Tr.bind(null,wn);function g(w,I){let N,k;return Rl(w)?(N=t.getRecordMatcher(w),k=I):k=w,t.addRoute(k,N)}function b(w){const I=t.getRecordMatcher(w);I&&t.removeRoute(I)}function S(){return t.getRoutes().map(w=>w.record)}function C(w){return!!t.getRecordMatcher(w)}function x(w,I){if(I=G({},I||c.value),typeof w=="string"){const m=Pr(n,w,I.path),v=t.resolve({path:m.path},I),R=s.createHref(m.fullPath);return G(m,v,{params:p(v.params),hash:wn(m.hash),redirectedFrom:void 0,href:R})}let N;if(w.path!=null)N=G({},w,{path:Pr(n,w.path,I.path).path});else{const m=G({},w.params);for(const v in m)m[v]==null&&delete m[v];N=G({},w,{params:f(m)}),I.params=f(I.params)}const k=t.resolve(N,I),te=w.hash||"";k.params=u(p(k.params));const d=td(r,G({},w,{hash:Gf(te),path:k.path})),h=s.createHref(d);return G({fullPath:d,hash:te,query:r===Oo?Md(w.query):w.query||{}},k,{redirectedFrom:void 0,href:h})}function E(w){return typeof w=="string"?Pr(n,w,c.value.path):G({},w)}function M(w,I){if(a!==w)return Wt(8,{from:I,to:w})}function L(w){return K(w)}function z(w){return L(G(E(w),{replace:!0}))}function Q(w){const I=w.matched[w.matched.length-1];if(I&&I.redirect){const{redirect:N}=I;let k=typeof N=="function"?N(w):N;return typeof k=="string"&&(k=k.includes("?")||k.includes("#")?k=E(k):{path:k},k.params={}),G({query:w.query,hash:w.hash,params:k.path!=null?{}:w.params},k)}}function K(w,I){const N=a=x(w),k=c.value,te=w.state,d=w.force,h=w.replace===!0,m=Q(N);if(m)return K(G(E(m),{state:typeof m=="object"?G({},te,m.state):te,force:d,replace:h}),I||N);const v=N;v.redirectedFrom=I;let R;return!d&&nd(r,k,N)&&(R=Wt(16,{to:v,from:k}),Ve(k,k,!0,!1)),(R?Promise.resolve(R):Ue(v,k)).catch(_=>nt(_)?nt(_,2)?_:ht(_):J(_,v,k)).then(_=>{if(_){if(nt(_,2))return K(G({replace:h},E(_.to),{state:typeof _.to=="object"?G({},te,_.to.state):te,force:d}),I||v)}else _=wt(v,k,!0,h,te);return dt(v,k,_),_})}function ae(w,I){const N=M(w,I);return N?Promise.reject(N):Promise.resolve()}function de(w){const I=Lt.values().next().value;return I&&typeof I.runWithContext=="function"?I.runWithContext(w):w()}function Ue(w,I){let N;const[k,te,d]=Hd(w,I);N=Mr(k.reverse(),"beforeRouteLeave",w,I);for(const m of k)m.leaveGuards.forEach(v=>{N.push(yt(v,w,I))});const h=ae.bind(null,w,I);return N.push(h),Ie(N).then(()=>{N=[];for(const m of o.list())N.push(yt(m,w,I));return N.push(h),Ie(N)}).then(()=>{N=Mr(te,"beforeRouteUpdate",w,I);for(const m of te)m.updateGuards.forEach(v=>{N.push(yt(v,w,I))});return N.push(h),Ie(N)}).then(()=>{N=[];for(const m of d)if(m.beforeEnter)if(ze(m.beforeEnter))for(const v of m.beforeEnter)N.push(yt(v,w,I));else N.push(yt(m.beforeEnter,w,I));return N.push(h),Ie(N)}).then(()=>(w.matched.forEach(m=>m.enterCallbacks={}),N=Mr(d,"beforeRouteEnter",w,I,de),N.push(h),Ie(N))).then(()=>{N=[];for(const m of i.list())N.push(yt(m,w,I));return N.push(h),Ie(N)}).catch(m=>nt(m,8)?m:Promise.reject(m))}function dt(w,I,N){l.list().forEach(k=>de(()=>k(w,I,N)))}function wt(w,I,N,k,te){const d=M(w,I);if(d)return d;const h=I===pt,m=jt?history.state:{};N&&(k||h?s.replace(w.fullPath,G({scroll:h&&m&&m.scroll},te)):s.push(w.fullPath,te)),c.value=w,Ve(w,I,N,h),ht()}let Be;function Xt(){Be||(Be=s.listen((w,I,N)=>{if(!Cn.listening)return;const k=x(w),te=Q(k);if(te){K(G(te,{replace:!0,force:!0}),k).catch(fn);return}a=k;const d=c.value;jt&&ad(vo(d.fullPath,N.delta),fr()),Ue(k,d).catch(h=>nt(h,12)?h:nt(h,2)?(K(G(E(h.to),{force:!0}),k).then(m=>{nt(m,20)&&!N.delta&&N.type===_n.pop&&s.go(-1,!1)}).catch(fn),Promise.reject()):(N.delta&&s.go(-N.delta,!1),J(h,k,d))).then(h=>{h=h||wt(k,d,!1),h&&(N.delta&&!nt(h,8)?s.go(-N.delta,!1):N.type===_n.pop&&nt(h,20)&&s.go(-1,!1)),dt(k,d,h)}).catch(fn)}))}let Nt=tn(),fe=tn(),ee;function J(w,I,N){ht(w);const k=fe.list();return k.length?k.forEach(te=>te(w,I,N)):console.error(w),Promise.reject(w)}function et(){return ee&&c.value!==pt?Promise.resolve():new Promise((w,I)=>{Nt.add([w,I])})}function ht(w){return ee||(ee=!w,Xt(),Nt.list().forEach(([I,N])=>w?N(w):I()),Nt.reset()),w}function Ve(w,I,N,k){const{scrollBehavior:te}=e;if(!jt||!te)return Promise.resolve();const d=!N&&fd(vo(w.fullPath,0))||(k||!N)&&history.state&&history.state.scroll||null;return ai().then(()=>te(w,I,d)).then(h=>h&&ud(h)).catch(h=>J(h,w,I))}const Re=w=>s.go(w);let Ft;const Lt=new Set,Cn={currentRoute:c,listening:!0,addRoute:g,removeRoute:b,clearRoutes:t.clearRoutes,hasRoute:C,getRoutes:S,resolve:x,options:e,push:L,replace:z,go:Re,back:()=>Re(-1),forward:()=>Re(1),beforeEach:o.add,beforeResolve:i.add,afterEach:l.add,onError:fe.add,isReady:et,install(w){const I=this;w.component("RouterLink",Id),w.component("RouterView",$d),w.config.globalProperties.$router=I,Object.defineProperty(w.config.globalProperties,"$route",{enumerable:!0,get:()=>Ht(c)}),jt&&!Ft&&c.value===pt&&(Ft=!0,L(s.location).catch(te=>{}));const N={};for(const te in pt)Object.defineProperty(N,te,{get:()=>c.value[te],enumerable:!0});w.provide(Es,I),w.provide(Ol,si(N)),w.provide(Qr,c);const k=w.unmount;Lt.add(w),w.unmount=function(){Lt.delete(w),Lt.size<1&&(a=pt,Be&&Be(),Be=null,c.value=pt,Ft=!1,ee=!1),k()}}};function Ie(w){return w.reduce((I,N)=>I.then(()=>de(N)),Promise.resolve())}return Cn}function Hd(e,t){const n=[],r=[],s=[],o=Math.max(t.matched.length,e.matched.length);for(let i=0;i<o;i++){const l=t.matched[i];l&&(e.matched.find(a=>Kt(a,l))?r.push(l):n.push(l));const c=e.matched[i];c&&(t.matched.find(a=>Kt(a,c))||s.push(c))}return[n,r,s]}const Ud={},Bd={class:"item"},Vd={class:"details"};function qd(e,t){return ce(),we("div",Bd,[D("i",null,[br(e.$slots,"icon",{},void 0)]),D("div",Vd,[D("h3",null,[br(e.$slots,"heading",{},void 0)]),br(e.$slots,"default",{},void 0)])])}const nn=Mt(Ud,[["render",qd],["__scopeId","data-v-40a5c0e5"]]),Kd={},Wd={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"17",fill:"currentColor"};function Jd(e,t){return ce(),we("svg",Wd,t[0]||(t[0]=[D("path",{d:"M11 2.253a1 1 0 1 0-2 0h2zm-2 13a1 1 0 1 0 2 0H9zm.447-12.167a1 1 0 1 0 1.107-1.666L9.447 3.086zM1 2.253L.447 1.42A1 1 0 0 0 0 2.253h1zm0 13H0a1 1 0 0 0 1.553.833L1 15.253zm8.447.833a1 1 0 1 0 1.107-1.666l-1.107 1.666zm0-14.666a1 1 0 1 0 1.107 1.666L9.447 1.42zM19 2.253h1a1 1 0 0 0-.447-.833L19 2.253zm0 13l-.553.833A1 1 0 0 0 20 15.253h-1zm-9.553-.833a1 1 0 1 0 1.107 1.666L9.447 14.42zM9 2.253v13h2v-13H9zm1.553-.833C9.203.523 7.42 0 5.5 0v2c1.572 0 2.961.431 3.947 1.086l1.107-1.666zM5.5 0C3.58 0 1.797.523.447 1.42l1.107 1.666C2.539 2.431 3.928 2 5.5 2V0zM0 2.253v13h2v-13H0zm1.553 13.833C2.539 15.431 3.928 15 5.5 15v-2c-1.92 0-3.703.523-5.053 1.42l1.107 1.666zM5.5 15c1.572 0 2.961.431 3.947 1.086l1.107-1.666C9.203 13.523 7.42 13 5.5 13v2zm5.053-11.914C11.539 2.431 12.928 2 14.5 2V0c-1.92 0-3.703.523-5.053 1.42l1.107 1.666zM14.5 2c1.573 0 2.961.431 3.947 1.086l1.107-1.666C18.203.523 16.421 0 14.5 0v2zm3.5.253v13h2v-13h-2zm1.553 12.167C18.203 13.523 16.421 13 14.5 13v2c1.573 0 2.961.431 3.947 1.086l1.107-1.666zM14.5 13c-1.92 0-3.703.523-5.053 1.42l1.107 1.666C11.539 15.431 12.928 15 14.5 15v-2z"},null,-1)]))}const Gd=Mt(Kd,[["render",Jd]]),Xd={},Yd={xmlns:"http://www.w3.org/2000/svg","xmlns:xlink":"http://www.w3.org/1999/xlink","aria-hidden":"true",role:"img",class:"iconify iconify--mdi",width:"24",height:"24",preserveAspectRatio:"xMidYMid meet",viewBox:"0 0 24 24"};function Qd(e,t){return ce(),we("svg",Yd,t[0]||(t[0]=[D("path",{d:"M20 18v-4h-3v1h-2v-1H9v1H7v-1H4v4h16M6.33 8l-1.74 4H7v-1h2v1h6v-1h2v1h2.41l-1.74-4H6.33M9 5v1h6V5H9m12.84 7.61c.1.22.16.48.16.8V18c0 .53-.21 1-.6 1.41c-.4.4-.85.59-1.4.59H4c-.55 0-1-.19-1.4-.59C2.21 19 2 18.53 2 18v-4.59c0-.32.06-.58.16-.8L4.5 7.22C4.84 6.41 5.45 6 6.33 6H7V5c0-.55.18-1 .57-1.41C7.96 3.2 8.44 3 9 3h6c.56 0 1.04.2 1.43.59c.39.41.57.86.57 1.41v1h.67c.88 0 1.49.41 1.83 1.22l2.34 5.39z",fill:"currentColor"},null,-1)]))}const Zd=Mt(Xd,[["render",Qd]]),eh={},th={xmlns:"http://www.w3.org/2000/svg",width:"18",height:"20",fill:"currentColor"};function nh(e,t){return ce(),we("svg",th,t[0]||(t[0]=[D("path",{d:"M11.447 8.894a1 1 0 1 0-.894-1.789l.894 1.789zm-2.894-.789a1 1 0 1 0 .894 1.789l-.894-1.789zm0 1.789a1 1 0 1 0 .894-1.789l-.894 1.789zM7.447 7.106a1 1 0 1 0-.894 1.789l.894-1.789zM10 9a1 1 0 1 0-2 0h2zm-2 2.5a1 1 0 1 0 2 0H8zm9.447-5.606a1 1 0 1 0-.894-1.789l.894 1.789zm-2.894-.789a1 1 0 1 0 .894 1.789l-.894-1.789zm2 .789a1 1 0 1 0 .894-1.789l-.894 1.789zm-1.106-2.789a1 1 0 1 0-.894 1.789l.894-1.789zM18 5a1 1 0 1 0-2 0h2zm-2 2.5a1 1 0 1 0 2 0h-2zm-5.447-4.606a1 1 0 1 0 .894-1.789l-.894 1.789zM9 1l.447-.894a1 1 0 0 0-.894 0L9 1zm-2.447.106a1 1 0 1 0 .894 1.789l-.894-1.789zm-6 3a1 1 0 1 0 .894 1.789L.553 4.106zm2.894.789a1 1 0 1 0-.894-1.789l.894 1.789zm-2-.789a1 1 0 1 0-.894 1.789l.894-1.789zm1.106 2.789a1 1 0 1 0 .894-1.789l-.894 1.789zM2 5a1 1 0 1 0-2 0h2zM0 7.5a1 1 0 1 0 2 0H0zm8.553 12.394a1 1 0 1 0 .894-1.789l-.894 1.789zm-1.106-2.789a1 1 0 1 0-.894 1.789l.894-1.789zm1.106 1a1 1 0 1 0 .894 1.789l-.894-1.789zm2.894.789a1 1 0 1 0-.894-1.789l.894 1.789zM8 19a1 1 0 1 0 2 0H8zm2-2.5a1 1 0 1 0-2 0h2zm-7.447.394a1 1 0 1 0 .894-1.789l-.894 1.789zM1 15H0a1 1 0 0 0 .553.894L1 15zm1-2.5a1 1 0 1 0-2 0h2zm12.553 2.606a1 1 0 1 0 .894 1.789l-.894-1.789zM17 15l.447.894A1 1 0 0 0 18 15h-1zm1-2.5a1 1 0 1 0-2 0h2zm-7.447-5.394l-2 1 .894 1.789 2-1-.894-1.789zm-1.106 1l-2-1-.894 1.789 2 1 .894-1.789zM8 9v2.5h2V9H8zm8.553-4.894l-2 1 .894 1.789 2-1-.894-1.789zm.894 0l-2-1-.894 1.789 2 1 .894-1.789zM16 5v2.5h2V5h-2zm-4.553-3.894l-2-1-.894 1.789 2 1 .894-1.789zm-2.894-1l-2 1 .894 1.789 2-1L8.553.106zM1.447 5.894l2-1-.894-1.789-2 1 .894 1.789zm-.894 0l2 1 .894-1.789-2-1-.894 1.789zM0 5v2.5h2V5H0zm9.447 13.106l-2-1-.894 1.789 2 1 .894-1.789zm0 1.789l2-1-.894-1.789-2 1 .894 1.789zM10 19v-2.5H8V19h2zm-6.553-3.894l-2-1-.894 1.789 2 1 .894-1.789zM2 15v-2.5H0V15h2zm13.447 1.894l2-1-.894-1.789-2 1 .894 1.789zM18 15v-2.5h-2V15h2z"},null,-1)]))}const rh=Mt(eh,[["render",nh]]),sh={},oh={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"20",fill:"currentColor"};function ih(e,t){return ce(),we("svg",oh,t[0]||(t[0]=[D("path",{d:"M15 4a1 1 0 1 0 0 2V4zm0 11v-1a1 1 0 0 0-1 1h1zm0 4l-.707.707A1 1 0 0 0 16 19h-1zm-4-4l.707-.707A1 1 0 0 0 11 14v1zm-4.707-1.293a1 1 0 0 0-1.414 1.414l1.414-1.414zm-.707.707l-.707-.707.707.707zM9 11v-1a1 1 0 0 0-.707.293L9 11zm-4 0h1a1 1 0 0 0-1-1v1zm0 4H4a1 1 0 0 0 1.707.707L5 15zm10-9h2V4h-2v2zm2 0a1 1 0 0 1 1 1h2a3 3 0 0 0-3-3v2zm1 1v6h2V7h-2zm0 6a1 1 0 0 1-1 1v2a3 3 0 0 0 3-3h-2zm-1 1h-2v2h2v-2zm-3 1v4h2v-4h-2zm1.707 3.293l-4-4-1.414 1.414 4 4 1.414-1.414zM11 14H7v2h4v-2zm-4 0c-.276 0-.525-.111-.707-.293l-1.414 1.414C5.42 15.663 6.172 16 7 16v-2zm-.707 1.121l3.414-3.414-1.414-1.414-3.414 3.414 1.414 1.414zM9 12h4v-2H9v2zm4 0a3 3 0 0 0 3-3h-2a1 1 0 0 1-1 1v2zm3-3V3h-2v6h2zm0-6a3 3 0 0 0-3-3v2a1 1 0 0 1 1 1h2zm-3-3H3v2h10V0zM3 0a3 3 0 0 0-3 3h2a1 1 0 0 1 1-1V0zM0 3v6h2V3H0zm0 6a3 3 0 0 0 3 3v-2a1 1 0 0 1-1-1H0zm3 3h2v-2H3v2zm1-1v4h2v-4H4zm1.707 4.707l.586-.586-1.414-1.414-.586.586 1.414 1.414z"},null,-1)]))}const lh=Mt(sh,[["render",ih]]),ch={},uh={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"20",fill:"currentColor"};function ah(e,t){return ce(),we("svg",uh,t[0]||(t[0]=[D("path",{d:"M10 3.22l-.61-.6a5.5 5.5 0 0 0-7.666.105 5.5 5.5 0 0 0-.114 7.665L10 18.78l8.39-8.4a5.5 5.5 0 0 0-.114-7.665 5.5 5.5 0 0 0-7.666-.105l-.61.61z"},null,-1)]))}const fh=Mt(ch,[["render",ah]]),dh={__name:"TheWelcome",setup(e){const t=()=>fetch("/__open-in-editor?file=README.md");return(n,r)=>(ce(),we(Fe,null,[ie(nn,null,{icon:he(()=>[ie(Gd)]),heading:he(()=>r[0]||(r[0]=[q("Documentation")])),default:he(()=>[r[1]||(r[1]=q(" Vue’s ")),r[2]||(r[2]=D("a",{href:"https://vuejs.org/",target:"_blank",rel:"noopener"},"official documentation",-1)),r[3]||(r[3]=q(" provides you with all information you need to get started. "))]),_:1,__:[1,2,3]}),ie(nn,null,{icon:he(()=>[ie(Zd)]),heading:he(()=>r[4]||(r[4]=[q("Tooling")])),default:he(()=>[r[6]||(r[6]=q(" This project is served and bundled with ")),r[7]||(r[7]=D("a",{href:"https://vite.dev/guide/features.html",target:"_blank",rel:"noopener"},"Vite",-1)),r[8]||(r[8]=q(". The recommended IDE setup is ")),r[9]||(r[9]=D("a",{href:"https://code.visualstudio.com/",target:"_blank",rel:"noopener"},"VSCode",-1)),r[10]||(r[10]=q(" + ")),r[11]||(r[11]=D("a",{href:"https://github.com/vuejs/language-tools",target:"_blank",rel:"noopener"},"Vue - Official",-1)),r[12]||(r[12]=q(". If you need to test your components and web pages, check out ")),r[13]||(r[13]=D("a",{href:"https://vitest.dev/",target:"_blank",rel:"noopener"},"Vitest",-1)),r[14]||(r[14]=q(" and ")),r[15]||(r[15]=D("a",{href:"https://www.cypress.io/",target:"_blank",rel:"noopener"},"Cypress",-1)),r[16]||(r[16]=q(" / ")),r[17]||(r[17]=D("a",{href:"https://playwright.dev/",target:"_blank",rel:"noopener"},"Playwright",-1)),r[18]||(r[18]=q(". ")),r[19]||(r[19]=D("br",null,null,-1)),r[20]||(r[20]=q(" More instructions are available in ")),D("a",{href:"javascript:void(0)",onClick:t},r[5]||(r[5]=[D("code",null,"README.md",-1)])),r[21]||(r[21]=q(". "))]),_:1,__:[6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21]}),ie(nn,null,{icon:he(()=>[ie(rh)]),heading:he(()=>r[22]||(r[22]=[q("Ecosystem")])),default:he(()=>[r[23]||(r[23]=q(" Get official tools and libraries for your project: ")),r[24]||(r[24]=D("a",{href:"https://pinia.vuejs.org/",target:"_blank",rel:"noopener"},"Pinia",-1)),r[25]||(r[25]=q(", ")),r[26]||(r[26]=D("a",{href:"https://router.vuejs.org/",target:"_blank",rel:"noopener"},"Vue Router",-1)),r[27]||(r[27]=q(", ")),r[28]||(r[28]=D("a",{href:"https://test-utils.vuejs.org/",target:"_blank",rel:"noopener"},"Vue Test Utils",-1)),r[29]||(r[29]=q(", and ")),r[30]||(r[30]=D("a",{href:"https://github.com/vuejs/devtools",target:"_blank",rel:"noopener"},"Vue Dev Tools",-1)),r[31]||(r[31]=q(". If you need more resources, we suggest paying ")),r[32]||(r[32]=D("a",{href:"https://github.com/vuejs/awesome-vue",target:"_blank",rel:"noopener"},"Awesome Vue",-1)),r[33]||(r[33]=q(" a visit. "))]),_:1,__:[23,24,25,26,27,28,29,30,31,32,33]}),ie(nn,null,{icon:he(()=>[ie(lh)]),heading:he(()=>r[34]||(r[34]=[q("Community")])),default:he(()=>[r[35]||(r[35]=q(" Got stuck? Ask your question on ")),r[36]||(r[36]=D("a",{href:"https://chat.vuejs.org",target:"_blank",rel:"noopener"},"Vue Land",-1)),r[37]||(r[37]=q(" (our official Discord server), or ")),r[38]||(r[38]=D("a",{href:"https://stackoverflow.com/questions/tagged/vue.js",target:"_blank",rel:"noopener"},"StackOverflow",-1)),r[39]||(r[39]=q(". You should also follow the official ")),r[40]||(r[40]=D("a",{href:"https://bsky.app/profile/vuejs.org",target:"_blank",rel:"noopener"},"@vuejs.org",-1)),r[41]||(r[41]=q(" Bluesky account or the ")),r[42]||(r[42]=D("a",{href:"https://x.com/vuejs",target:"_blank",rel:"noopener"},"@vuejs",-1)),r[43]||(r[43]=q(" X account for latest news in the Vue world. "))]),_:1,__:[35,36,37,38,39,40,41,42,43]}),ie(nn,null,{icon:he(()=>[ie(fh)]),heading:he(()=>r[44]||(r[44]=[q("Support Vue")])),default:he(()=>[r[45]||(r[45]=q(" As an independent project, Vue relies on community backing for its sustainability. You can help us by ")),r[46]||(r[46]=D("a",{href:"https://vuejs.org/sponsor/",target:"_blank",rel:"noopener"},"becoming a sponsor",-1)),r[47]||(r[47]=q(". "))]),_:1,__:[45,46,47]})],64))}},hh={__name:"HomeView",setup(e){return(t,n)=>(ce(),we("main",null,[ie(dh)]))}},ph=zd({history:md("/"),routes:[{path:"/",name:"home",component:hh},{path:"/about",name:"about",component:()=>jf(()=>import("./AboutView-BOLUizkE.js"),__vite__mapDeps([0,1]))}]}),Ss=$u(If);Ss.use(Bu());Ss.use(ph);Ss.mount("#app");export{Mt as _,D as a,we as c,ce as o};
+  */const jt=typeof document<"u";function gl(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function $f(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&gl(e.default)}const G=Object.assign;function Tr(e,t){const n={};for(const r in t){const s=t[r];n[r]=ze(s)?s.map(e):e(s)}return n}const fn=()=>{},ze=Array.isArray,yl=/#/g,zf=/&/g,Hf=/\//g,Uf=/=/g,Bf=/\?/g,bl=/\+/g,Vf=/%5B/g,qf=/%5D/g,vl=/%5E/g,Kf=/%60/g,wl=/%7B/g,Wf=/%7C/g,_l=/%7D/g,Jf=/%20/g;function _s(e){return encodeURI(""+e).replace(Wf,"|").replace(Vf,"[").replace(qf,"]")}function Gf(e){return _s(e).replace(wl,"{").replace(_l,"}").replace(vl,"^")}function Xr(e){return _s(e).replace(bl,"%2B").replace(Jf,"+").replace(yl,"%23").replace(zf,"%26").replace(Kf,"`").replace(wl,"{").replace(_l,"}").replace(vl,"^")}function Xf(e){return Xr(e).replace(Uf,"%3D")}function Yf(e){return _s(e).replace(yl,"%23").replace(Bf,"%3F")}function Qf(e){return e==null?"":Yf(e).replace(Hf,"%2F")}function wn(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Zf=/\/$/,ed=e=>e.replace(Zf,"");function Pr(e,t,n="/"){let r,s={},o="",i="";const l=t.indexOf("#");let c=t.indexOf("?");return l<c&&l>=0&&(c=-1),c>-1&&(r=t.slice(0,c),o=t.slice(c+1,l>-1?l:t.length),s=e(o)),l>-1&&(r=r||t.slice(0,l),i=t.slice(l,t.length)),r=sd(r??t,n),{fullPath:r+(o&&"?")+o+i,path:r,query:s,hash:wn(i)}}function td(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function yo(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function nd(e,t,n){const r=t.matched.length-1,s=n.matched.length-1;return r>-1&&r===s&&Kt(t.matched[r],n.matched[s])&&El(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Kt(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function El(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!rd(e[n],t[n]))return!1;return!0}function rd(e,t){return ze(e)?bo(e,t):ze(t)?bo(t,e):e===t}function bo(e,t){return ze(t)?e.length===t.length&&e.every((n,r)=>n===t[r]):e.length===1&&e[0]===t}function sd(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),r=e.split("/"),s=r[r.length-1];(s===".."||s===".")&&r.push("");let o=n.length-1,i,l;for(i=0;i<r.length;i++)if(l=r[i],l!==".")if(l==="..")o>1&&o--;else break;return n.slice(0,o).join("/")+"/"+r.slice(i).join("/")}const pt={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var _n;(function(e){e.pop="pop",e.push="push"})(_n||(_n={}));var dn;(function(e){e.back="back",e.forward="forward",e.unknown=""})(dn||(dn={}));function od(e){if(!e)if(jt){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),ed(e)}const id=/^[^#]+#/;function ld(e,t){return e.replace(id,"#")+t}function cd(e,t){const n=document.documentElement.getBoundingClientRect(),r=e.getBoundingClientRect();return{behavior:t.behavior,left:r.left-n.left-(t.left||0),top:r.top-n.top-(t.top||0)}}const fr=()=>({left:window.scrollX,top:window.scrollY});function ud(e){let t;if("el"in e){const n=e.el,r=typeof n=="string"&&n.startsWith("#"),s=typeof n=="string"?r?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!s)return;t=cd(s,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function vo(e,t){return(history.state?history.state.position-t:-1)+e}const Yr=new Map;function ad(e,t){Yr.set(e,t)}function fd(e){const t=Yr.get(e);return Yr.delete(e),t}let dd=()=>location.protocol+"//"+location.host;function Sl(e,t){const{pathname:n,search:r,hash:s}=t,o=e.indexOf("#");if(o>-1){let l=s.includes(e.slice(o))?e.slice(o).length:1,c=s.slice(l);return c[0]!=="/"&&(c="/"+c),yo(c,"")}return yo(n,e)+r+s}function hd(e,t,n,r){let s=[],o=[],i=null;const l=({state:p})=>{const g=Sl(e,location),b=n.value,S=t.value;let C=0;if(p){if(n.value=g,t.value=p,i&&i===b){i=null;return}C=S?p.position-S.position:0}else r(g);s.forEach(x=>{x(n.value,b,{delta:C,type:_n.pop,direction:C?C>0?dn.forward:dn.back:dn.unknown})})};function c(){i=n.value}function a(p){s.push(p);const g=()=>{const b=s.indexOf(p);b>-1&&s.splice(b,1)};return o.push(g),g}function u(){const{history:p}=window;p.state&&p.replaceState(G({},p.state,{scroll:fr()}),"")}function f(){for(const p of o)p();o=[],window.removeEventListener("popstate",l),window.removeEventListener("beforeunload",u)}return window.addEventListener("popstate",l),window.addEventListener("beforeunload",u,{passive:!0}),{pauseListeners:c,listen:a,destroy:f}}function wo(e,t,n,r=!1,s=!1){return{back:e,current:t,forward:n,replaced:r,position:window.history.length,scroll:s?fr():null}}function pd(e){const{history:t,location:n}=window,r={value:Sl(e,n)},s={value:t.state};s.value||o(r.value,{back:null,current:r.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function o(c,a,u){const f=e.indexOf("#"),p=f>-1?(n.host&&document.querySelector("base")?e:e.slice(f))+c:dd()+e+c;try{t[u?"replaceState":"pushState"](a,"",p),s.value=a}catch(g){console.error(g),n[u?"replace":"assign"](p)}}function i(c,a){const u=G({},t.state,wo(s.value.back,c,s.value.forward,!0),a,{position:s.value.position});o(c,u,!0),r.value=c}function l(c,a){const u=G({},s.value,t.state,{forward:c,scroll:fr()});o(u.current,u,!0);const f=G({},wo(r.value,c,null),{position:u.position+1},a);o(c,f,!1),r.value=c}return{location:r,state:s,push:l,replace:i}}function md(e){e=od(e);const t=pd(e),n=hd(e,t.state,t.location,t.replace);function r(o,i=!0){i||n.pauseListeners(),history.go(o)}const s=G({location:"",base:e,go:r,createHref:ld.bind(null,e)},t,n);return Object.defineProperty(s,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(s,"state",{enumerable:!0,get:()=>t.state.value}),s}function gd(e){return typeof e=="string"||e&&typeof e=="object"}function Rl(e){return typeof e=="string"||typeof e=="symbol"}const xl=Symbol("");var _o;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(_o||(_o={}));function Wt(e,t){return G(new Error,{type:e,[xl]:!0},t)}function nt(e,t){return e instanceof Error&&xl in e&&(t==null||!!(e.type&t))}const Eo="[^/]+?",yd={sensitive:!1,strict:!1,start:!0,end:!0},bd=/[.+*?^${}()[\]/\\]/g;function vd(e,t){const n=G({},yd,t),r=[];let s=n.start?"^":"";const o=[];for(const a of e){const u=a.length?[]:[90];n.strict&&!a.length&&(s+="/");for(let f=0;f<a.length;f++){const p=a[f];let g=40+(n.sensitive?.25:0);if(p.type===0)f||(s+="/"),s+=p.value.replace(bd,"\\$&"),g+=40;else if(p.type===1){const{value:b,repeatable:S,optional:C,regexp:x}=p;o.push({name:b,repeatable:S,optional:C});const E=x||Eo;if(E!==Eo){g+=10;try{new RegExp(`(${E})`)}catch(L){throw new Error(`Invalid custom RegExp for param "${b}" (${E}): `+L.message)}}let M=S?`((?:${E})(?:/(?:${E}))*)`:`(${E})`;f||(M=C&&a.length<2?`(?:/${M})`:"/"+M),C&&(M+="?"),s+=M,g+=20,C&&(g+=-8),S&&(g+=-20),E===".*"&&(g+=-50)}u.push(g)}r.push(u)}if(n.strict&&n.end){const a=r.length-1;r[a][r[a].length-1]+=.7000000000000001}n.strict||(s+="/?"),n.end?s+="$":n.strict&&!s.endsWith("/")&&(s+="(?:/|$)");const i=new RegExp(s,n.sensitive?"":"i");function l(a){const u=a.match(i),f={};if(!u)return null;for(let p=1;p<u.length;p++){const g=u[p]||"",b=o[p-1];f[b.name]=g&&b.repeatable?g.split("/"):g}return f}function c(a){let u="",f=!1;for(const p of e){(!f||!u.endsWith("/"))&&(u+="/"),f=!1;for(const g of p)if(g.type===0)u+=g.value;else if(g.type===1){const{value:b,repeatable:S,optional:C}=g,x=b in a?a[b]:"";if(ze(x)&&!S)throw new Error(`Provided param "${b}" is an array but it is not repeatable (* or + modifiers)`);const E=ze(x)?x.join("/"):x;if(!E)if(C)p.length<2&&(u.endsWith("/")?u=u.slice(0,-1):f=!0);else throw new Error(`Missing required param "${b}"`);u+=E}}return u||"/"}return{re:i,score:r,keys:o,parse:l,stringify:c}}function wd(e,t){let n=0;for(;n<e.length&&n<t.length;){const r=t[n]-e[n];if(r)return r;n++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function Cl(e,t){let n=0;const r=e.score,s=t.score;for(;n<r.length&&n<s.length;){const o=wd(r[n],s[n]);if(o)return o;n++}if(Math.abs(s.length-r.length)===1){if(So(r))return 1;if(So(s))return-1}return s.length-r.length}function So(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const _d={type:0,value:""},Ed=/[a-zA-Z0-9_]/;function Sd(e){if(!e)return[[]];if(e==="/")return[[_d]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(g){throw new Error(`ERR (${n})/"${a}": ${g}`)}let n=0,r=n;const s=[];let o;function i(){o&&s.push(o),o=[]}let l=0,c,a="",u="";function f(){a&&(n===0?o.push({type:0,value:a}):n===1||n===2||n===3?(o.length>1&&(c==="*"||c==="+")&&t(`A repeatable param (${a}) must be alone in its segment. eg: '/:ids+.`),o.push({type:1,value:a,regexp:u,repeatable:c==="*"||c==="+",optional:c==="*"||c==="?"})):t("Invalid state to consume buffer"),a="")}function p(){a+=c}for(;l<e.length;){if(c=e[l++],c==="\\"&&n!==2){r=n,n=4;continue}switch(n){case 0:c==="/"?(a&&f(),i()):c===":"?(f(),n=1):p();break;case 4:p(),n=r;break;case 1:c==="("?n=2:Ed.test(c)?p():(f(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--);break;case 2:c===")"?u[u.length-1]=="\\"?u=u.slice(0,-1)+c:n=3:u+=c;break;case 3:f(),n=0,c!=="*"&&c!=="?"&&c!=="+"&&l--,u="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${a}"`),f(),i(),s}function Rd(e,t,n){const r=vd(Sd(e.path),n),s=G(r,{record:e,parent:t,children:[],alias:[]});return t&&!s.record.aliasOf==!t.record.aliasOf&&t.children.push(s),s}function xd(e,t){const n=[],r=new Map;t=Ao({strict:!1,end:!0,sensitive:!1},t);function s(f){return r.get(f)}function o(f,p,g){const b=!g,S=xo(f);S.aliasOf=g&&g.record;const C=Ao(t,f),x=[S];if("alias"in f){const L=typeof f.alias=="string"?[f.alias]:f.alias;for(const z of L)x.push(xo(G({},S,{components:g?g.record.components:S.components,path:z,aliasOf:g?g.record:S})))}let E,M;for(const L of x){const{path:z}=L;if(p&&z[0]!=="/"){const Q=p.record.path,K=Q[Q.length-1]==="/"?"":"/";L.path=p.record.path+(z&&K+z)}if(E=Rd(L,p,C),g?g.alias.push(E):(M=M||E,M!==E&&M.alias.push(E),b&&f.name&&!Co(E)&&i(f.name)),Al(E)&&c(E),S.children){const Q=S.children;for(let K=0;K<Q.length;K++)o(Q[K],E,g&&g.children[K])}g=g||E}return M?()=>{i(M)}:fn}function i(f){if(Rl(f)){const p=r.get(f);p&&(r.delete(f),n.splice(n.indexOf(p),1),p.children.forEach(i),p.alias.forEach(i))}else{const p=n.indexOf(f);p>-1&&(n.splice(p,1),f.record.name&&r.delete(f.record.name),f.children.forEach(i),f.alias.forEach(i))}}function l(){return n}function c(f){const p=Od(f,n);n.splice(p,0,f),f.record.name&&!Co(f)&&r.set(f.record.name,f)}function a(f,p){let g,b={},S,C;if("name"in f&&f.name){if(g=r.get(f.name),!g)throw Wt(1,{location:f});C=g.record.name,b=G(Ro(p.params,g.keys.filter(M=>!M.optional).concat(g.parent?g.parent.keys.filter(M=>M.optional):[]).map(M=>M.name)),f.params&&Ro(f.params,g.keys.map(M=>M.name))),S=g.stringify(b)}else if(f.path!=null)S=f.path,g=n.find(M=>M.re.test(S)),g&&(b=g.parse(S),C=g.record.name);else{if(g=p.name?r.get(p.name):n.find(M=>M.re.test(p.path)),!g)throw Wt(1,{location:f,currentLocation:p});C=g.record.name,b=G({},p.params,f.params),S=g.stringify(b)}const x=[];let E=g;for(;E;)x.unshift(E.record),E=E.parent;return{name:C,path:S,params:b,matched:x,meta:Ad(x)}}e.forEach(f=>o(f));function u(){n.length=0,r.clear()}return{addRoute:o,resolve:a,removeRoute:i,clearRoutes:u,getRoutes:l,getRecordMatcher:s}}function Ro(e,t){const n={};for(const r of t)r in e&&(n[r]=e[r]);return n}function xo(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Cd(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Cd(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const r in e.components)t[r]=typeof n=="object"?n[r]:n;return t}function Co(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Ad(e){return e.reduce((t,n)=>G(t,n.meta),{})}function Ao(e,t){const n={};for(const r in e)n[r]=r in t?t[r]:e[r];return n}function Od(e,t){let n=0,r=t.length;for(;n!==r;){const o=n+r>>1;Cl(e,t[o])<0?r=o:n=o+1}const s=Td(e);return s&&(r=t.lastIndexOf(s,r-1)),r}function Td(e){let t=e;for(;t=t.parent;)if(Al(t)&&Cl(e,t)===0)return t}function Al({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function Pd(e){const t={};if(e===""||e==="?")return t;const r=(e[0]==="?"?e.slice(1):e).split("&");for(let s=0;s<r.length;++s){const o=r[s].replace(bl," "),i=o.indexOf("="),l=wn(i<0?o:o.slice(0,i)),c=i<0?null:wn(o.slice(i+1));if(l in t){let a=t[l];ze(a)||(a=t[l]=[a]),a.push(c)}else t[l]=c}return t}function Oo(e){let t="";for(let n in e){const r=e[n];if(n=Xf(n),r==null){r!==void 0&&(t+=(t.length?"&":"")+n);continue}(ze(r)?r.map(o=>o&&Xr(o)):[r&&Xr(r)]).forEach(o=>{o!==void 0&&(t+=(t.length?"&":"")+n,o!=null&&(t+="="+o))})}return t}function Md(e){const t={};for(const n in e){const r=e[n];r!==void 0&&(t[n]=ze(r)?r.map(s=>s==null?null:""+s):r==null?r:""+r)}return t}const Nd=Symbol(""),To=Symbol(""),Es=Symbol(""),Ol=Symbol(""),Qr=Symbol("");function tn(){let e=[];function t(r){return e.push(r),()=>{const s=e.indexOf(r);s>-1&&e.splice(s,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function yt(e,t,n,r,s,o=i=>i()){const i=r&&(r.enterCallbacks[s]=r.enterCallbacks[s]||[]);return()=>new Promise((l,c)=>{const a=p=>{p===!1?c(Wt(4,{from:n,to:t})):p instanceof Error?c(p):gd(p)?c(Wt(2,{from:t,to:p})):(i&&r.enterCallbacks[s]===i&&typeof p=="function"&&i.push(p),l())},u=o(()=>e.call(r&&r.instances[s],t,n,a));let f=Promise.resolve(u);e.length<3&&(f=f.then(a)),f.catch(p=>c(p))})}function Mr(e,t,n,r,s=o=>o()){const o=[];for(const i of e)for(const l in i.components){let c=i.components[l];if(!(t!=="beforeRouteEnter"&&!i.instances[l]))if(gl(c)){const u=(c.__vccOpts||c)[t];u&&o.push(yt(u,n,r,i,l,s))}else{let a=c();o.push(()=>a.then(u=>{if(!u)throw new Error(`Couldn't resolve component "${l}" at "${i.path}"`);const f=$f(u)?u.default:u;i.mods[l]=u,i.components[l]=f;const g=(f.__vccOpts||f)[t];return g&&yt(g,n,r,i,l,s)()}))}}return o}function Po(e){const t=it(Es),n=it(Ol),r=ke(()=>{const c=Ht(e.to);return t.resolve(c)}),s=ke(()=>{const{matched:c}=r.value,{length:a}=c,u=c[a-1],f=n.matched;if(!u||!f.length)return-1;const p=f.findIndex(Kt.bind(null,u));if(p>-1)return p;const g=Mo(c[a-2]);return a>1&&Mo(u)===g&&f[f.length-1].path!==g?f.findIndex(Kt.bind(null,c[a-2])):p}),o=ke(()=>s.value>-1&&kd(n.params,r.value.params)),i=ke(()=>s.value>-1&&s.value===n.matched.length-1&&El(n.params,r.value.params));function l(c={}){if(Dd(c)){const a=t[Ht(e.replace)?"replace":"push"](Ht(e.to)).catch(fn);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>a),a}return Promise.resolve()}return{route:r,href:ke(()=>r.value.href),isActive:o,isExactActive:i,navigate:l}}function Fd(e){return e.length===1?e[0]:e}const Ld=mi({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:Po,setup(e,{slots:t}){const n=Qn(Po(e)),{options:r}=it(Es),s=ke(()=>({[No(e.activeClass,r.linkActiveClass,"router-link-active")]:n.isActive,[No(e.exactActiveClass,r.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const o=t.default&&Fd(t.default(n));return e.custom?o:Bi("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:s.value},o)}}}),Id=Ld;function Dd(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function kd(e,t){for(const n in t){const r=t[n],s=e[n];if(typeof r=="string"){if(r!==s)return!1}else if(!ze(s)||s.length!==r.length||r.some((o,i)=>o!==s[i]))return!1}return!0}function Mo(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const No=(e,t,n)=>e??t??n,jd=mi({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const r=it(Qr),s=ke(()=>e.route||r.value),o=it(To,0),i=ke(()=>{let a=Ht(o);const{matched:u}=s.value;let f;for(;(f=u[a])&&!f.components;)a++;return a}),l=ke(()=>s.value.matched[i.value]);Nn(To,ke(()=>i.value+1)),Nn(Nd,l),Nn(Qr,s);const c=De();return Fn(()=>[c.value,l.value,e.name],([a,u,f],[p,g,b])=>{u&&(u.instances[f]=a,g&&g!==u&&a&&a===p&&(u.leaveGuards.size||(u.leaveGuards=g.leaveGuards),u.updateGuards.size||(u.updateGuards=g.updateGuards))),a&&u&&(!g||!Kt(u,g)||!p)&&(u.enterCallbacks[f]||[]).forEach(S=>S(a))},{flush:"post"}),()=>{const a=s.value,u=e.name,f=l.value,p=f&&f.components[u];if(!p)return Fo(n.default,{Component:p,route:a});const g=f.props[u],b=g?g===!0?a.params:typeof g=="function"?g(a):g:null,C=Bi(p,G({},b,t,{onVnodeUnmounted:x=>{x.component.isUnmounted&&(f.instances[u]=null)},ref:c}));return Fo(n.default,{Component:C,route:a})||C}}});function Fo(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const $d=jd;function zd(e){const t=xd(e.routes,e),n=e.parseQuery||Pd,r=e.stringifyQuery||Oo,s=e.history,o=tn(),i=tn(),l=tn(),c=ic(pt);let a=pt;jt&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const u=Tr.bind(null,w=>""+w),f=Tr.bind(null,Qf),p=Tr.bind(null,wn);function g(w,I){let N,k;return Rl(w)?(N=t.getRecordMatcher(w),k=I):k=w,t.addRoute(k,N)}function b(w){const I=t.getRecordMatcher(w);I&&t.removeRoute(I)}function S(){return t.getRoutes().map(w=>w.record)}function C(w){return!!t.getRecordMatcher(w)}function x(w,I){if(I=G({},I||c.value),typeof w=="string"){const m=Pr(n,w,I.path),v=t.resolve({path:m.path},I),R=s.createHref(m.fullPath);return G(m,v,{params:p(v.params),hash:wn(m.hash),redirectedFrom:void 0,href:R})}let N;if(w.path!=null)N=G({},w,{path:Pr(n,w.path,I.path).path});else{const m=G({},w.params);for(const v in m)m[v]==null&&delete m[v];N=G({},w,{params:f(m)}),I.params=f(I.params)}const k=t.resolve(N,I),te=w.hash||"";k.params=u(p(k.params));const d=td(r,G({},w,{hash:Gf(te),path:k.path})),h=s.createHref(d);return G({fullPath:d,hash:te,query:r===Oo?Md(w.query):w.query||{}},k,{redirectedFrom:void 0,href:h})}function E(w){return typeof w=="string"?Pr(n,w,c.value.path):G({},w)}function M(w,I){if(a!==w)return Wt(8,{from:I,to:w})}function L(w){return K(w)}function z(w){return L(G(E(w),{replace:!0}))}function Q(w){const I=w.matched[w.matched.length-1];if(I&&I.redirect){const{redirect:N}=I;let k=typeof N=="function"?N(w):N;return typeof k=="string"&&(k=k.includes("?")||k.includes("#")?k=E(k):{path:k},k.params={}),G({query:w.query,hash:w.hash,params:k.path!=null?{}:w.params},k)}}function K(w,I){const N=a=x(w),k=c.value,te=w.state,d=w.force,h=w.replace===!0,m=Q(N);if(m)return K(G(E(m),{state:typeof m=="object"?G({},te,m.state):te,force:d,replace:h}),I||N);const v=N;v.redirectedFrom=I;let R;return!d&&nd(r,k,N)&&(R=Wt(16,{to:v,from:k}),Ve(k,k,!0,!1)),(R?Promise.resolve(R):Ue(v,k)).catch(_=>nt(_)?nt(_,2)?_:ht(_):J(_,v,k)).then(_=>{if(_){if(nt(_,2))return K(G({replace:h},E(_.to),{state:typeof _.to=="object"?G({},te,_.to.state):te,force:d}),I||v)}else _=wt(v,k,!0,h,te);return dt(v,k,_),_})}function ae(w,I){const N=M(w,I);return N?Promise.reject(N):Promise.resolve()}function de(w){const I=Lt.values().next().value;return I&&typeof I.runWithContext=="function"?I.runWithContext(w):w()}function Ue(w,I){let N;const[k,te,d]=Hd(w,I);N=Mr(k.reverse(),"beforeRouteLeave",w,I);for(const m of k)m.leaveGuards.forEach(v=>{N.push(yt(v,w,I))});const h=ae.bind(null,w,I);return N.push(h),Ie(N).then(()=>{N=[];for(const m of o.list())N.push(yt(m,w,I));return N.push(h),Ie(N)}).then(()=>{N=Mr(te,"beforeRouteUpdate",w,I);for(const m of te)m.updateGuards.forEach(v=>{N.push(yt(v,w,I))});return N.push(h),Ie(N)}).then(()=>{N=[];for(const m of d)if(m.beforeEnter)if(ze(m.beforeEnter))for(const v of m.beforeEnter)N.push(yt(v,w,I));else N.push(yt(m.beforeEnter,w,I));return N.push(h),Ie(N)}).then(()=>(w.matched.forEach(m=>m.enterCallbacks={}),N=Mr(d,"beforeRouteEnter",w,I,de),N.push(h),Ie(N))).then(()=>{N=[];for(const m of i.list())N.push(yt(m,w,I));return N.push(h),Ie(N)}).catch(m=>nt(m,8)?m:Promise.reject(m))}function dt(w,I,N){l.list().forEach(k=>de(()=>k(w,I,N)))}function wt(w,I,N,k,te){const d=M(w,I);if(d)return d;const h=I===pt,m=jt?history.state:{};N&&(k||h?s.replace(w.fullPath,G({scroll:h&&m&&m.scroll},te)):s.push(w.fullPath,te)),c.value=w,Ve(w,I,N,h),ht()}let Be;function Xt(){Be||(Be=s.listen((w,I,N)=>{if(!Cn.listening)return;const k=x(w),te=Q(k);if(te){K(G(te,{replace:!0,force:!0}),k).catch(fn);return}a=k;const d=c.value;jt&&ad(vo(d.fullPath,N.delta),fr()),Ue(k,d).catch(h=>nt(h,12)?h:nt(h,2)?(K(G(E(h.to),{force:!0}),k).then(m=>{nt(m,20)&&!N.delta&&N.type===_n.pop&&s.go(-1,!1)}).catch(fn),Promise.reject()):(N.delta&&s.go(-N.delta,!1),J(h,k,d))).then(h=>{h=h||wt(k,d,!1),h&&(N.delta&&!nt(h,8)?s.go(-N.delta,!1):N.type===_n.pop&&nt(h,20)&&s.go(-1,!1)),dt(k,d,h)}).catch(fn)}))}let Nt=tn(),fe=tn(),ee;function J(w,I,N){ht(w);const k=fe.list();return k.length?k.forEach(te=>te(w,I,N)):console.error(w),Promise.reject(w)}function et(){return ee&&c.value!==pt?Promise.resolve():new Promise((w,I)=>{Nt.add([w,I])})}function ht(w){return ee||(ee=!w,Xt(),Nt.list().forEach(([I,N])=>w?N(w):I()),Nt.reset()),w}function Ve(w,I,N,k){const{scrollBehavior:te}=e;if(!jt||!te)return Promise.resolve();const d=!N&&fd(vo(w.fullPath,0))||(k||!N)&&history.state&&history.state.scroll||null;return ai().then(()=>te(w,I,d)).then(h=>h&&ud(h)).catch(h=>J(h,w,I))}const Re=w=>s.go(w);let Ft;const Lt=new Set,Cn={currentRoute:c,listening:!0,addRoute:g,removeRoute:b,clearRoutes:t.clearRoutes,hasRoute:C,getRoutes:S,resolve:x,options:e,push:L,replace:z,go:Re,back:()=>Re(-1),forward:()=>Re(1),beforeEach:o.add,beforeResolve:i.add,afterEach:l.add,onError:fe.add,isReady:et,install(w){const I=this;w.component("RouterLink",Id),w.component("RouterView",$d),w.config.globalProperties.$router=I,Object.defineProperty(w.config.globalProperties,"$route",{enumerable:!0,get:()=>Ht(c)}),jt&&!Ft&&c.value===pt&&(Ft=!0,L(s.location).catch(te=>{}));const N={};for(const te in pt)Object.defineProperty(N,te,{get:()=>c.value[te],enumerable:!0});w.provide(Es,I),w.provide(Ol,si(N)),w.provide(Qr,c);const k=w.unmount;Lt.add(w),w.unmount=function(){Lt.delete(w),Lt.size<1&&(a=pt,Be&&Be(),Be=null,c.value=pt,Ft=!1,ee=!1),k()}}};function Ie(w){return w.reduce((I,N)=>I.then(()=>de(N)),Promise.resolve())}return Cn}function Hd(e,t){const n=[],r=[],s=[],o=Math.max(t.matched.length,e.matched.length);for(let i=0;i<o;i++){const l=t.matched[i];l&&(e.matched.find(a=>Kt(a,l))?r.push(l):n.push(l));const c=e.matched[i];c&&(t.matched.find(a=>Kt(a,c))||s.push(c))}return[n,r,s]}const Ud={},Bd={class:"item"},Vd={class:"details"};function qd(e,t){return ce(),we("div",Bd,[D("i",null,[br(e.$slots,"icon",{},void 0)]),D("div",Vd,[D("h3",null,[br(e.$slots,"heading",{},void 0)]),br(e.$slots,"default",{},void 0)])])}const nn=Mt(Ud,[["render",qd],["__scopeId","data-v-40a5c0e5"]]),Kd={},Wd={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"17",fill:"currentColor"};function Jd(e,t){return ce(),we("svg",Wd,t[0]||(t[0]=[D("path",{d:"M11 2.253a1 1 0 1 0-2 0h2zm-2 13a1 1 0 1 0 2 0H9zm.447-12.167a1 1 0 1 0 1.107-1.666L9.447 3.086zM1 2.253L.447 1.42A1 1 0 0 0 0 2.253h1zm0 13H0a1 1 0 0 0 1.553.833L1 15.253zm8.447.833a1 1 0 1 0 1.107-1.666l-1.107 1.666zm0-14.666a1 1 0 1 0 1.107 1.666L9.447 1.42zM19 2.253h1a1 1 0 0 0-.447-.833L19 2.253zm0 13l-.553.833A1 1 0 0 0 20 15.253h-1zm-9.553-.833a1 1 0 1 0 1.107 1.666L9.447 14.42zM9 2.253v13h2v-13H9zm1.553-.833C9.203.523 7.42 0 5.5 0v2c1.572 0 2.961.431 3.947 1.086l1.107-1.666zM5.5 0C3.58 0 1.797.523.447 1.42l1.107 1.666C2.539 2.431 3.928 2 5.5 2V0zM0 2.253v13h2v-13H0zm1.553 13.833C2.539 15.431 3.928 15 5.5 15v-2c-1.92 0-3.703.523-5.053 1.42l1.107 1.666zM5.5 15c1.572 0 2.961.431 3.947 1.086l1.107-1.666C9.203 13.523 7.42 13 5.5 13v2zm5.053-11.914C11.539 2.431 12.928 2 14.5 2V0c-1.92 0-3.703.523-5.053 1.42l1.107 1.666zM14.5 2c1.573 0 2.961.431 3.947 1.086l1.107-1.666C18.203.523 16.421 0 14.5 0v2zm3.5.253v13h2v-13h-2zm1.553 12.167C18.203 13.523 16.421 13 14.5 13v2c1.573 0 2.961.431 3.947 1.086l1.107-1.666zM14.5 13c-1.92 0-3.703.523-5.053 1.42l1.107 1.666C11.539 15.431 12.928 15 14.5 15v-2z"},null,-1)]))}const Gd=Mt(Kd,[["render",Jd]]),Xd={},Yd={xmlns:"http://www.w3.org/2000/svg","xmlns:xlink":"http://www.w3.org/1999/xlink","aria-hidden":"true",role:"img",class:"iconify iconify--mdi",width:"24",height:"24",preserveAspectRatio:"xMidYMid meet",viewBox:"0 0 24 24"};function Qd(e,t){return ce(),we("svg",Yd,t[0]||(t[0]=[D("path",{d:"M20 18v-4h-3v1h-2v-1H9v1H7v-1H4v4h16M6.33 8l-1.74 4H7v-1h2v1h6v-1h2v1h2.41l-1.74-4H6.33M9 5v1h6V5H9m12.84 7.61c.1.22.16.48.16.8V18c0 .53-.21 1-.6 1.41c-.4.4-.85.59-1.4.59H4c-.55 0-1-.19-1.4-.59C2.21 19 2 18.53 2 18v-4.59c0-.32.06-.58.16-.8L4.5 7.22C4.84 6.41 5.45 6 6.33 6H7V5c0-.55.18-1 .57-1.41C7.96 3.2 8.44 3 9 3h6c.56 0 1.04.2 1.43.59c.39.41.57.86.57 1.41v1h.67c.88 0 1.49.41 1.83 1.22l2.34 5.39z",fill:"currentColor"},null,-1)]))}const Zd=Mt(Xd,[["render",Qd]]),eh={},th={xmlns:"http://www.w3.org/2000/svg",width:"18",height:"20",fill:"currentColor"};function nh(e,t){return ce(),we("svg",th,t[0]||(t[0]=[D("path",{d:"M11.447 8.894a1 1 0 1 0-.894-1.789l.894 1.789zm-2.894-.789a1 1 0 1 0 .894 1.789l-.894-1.789zm0 1.789a1 1 0 1 0 .894-1.789l-.894 1.789zM7.447 7.106a1 1 0 1 0-.894 1.789l.894-1.789zM10 9a1 1 0 1 0-2 0h2zm-2 2.5a1 1 0 1 0 2 0H8zm9.447-5.606a1 1 0 1 0-.894-1.789l.894 1.789zm-2.894-.789a1 1 0 1 0 .894 1.789l-.894-1.789zm2 .789a1 1 0 1 0 .894-1.789l-.894 1.789zm-1.106-2.789a1 1 0 1 0-.894 1.789l.894-1.789zM18 5a1 1 0 1 0-2 0h2zm-2 2.5a1 1 0 1 0 2 0h-2zm-5.447-4.606a1 1 0 1 0 .894-1.789l-.894 1.789zM9 1l.447-.894a1 1 0 0 0-.894 0L9 1zm-2.447.106a1 1 0 1 0 .894 1.789l-.894-1.789zm-6 3a1 1 0 1 0 .894 1.789L.553 4.106zm2.894.789a1 1 0 1 0-.894-1.789l.894 1.789zm-2-.789a1 1 0 1 0-.894 1.789l.894-1.789zm1.106 2.789a1 1 0 1 0 .894-1.789l-.894 1.789zM2 5a1 1 0 1 0-2 0h2zM0 7.5a1 1 0 1 0 2 0H0zm8.553 12.394a1 1 0 1 0 .894-1.789l-.894 1.789zm-1.106-2.789a1 1 0 1 0-.894 1.789l.894-1.789zm1.106 1a1 1 0 1 0 .894 1.789l-.894-1.789zm2.894.789a1 1 0 1 0-.894-1.789l.894 1.789zM8 19a1 1 0 1 0 2 0H8zm2-2.5a1 1 0 1 0-2 0h2zm-7.447.394a1 1 0 1 0 .894-1.789l-.894 1.789zM1 15H0a1 1 0 0 0 .553.894L1 15zm1-2.5a1 1 0 1 0-2 0h2zm12.553 2.606a1 1 0 1 0 .894 1.789l-.894-1.789zM17 15l.447.894A1 1 0 0 0 18 15h-1zm1-2.5a1 1 0 1 0-2 0h2zm-7.447-5.394l-2 1 .894 1.789 2-1-.894-1.789zm-1.106 1l-2-1-.894 1.789 2 1 .894-1.789zM8 9v2.5h2V9H8zm8.553-4.894l-2 1 .894 1.789 2-1-.894-1.789zm.894 0l-2-1-.894 1.789 2 1 .894-1.789zM16 5v2.5h2V5h-2zm-4.553-3.894l-2-1-.894 1.789 2 1 .894-1.789zm-2.894-1l-2 1 .894 1.789 2-1L8.553.106zM1.447 5.894l2-1-.894-1.789-2 1 .894 1.789zm-.894 0l2 1 .894-1.789-2-1-.894 1.789zM0 5v2.5h2V5H0zm9.447 13.106l-2-1-.894 1.789 2 1 .894-1.789zm0 1.789l2-1-.894-1.789-2 1 .894 1.789zM10 19v-2.5H8V19h2zm-6.553-3.894l-2-1-.894 1.789 2 1 .894-1.789zM2 15v-2.5H0V15h2zm13.447 1.894l2-1-.894-1.789-2 1 .894 1.789zM18 15v-2.5h-2V15h2z"},null,-1)]))}const rh=Mt(eh,[["render",nh]]),sh={},oh={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"20",fill:"currentColor"};function ih(e,t){return ce(),we("svg",oh,t[0]||(t[0]=[D("path",{d:"M15 4a1 1 0 1 0 0 2V4zm0 11v-1a1 1 0 0 0-1 1h1zm0 4l-.707.707A1 1 0 0 0 16 19h-1zm-4-4l.707-.707A1 1 0 0 0 11 14v1zm-4.707-1.293a1 1 0 0 0-1.414 1.414l1.414-1.414zm-.707.707l-.707-.707.707.707zM9 11v-1a1 1 0 0 0-.707.293L9 11zm-4 0h1a1 1 0 0 0-1-1v1zm0 4H4a1 1 0 0 0 1.707.707L5 15zm10-9h2V4h-2v2zm2 0a1 1 0 0 1 1 1h2a3 3 0 0 0-3-3v2zm1 1v6h2V7h-2zm0 6a1 1 0 0 1-1 1v2a3 3 0 0 0 3-3h-2zm-1 1h-2v2h2v-2zm-3 1v4h2v-4h-2zm1.707 3.293l-4-4-1.414 1.414 4 4 1.414-1.414zM11 14H7v2h4v-2zm-4 0c-.276 0-.525-.111-.707-.293l-1.414 1.414C5.42 15.663 6.172 16 7 16v-2zm-.707 1.121l3.414-3.414-1.414-1.414-3.414 3.414 1.414 1.414zM9 12h4v-2H9v2zm4 0a3 3 0 0 0 3-3h-2a1 1 0 0 1-1 1v2zm3-3V3h-2v6h2zm0-6a3 3 0 0 0-3-3v2a1 1 0 0 1 1 1h2zm-3-3H3v2h10V0zM3 0a3 3 0 0 0-3 3h2a1 1 0 0 1 1-1V0zM0 3v6h2V3H0zm0 6a3 3 0 0 0 3 3v-2a1 1 0 0 1-1-1H0zm3 3h2v-2H3v2zm1-1v4h2v-4H4zm1.707 4.707l.586-.586-1.414-1.414-.586.586 1.414 1.414z"},null,-1)]))}const lh=Mt(sh,[["render",ih]]),ch={},uh={xmlns:"http://www.w3.org/2000/svg",width:"20",height:"20",fill:"currentColor"};function ah(e,t){return ce(),we("svg",uh,t[0]||(t[0]=[D("path",{d:"M10 3.22l-.61-.6a5.5 5.5 0 0 0-7.666.105 5.5 5.5 0 0 0-.114 7.665L10 18.78l8.39-8.4a5.5 5.5 0 0 0-.114-7.665 5.5 5.5 0 0 0-7.666-.105l-.61.61z"},null,-1)]))}const fh=Mt(ch,[["render",ah]]),dh={__name:"TheWelcome",setup(e){const t=()=>fetch("/__open-in-editor?file=README.md");return(n,r)=>(ce(),we(Fe,null,[ie(nn,null,{icon:he(()=>[ie(Gd)]),heading:he(()=>r[0]||(r[0]=[q("Documentation")])),default:he(()=>[r[1]||(r[1]=q(" Vue’s ")),r[2]||(r[2]=D("a",{href:"https://vuejs.org/",target:"_blank",rel:"noopener"},"official documentation",-1)),r[3]||(r[3]=q(" provides you with all information you need to get started. "))]),_:1,__:[1,2,3]}),ie(nn,null,{icon:he(()=>[ie(Zd)]),heading:he(()=>r[4]||(r[4]=[q("Tooling")])),default:he(()=>[r[6]||(r[6]=q(" This project is served and bundled with ")),r[7]||(r[7]=D("a",{href:"https://vite.dev/guide/features.html",target:"_blank",rel:"noopener"},"Vite",-1)),r[8]||(r[8]=q(". The recommended IDE setup is ")),r[9]||(r[9]=D("a",{href:"https://code.visualstudio.com/",target:"_blank",rel:"noopener"},"VSCode",-1)),r[10]||(r[10]=q(" + ")),r[11]||(r[11]=D("a",{href:"https://github.com/vuejs/language-tools",target:"_blank",rel:"noopener"},"Vue - Official",-1)),r[12]||(r[12]=q(". If you need to test your components and web pages, check out ")),r[13]||(r[13]=D("a",{href:"https://vitest.dev/",target:"_blank",rel:"noopener"},"Vitest",-1)),r[14]||(r[14]=q(" and ")),r[15]||(r[15]=D("a",{href:"https://www.cypress.io/",target:"_blank",rel:"noopener"},"Cypress",-1)),r[16]||(r[16]=q(" / ")),r[17]||(r[17]=D("a",{href:"https://playwright.dev/",target:"_blank",rel:"noopener"},"Playwright",-1)),r[18]||(r[18]=q(". ")),r[19]||(r[19]=D("br",null,null,-1)),r[20]||(r[20]=q(" More instructions are available in ")),D("a",{href:"javascript:void(0)",onClick:t},r[5]||(r[5]=[D("code",null,"README.md",-1)])),r[21]||(r[21]=q(". "))]),_:1,__:[6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21]}),ie(nn,null,{icon:he(()=>[ie(rh)]),heading:he(()=>r[22]||(r[22]=[q("Ecosystem")])),default:he(()=>[r[23]||(r[23]=q(" Get official tools and libraries for your project: ")),r[24]||(r[24]=D("a",{href:"https://pinia.vuejs.org/",target:"_blank",rel:"noopener"},"Pinia",-1)),r[25]||(r[25]=q(", ")),r[26]||(r[26]=D("a",{href:"https://router.vuejs.org/",target:"_blank",rel:"noopener"},"Vue Router",-1)),r[27]||(r[27]=q(", ")),r[28]||(r[28]=D("a",{href:"https://test-utils.vuejs.org/",target:"_blank",rel:"noopener"},"Vue Test Utils",-1)),r[29]||(r[29]=q(", and ")),r[30]||(r[30]=D("a",{href:"https://github.com/vuejs/devtools",target:"_blank",rel:"noopener"},"Vue Dev Tools",-1)),r[31]||(r[31]=q(". If you need more resources, we suggest paying ")),r[32]||(r[32]=D("a",{href:"https://github.com/vuejs/awesome-vue",target:"_blank",rel:"noopener"},"Awesome Vue",-1)),r[33]||(r[33]=q(" a visit. "))]),_:1,__:[23,24,25,26,27,28,29,30,31,32,33]}),ie(nn,null,{icon:he(()=>[ie(lh)]),heading:he(()=>r[34]||(r[34]=[q("Community")])),default:he(()=>[r[35]||(r[35]=q(" Got stuck? Ask your question on ")),r[36]||(r[36]=D("a",{href:"https://chat.vuejs.org",target:"_blank",rel:"noopener"},"Vue Land",-1)),r[37]||(r[37]=q(" (our official Discord server), or ")),r[38]||(r[38]=D("a",{href:"https://stackoverflow.com/questions/tagged/vue.js",target:"_blank",rel:"noopener"},"StackOverflow",-1)),r[39]||(r[39]=q(". You should also follow the official ")),r[40]||(r[40]=D("a",{href:"https://bsky.app/profile/vuejs.org",target:"_blank",rel:"noopener"},"@vuejs.org",-1)),r[41]||(r[41]=q(" Bluesky account or the ")),r[42]||(r[42]=D("a",{href:"https://x.com/vuejs",target:"_blank",rel:"noopener"},"@vuejs",-1)),r[43]||(r[43]=q(" X account for latest news in the Vue world. "))]),_:1,__:[35,36,37,38,39,40,41,42,43]}),ie(nn,null,{icon:he(()=>[ie(fh)]),heading:he(()=>r[44]||(r[44]=[q("Support Vue")])),default:he(()=>[r[45]||(r[45]=q(" As an independent project, Vue relies on community backing for its sustainability. You can help us by ")),r[46]||(r[46]=D("a",{href:"https://vuejs.org/sponsor/",target:"_blank",rel:"noopener"},"becoming a sponsor",-1)),r[47]||(r[47]=q(". "))]),_:1,__:[45,46,47]})],64))}},hh={__name:"HomeView",setup(e){return(t,n)=>(ce(),we("main",null,[ie(dh)]))}},ph=zd({history:md("/"),routes:[{path:"/",name:"home",component:hh},{path:"/about",name:"about",component:()=>jf(()=>import("./AboutView-PlSwkyS7.js"),__vite__mapDeps([0,1]))}]}),Ss=$u(If);Ss.use(Bu());Ss.use(ph);Ss.mount("#app");export{Mt as _,D as a,we as c,ce as o};
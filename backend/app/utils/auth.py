@@ -1,19 +1,22 @@
 from farmbot import Farmbot
 import json
+import logging
 import os
 from getpass import getpass
 
 TOKEN_FILE = 'farmbot_authorization_token.json'
 
-def load_token():
+logger = logging.getLogger(__name__)
+
+def load_token(token_file=TOKEN_FILE):
     """Load the authorization token from the file or fetch a new one if not present."""
-    if os.path.exists(TOKEN_FILE):
-        with open(TOKEN_FILE, 'r') as file:
+    if os.path.exists(token_file):
+        with open(token_file, 'r') as file:
             return json.load(file)
     else:
-        return fetch_token()
+        return fetch_token(token_file)
 
-def fetch_token():
+def fetch_token(token_file=TOKEN_FILE):
     """Prompt the user for credentials to fetch a new authorization token."""
     SERVER = input('FarmBot Web App account server (press <Enter> for https://my.farm.bot): ') or 'https://my.farm.bot'
     EMAIL = input('FarmBot Web App account login email: ')
@@ -22,8 +25,8 @@ def fetch_token():
     fb = Farmbot()
     token = fb.get_token(EMAIL, PASSWORD, SERVER)
 
-    with open(TOKEN_FILE, 'w') as file:
+    with open(token_file, 'w') as file:
         json.dump(token, file)
 
-    print('Token saved to file')
+    logger.info('Token saved to file', extra={'token_file': token_file})
     return token
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "refreshing")
+
+    def __init__(self, value, expires_at: float, stale_until: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class TTLCache:
+    """
+    Cache LRU à durée de vie par entrée, avec 'stale-while-revalidate' :
+    une entrée expirée mais encore dans sa fenêtre de péremption est retournée
+    tout de suite pendant qu'une tâche asyncio la recharge en arrière-plan.
+    """
+
+    def __init__(self, max_size: int = 128, default_ttl: float = 30.0, default_stale: float = 0.0):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.default_stale = default_stale
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Hashable):
+        """Retourne (trouvé, valeur, à_rafraîchir) et marque l'entrée en rafraîchissement."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now < entry.expires_at:
+                    return True, entry.value, False
+                if now < entry.stale_until:
+                    refresh = not entry.refreshing
+                    entry.refreshing = True
+                    return True, entry.value, refresh
+            return False, None, False
+
+    def _refresh_failed(self, key):
+        # On garde la valeur périmée; la prochaine lecture relancera le rafraîchissement
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    async def get_or_load_async(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                                ttl: Optional[float] = None, stale: Optional[float] = None):
+        """
+        Valeur en cache, sinon attend `loader()`. Une entrée périmée est retournée tout de
+        suite et rechargée par une seule tâche en arrière-plan.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        stale = self.default_stale if stale is None else stale
+
+        found, value, refresh = self._lookup(key)
+        if found:
+            if refresh:
+                asyncio.ensure_future(self._refresh_async(key, loader, ttl, stale))
+            return value
+
+        value = await loader()
+        self.set(key, value, ttl, stale)
+        return value
+
+    async def _refresh_async(self, key, loader, ttl, stale):
+        try:
+            value = await loader()
+        except Exception as e:
+            logger.warning("Cache refresh failed", extra={"key": str(key), "error": str(e)})
+            self._refresh_failed(key)
+        else:
+            self.set(key, value, ttl, stale)
+
+    def set(self, key: Hashable, value, ttl: Optional[float] = None, stale: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        stale = self.default_stale if stale is None else stale
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + stale)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
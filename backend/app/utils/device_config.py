@@ -0,0 +1,45 @@
+# app/utils/device_config.py
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+
+class DeviceConfigCache:
+    """
+    Dernière configuration connue d'un robot (hauteur sécuritaire, taille du jardin,
+    mcu_params), gardée sur disque pour être utilisée dès le démarrage suivant,
+    avant toute réponse du nuage. Les valeurs sont ensuite rafraîchies en arrière-plan.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self.values = self._read()
+
+    def _read(self) -> dict:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}  # Fichier corrompu : on repart des valeurs du nuage
+
+    def get(self, key: str):
+        return self.values.get(key)
+
+    def save(self, **values):
+        """Fusionne et réécrit le fichier (atomique), seulement si quelque chose a changé."""
+        with self._lock:
+            if all(self.values.get(k) == v for k, v in values.items()):
+                return
+            self.values = {**self.values, **values, "saved_at": time.time()}
+            if not self.path:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.values, f)
+            os.replace(tmp, self.path)
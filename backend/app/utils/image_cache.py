@@ -0,0 +1,99 @@
+# app/utils/image_cache.py
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow est optionnel : sans lui, pas de vignettes
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+
+class ImageCache:
+    """
+    Cache disque des photos du robot, borné en octets et évincé dans l'ordre LRU.
+    Chaque photo est stockée sous `{id}.jpg`, avec sa vignette `{id}_thumb.jpg`
+    quand Pillow est installé.
+    """
+
+    def __init__(self, directory: str = "app/cache/images", max_bytes: int = 200 * 1024 * 1024,
+                 thumbnail_size=(320, 240)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.thumbnail_size = thumbnail_size
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        # Reprend les fichiers existants, les plus anciens (accès) en premier
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((stat.st_atime, name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._files.values())
+
+    def path(self, image_id, thumbnail: bool = False) -> Optional[str]:
+        name = f"{image_id}_thumb.jpg" if thumbnail else f"{image_id}.jpg"
+        with self._lock:
+            if name not in self._files:
+                return None
+            self._files.move_to_end(name)
+        return os.path.join(self.directory, name)
+
+    def has(self, image_id) -> bool:
+        return f"{image_id}.jpg" in self._files
+
+    def store(self, image_id, data: bytes):
+        self._write(f"{image_id}.jpg", data)
+        thumbnail = self._make_thumbnail(data)
+        if thumbnail is not None:
+            self._write(f"{image_id}_thumb.jpg", thumbnail)
+        self._evict()
+
+    def _write(self, name: str, data: bytes):
+        path = os.path.join(self.directory, name)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._files[name] = len(data)
+            self._files.move_to_end(name)
+
+    def _make_thumbnail(self, data: bytes) -> Optional[bytes]:
+        if Image is None:
+            return None
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                img.thumbnail(self.thumbnail_size)
+                out = io.BytesIO()
+                img.convert("RGB").save(out, format="JPEG", quality=80)
+                return out.getvalue()
+        except Exception as e:
+            logger.warning("Thumbnail generation failed", extra={"error": str(e)})
+            return None
+
+    def _evict(self):
+        with self._lock:
+            total = sum(self._files.values())
+            while total > self.max_bytes and len(self._files) > 1:
+                name, size = self._files.popitem(last=False)
+                total -= size
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,84 @@
+# app/utils/log_buffer.py
+import json
+import threading
+from collections import deque
+from typing import Iterable, List, Optional
+
+
+class LogBuffer:
+    """
+    Tampon circulaire des journaux du robot, borné en mémoire (octets) et en nombre.
+    Alimenté par le sujet MQTT `bot/<id>/logs` et amorcé une fois depuis l'API Web.
+    Les plus anciens journaux sont évincés en premier.
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024, max_entries: int = 5000):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = deque()  # (created_at, taille, journal), du plus ancien au plus récent
+        self._keys = set()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.seeded = False
+
+    @staticmethod
+    def _key(log: dict):
+        return (log.get("created_at"), log.get("message"))
+
+    @staticmethod
+    def _size(log: dict) -> int:
+        return len(json.dumps(log, separators=(",", ":")))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def append(self, log: dict):
+        key = self._key(log)
+        with self._lock:
+            if key in self._keys:
+                return
+            created_at = log.get("created_at") or 0
+            entry = (created_at, self._size(log), log)
+            if self._entries and created_at < self._entries[-1][0]:
+                # Arrivé en retard : on l'insère à sa place (rare, petit décalage)
+                index = len(self._entries)
+                while index > 0 and self._entries[index - 1][0] > created_at:
+                    index -= 1
+                self._entries.insert(index, entry)
+            else:
+                self._entries.append(entry)
+            self._keys.add(key)
+            self._bytes += entry[1]
+            self._trim()
+
+    def extend(self, logs: Iterable[dict]):
+        for log in sorted(logs, key=lambda l: l.get("created_at") or 0):
+            self.append(log)
+
+    def _trim(self):
+        while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+            _, size, log = self._entries.popleft()
+            self._bytes -= size
+            self._keys.discard(self._key(log))
+
+    def query(self, since: Optional[float] = None, limit: Optional[int] = None,
+              types: Optional[List[str]] = None, verbosity: Optional[int] = None) -> List[dict]:
+        """Journaux du plus récent au plus ancien, filtrés par date, type et verbosité maximale."""
+        wanted = set(types) if types else None
+        result = []
+        with self._lock:
+            for created_at, _, log in reversed(self._entries):
+                if since is not None and created_at <= since:
+                    break
+                if wanted is not None and log.get("type") not in wanted:
+                    continue
+                if verbosity is not None and (log.get("verbosity") or 0) > verbosity:
+                    continue
+                result.append(log)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
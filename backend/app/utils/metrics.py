@@ -0,0 +1,239 @@
+# app/utils/metrics.py
+"""
+Métriques au format texte Prometheus, servies par /metrics.
+
+Volontairement minimal (aucune dépendance) : compteurs, jauges et histogrammes à
+étiquettes. Sur les chemins chauds, une mesure coûte une recherche dans un dict et
+une petite section critique (les threads MQTT et la boucle asyncio écrivent en même temps).
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Secondes : de la requête servie depuis la mémoire au mouvement complet du portique
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._default = self._children[()] = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Série pour ces valeurs d'étiquettes (créée au premier usage)."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, _labels(self.label_names, values),
+                                      self.label_names, values))
+        return lines
+
+
+class _Value:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def render(self, name, labels, label_names, values):
+        return [f"{name}{labels} {_number(self.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+
+class _Buckets:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self):
+        return _Timer(self)
+
+    def render(self, name, labels, label_names, values):
+        with self._lock:
+            counts, total_sum = list(self.counts), self.sum
+        lines, cumulative = [], 0
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            cumulative += count
+            le = _labels(label_names, values, f'le="{_number(bound)}"')
+            lines.append(f"{name}_bucket{le} {cumulative}")
+        lines.append(f"{name}_sum{labels} {_number(total_sum)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, target: _Buckets):
+        self.target = target
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.target.observe(time.perf_counter() - self.started)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Iterable[str] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labels)
+
+    def _new_child(self):
+        return _Buckets(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+
+# Une série lue au moment de la collecte : (nom, aide, type, [(étiquettes, valeur), ...])
+Sample = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        # Un module rechargé (uvicorn --reload) retrouve sa métrique au lieu d'en créer une deuxième
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def collector(self, collect: Callable[[], Iterable[Sample]]):
+        """Valeurs calculées à chaque lecture de /metrics (taille des files, sessions ouvertes, ...)."""
+        self._collectors.append(collect)
+        return collect
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        for collect in self._collectors:
+            for name, help, kind, samples in collect():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    names = tuple(labels)
+                    lines.append(f"{name}{_labels(names, tuple(labels[n] for n in names))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.histogram(
+    "farmbot_http_request_seconds", "Durée des requêtes HTTP servies, par route", ("method", "route", "status"))
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI pur (pas de BaseHTTPMiddleware : rien n'est mis en tampon) qui mesure
+    chaque requête HTTP. L'étiquette est le gabarit de la route ("/devices/{device_id}/move"),
+    jamais le chemin brut, pour garder un nombre de séries borné.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "other"
+            HTTP_REQUESTS.labels(scope["method"], template, str(status[0])).observe(time.perf_counter() - started)
@@ -0,0 +1,127 @@
+import math
+from typing import Dict, Optional, Tuple
+
+AXES = ("x", "y", "z")
+
+# Valeurs par défaut du firmware, utilisées tant qu'aucun statut MQTT n'a été reçu
+DEFAULT_PARAMS = {
+    "movement_max_spd_x": 400.0, "movement_max_spd_y": 400.0, "movement_max_spd_z": 400.0,
+    "movement_min_spd_x": 50.0, "movement_min_spd_y": 50.0, "movement_min_spd_z": 50.0,
+    "movement_steps_acc_dec_x": 300.0, "movement_steps_acc_dec_y": 300.0, "movement_steps_acc_dec_z": 300.0,
+    "movement_step_per_mm_x": 5.0, "movement_step_per_mm_y": 5.0, "movement_step_per_mm_z": 25.0,
+}
+
+PARAM_NAMES = tuple(sorted(DEFAULT_PARAMS))
+
+
+def _coord(position: dict, axis: str) -> float:
+    # Position inconnue (statut {"x": None, ...}) : comptée depuis l'origine
+    value = position.get(axis)
+    return 0.0 if value is None else value
+
+
+class AxisProfile:
+    """
+    Profil trapézoïdal d'un axe, en pas : accélération constante de min_spd à max_spd
+    sur `acc_steps` pas, vitesse de croisière, puis décélération symétrique.
+    """
+
+    def __init__(self, max_spd: float, min_spd: float, acc_steps: float, steps_per_mm: float):
+        self.max_spd = max(max_spd, 1.0)
+        self.min_spd = min(max(min_spd, 1.0), self.max_spd)
+        self.acc_steps = max(acc_steps, 0.0)
+        self.steps_per_mm = steps_per_mm or 1.0
+        if self.acc_steps > 0 and self.max_spd > self.min_spd:
+            self.accel = (self.max_spd ** 2 - self.min_spd ** 2) / (2 * self.acc_steps)
+        else:
+            self.accel = math.inf
+
+    def duration(self, distance_mm: float, speed_pct: float = 100) -> float:
+        steps = abs(distance_mm) * self.steps_per_mm
+        if steps == 0:
+            return 0.0
+
+        v_max = max(self.max_spd * speed_pct / 100, self.min_spd)
+        v_min = self.min_spd
+        if self.accel == math.inf or v_max <= v_min:
+            return steps / v_max
+
+        ramp_steps = (v_max ** 2 - v_min ** 2) / (2 * self.accel)
+        if steps >= 2 * ramp_steps:
+            # Trapèze : accélération, croisière, décélération
+            ramp_time = (v_max - v_min) / self.accel
+            return 2 * ramp_time + (steps - 2 * ramp_steps) / v_max
+
+        # Triangle : le mouvement est trop court pour atteindre la vitesse max
+        v_peak = math.sqrt(v_min ** 2 + self.accel * steps)
+        return 2 * (v_peak - v_min) / self.accel
+
+
+class MotionModel:
+    """
+    Estime la durée des déplacements à partir des mcu_params du firmware.
+    Les axes X et Y bougent en même temps; un déplacement 'safe_z' monte,
+    traverse puis redescend.
+    """
+
+    def __init__(self, params: Optional[Dict[str, float]] = None):
+        merged = dict(DEFAULT_PARAMS)
+        for name in PARAM_NAMES:
+            value = (params or {}).get(name)
+            if value is not None:
+                merged[name] = float(value)
+        self.params = merged
+        self.axes = {
+            axis: AxisProfile(
+                merged[f"movement_max_spd_{axis}"],
+                merged[f"movement_min_spd_{axis}"],
+                merged[f"movement_steps_acc_dec_{axis}"],
+                merged[f"movement_step_per_mm_{axis}"],
+            )
+            for axis in AXES
+        }
+
+    @staticmethod
+    def params_key(params: Optional[dict]) -> Tuple:
+        params = params or {}
+        return tuple(params.get(name) for name in PARAM_NAMES)
+
+    def axis_time(self, axis: str, distance_mm: float, speed_pct: float = 100) -> float:
+        return self.axes[axis].duration(distance_mm, speed_pct)
+
+    def xy_time(self, a, b, speed_pct: float = 100) -> float:
+        return max(
+            self.axis_time("x", b[0] - a[0], speed_pct),
+            self.axis_time("y", b[1] - a[1], speed_pct),
+        )
+
+    def move_time(self, start: dict, end: dict, safe_z: Optional[float] = None, speed_pct: float = 100) -> float:
+        """
+        Durée (s) d'un déplacement entre deux positions {"x", "y", "z"}.
+        Si `safe_z` est donné : montée à safe_z, déplacement XY, descente vers z final.
+        """
+        target = {axis: end.get(axis) if end.get(axis) is not None else _coord(start, axis) for axis in AXES}
+        xy = self.xy_time((_coord(start, "x"), _coord(start, "y")), (target["x"], target["y"]), speed_pct)
+
+        z0 = _coord(start, "z")
+        if safe_z is None:
+            return max(xy, self.axis_time("z", target["z"] - z0, speed_pct))
+
+        up = self.axis_time("z", safe_z - z0, speed_pct)
+        down = self.axis_time("z", target["z"] - safe_z, speed_pct)
+        return up + xy + down
+
+    def plan_time(self, waypoints, start: dict, speed_pct: float = 100) -> dict:
+        """Durée de chaque segment d'un plan et durée totale."""
+        segments = []
+        current = dict(start)
+        for waypoint in waypoints:
+            duration = self.move_time(current, waypoint, waypoint.get("safe_z"), speed_pct)
+            segments.append(round(duration, 3))
+            current = {axis: waypoint.get(axis) if waypoint.get(axis) is not None else _coord(current, axis)
+                       for axis in AXES}
+        return {"segments": segments, "total": round(sum(segments), 3)}
+
+    def timeout_for(self, duration: float, factor: float = 1.5, margin: float = 5.0) -> float:
+        """Délai d'attente adapté à la durée prévue d'un mouvement."""
+        return duration * factor + margin
@@ -1,9 +1,21 @@
 # app/utils/mqtt_client.py
 import json
+import time
 import paho.mqtt.client as mqtt
 
+from app.utils.metrics import REGISTRY
+
+MQTT_MESSAGES = REGISTRY.counter("farmbot_mqtt_messages_total", "Messages MQTT reçus", ("topic",))
+MQTT_PAYLOAD = REGISTRY.histogram(
+    "farmbot_mqtt_payload_bytes", "Taille des messages MQTT reçus", ("topic",),
+    buckets=(256, 1024, 2048, 4096, 8192, 16384, 65536, 262144))
+MQTT_INGEST_LAG = REGISTRY.histogram(
+    "farmbot_mqtt_ingest_lag_seconds", "Attente entre la réception par paho et le début du traitement", ("topic",))
+MQTT_HANDLE = REGISTRY.histogram(
+    "farmbot_mqtt_handle_seconds", "Traitement d'un message MQTT (décodage + mise à jour de l'état)", ("topic",))
+
 class FarmbotMQTTClient:
-    def __init__(self, on_status=None, token_path="farmbot_authorization_token.json"):
+    def __init__(self, on_status=None, on_log=None, token_path="farmbot_authorization_token.json"):
         with open(token_path, "r") as f:
             token_data = json.load(f)
 
@@ -12,6 +24,7 @@ class FarmbotMQTTClient:
         self.password = token_data["token"]["encoded"]
         self.device_id = token_data["user"]["device_id"]
         self.on_status = on_status
+        self.on_log = on_log
 
         self.client = mqtt.Client()
         self.client.username_pw_set(self.username, self.password)
@@ -21,12 +34,26 @@ class FarmbotMQTTClient:
     def connect(self):
         self.client.connect(self.mqtt_host, 1883, 60)
         self.client.subscribe(f"bot/{self.username}/status")
+        self.client.subscribe(f"bot/{self.username}/logs")
         self.client.loop_start()
         self.connected = True
 
     def _on_message(self, client, userdata, msg):
-        if self.on_status:
+        started = time.monotonic()
+        topic = "logs" if msg.topic.endswith("/logs") else "status"
+        MQTT_MESSAGES.labels(topic).inc()
+        MQTT_PAYLOAD.labels(topic).observe(len(msg.payload))
+        # paho horodate chaque message à la réception (time.monotonic)
+        received = getattr(msg, "timestamp", None)
+        if received:
+            MQTT_INGEST_LAG.labels(topic).observe(max(started - received, 0.0))
+
+        if topic == "logs":
+            if self.on_log:
+                self.on_log(json.loads(msg.payload.decode()))
+        elif self.on_status:
             self.on_status(json.loads(msg.payload.decode()))
+        MQTT_HANDLE.labels(topic).observe(time.monotonic() - started)
 
     def stop(self):
         if self.connected:
@@ -0,0 +1,201 @@
+import itertools
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from app.utils.zones import ZoneManager
+
+Point = Tuple[float, float]
+
+# Vitesse par défaut (mm/s) : movement_max_spd 400 pas/s à 5 pas/mm
+DEFAULT_SPEED = 80.0
+# Temps (s) ajouté pour monter à la hauteur sécuritaire et redescendre autour d'une zone interdite
+DEFAULT_Z_HOP_TIME = 6.0
+
+
+class RoutePlanner:
+    """
+    Ordonne des points de passage pour minimiser le temps de déplacement total.
+
+    X et Y bougent en même temps : le coût d'un segment est le max des deux temps
+    d'axe (pas la distance euclidienne), plus un saut en Z quand il traverse une
+    zone interdite. Résolution exacte (Held-Karp) pour les petits ensembles, sinon
+    plus proche voisin puis améliorations 2-opt et Or-opt.
+    """
+
+    def __init__(self, zone_manager: Optional[ZoneManager] = None, speed_x: float = DEFAULT_SPEED,
+                 speed_y: float = DEFAULT_SPEED, z_hop_time: float = DEFAULT_Z_HOP_TIME,
+                 radius: float = 0.0, exact_limit: int = 9, time_budget: float = 0.5):
+        self.zone_manager = zone_manager
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+        self.z_hop_time = z_hop_time
+        self.radius = radius
+        self.exact_limit = exact_limit
+        self.time_budget = time_budget
+        # Fonction de durée d'un déplacement XY; remplaçable par un modèle cinématique
+        self.move_time: Callable[[Point, Point], float] = self._axis_time
+
+    def _axis_time(self, a: Point, b: Point) -> float:
+        return max(abs(b[0] - a[0]) / self.speed_x, abs(b[1] - a[1]) / self.speed_y)
+
+    def travel_cost(self, a: Point, b: Point) -> float:
+        cost = self.move_time(a, b)
+        if self.zone_manager is not None and self.zone_manager.forbidden_crossings(
+                a[0], a[1], b[0], b[1], self.radius):
+            cost += self.z_hop_time
+        return cost
+
+    def route_cost(self, points: Sequence[Point], start: Optional[Point] = None) -> float:
+        path = ([start] if start is not None else []) + list(points)
+        return sum(self.travel_cost(a, b) for a, b in zip(path, path[1:]))
+
+    def plan(self, points: Sequence[Point], start: Optional[Point] = None) -> dict:
+        """
+        Retourne l'ordre de visite (indices dans `points`), le coût estimé (s)
+        et le coût de l'ordre d'origine pour comparaison.
+        """
+        points = list(points)
+        n = len(points)
+        if n == 0:
+            return {"order": [], "cost": 0.0, "baseline_cost": 0.0, "method": "empty"}
+
+        # Le nœud 0 est le départ (position actuelle) s'il est connu
+        nodes = ([start] if start is not None else []) + points
+        offset = 1 if start is not None else 0
+        matrix = [
+            [0.0 if i == j else self.travel_cost(a, b) for j, b in enumerate(nodes)]
+            for i, a in enumerate(nodes)
+        ]
+
+        if n <= self.exact_limit:
+            order, method = self._held_karp(matrix, offset, n), "exact"
+        else:
+            order = self._nearest_neighbour(matrix, offset, n)
+            order = self._improve(matrix, offset, order)
+            method = "heuristic"
+
+        def cost_of(sequence):
+            path = ([0] if offset else []) + [i + offset for i in sequence]
+            return sum(matrix[a][b] for a, b in zip(path, path[1:]))
+
+        return {
+            "order": order,
+            "cost": round(cost_of(order), 3),
+            "baseline_cost": round(cost_of(range(n)), 3),
+            "method": method,
+        }
+
+    @staticmethod
+    def _held_karp(matrix, offset: int, n: int) -> List[int]:
+        # Chemin ouvert de coût minimal, départ fixé (nœud 0) si offset, sinon départ libre
+        full = (1 << n) - 1
+        best = {}
+        for i in range(n):
+            best[(1 << i, i)] = (matrix[0][i + offset] if offset else 0.0, None)
+
+        for size in range(2, n + 1):
+            for subset in itertools.combinations(range(n), size):
+                mask = 0
+                for i in subset:
+                    mask |= 1 << i
+                for last in subset:
+                    prev_mask = mask & ~(1 << last)
+                    candidates = (
+                        (best[(prev_mask, prev)][0] + matrix[prev + offset][last + offset], prev)
+                        for prev in subset if prev != last
+                    )
+                    best[(mask, last)] = min(candidates)
+
+        last = min(range(n), key=lambda i: best[(full, i)][0])
+        order, mask = [], full
+        while last is not None:
+            order.append(last)
+            _, prev = best[(mask, last)]
+            mask &= ~(1 << last)
+            last = prev
+        return order[::-1]
+
+    @staticmethod
+    def _nearest_neighbour(matrix, offset: int, n: int) -> List[int]:
+        remaining = set(range(n))
+        if offset:
+            current = 0
+        else:
+            first = 0
+            remaining.discard(first)
+            current = first
+        order = [] if offset else [0]
+        while remaining:
+            nxt = min(remaining, key=lambda i: matrix[current][i + offset])
+            remaining.discard(nxt)
+            order.append(nxt)
+            current = nxt + offset
+        return order
+
+    def _improve(self, matrix, offset: int, order: List[int]) -> List[int]:
+        deadline = time.perf_counter() + self.time_budget
+        # Nœuds du chemin dans la matrice; le départ (s'il existe) reste en tête
+        path = ([0] if offset else []) + [i + offset for i in order]
+        fixed = 1 if offset else 0
+
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = self._two_opt(matrix, path, fixed, deadline)
+            improved = self._or_opt(matrix, path, fixed, deadline) or improved
+
+        return [node - offset for node in path[fixed:]]
+
+    @staticmethod
+    def _two_opt(matrix, path: List[int], fixed: int, deadline: float) -> bool:
+        improved = False
+        n = len(path)
+        for i in range(fixed, n - 1):
+            if time.perf_counter() > deadline:
+                break
+            # Sans départ imposé, on peut aussi inverser le début du chemin (a = None)
+            a, b = (path[i - 1] if i > 0 else None), path[i]
+            for j in range(i + 1, n):
+                c = path[j]
+                d = path[j + 1] if j + 1 < n else None
+                before = (matrix[a][b] if a is not None else 0.0) + (matrix[c][d] if d is not None else 0.0)
+                after = (matrix[a][c] if a is not None else 0.0) + (matrix[b][d] if d is not None else 0.0)
+                if after < before - 1e-9:
+                    path[i:j + 1] = reversed(path[i:j + 1])
+                    b = path[i]
+                    improved = True
+        return improved
+
+    @staticmethod
+    def _or_opt(matrix, path: List[int], fixed: int, deadline: float) -> bool:
+        # Déplace des chaînes de 1 à 3 nœuds vers une meilleure position
+        improved = False
+        for length in (1, 2, 3):
+            i = max(fixed, 1)
+            while i + length <= len(path):
+                if time.perf_counter() > deadline:
+                    return improved
+                segment = path[i:i + length]
+                prev = path[i - 1]
+                nxt = path[i + length] if i + length < len(path) else None
+                removed_gain = matrix[prev][segment[0]] + (
+                    matrix[segment[-1]][nxt] - matrix[prev][nxt] if nxt is not None else 0.0)
+
+                rest = path[:i] + path[i + length:]
+                best_delta, best_pos = 0.0, None
+                for pos in range(max(fixed, 1), len(rest) + 1):
+                    if pos == i:
+                        continue
+                    left = rest[pos - 1]
+                    right = rest[pos] if pos < len(rest) else None
+                    insert_cost = matrix[left][segment[0]] + (
+                        matrix[segment[-1]][right] - matrix[left][right] if right is not None else 0.0)
+                    delta = insert_cost - removed_gain
+                    if delta < best_delta - 1e-9:
+                        best_delta, best_pos = delta, pos
+
+                if best_pos is not None:
+                    path[:] = rest[:best_pos] + segment + rest[best_pos:]
+                    improved = True
+                else:
+                    i += 1
+        return improved
@@ -0,0 +1,159 @@
+# app/utils/static_files.py
+"""
+Fichiers du kiosque (build Vite) servis depuis app/static :
+- variantes précompressées au build (`.br`, `.gz` à côté du fichier), choisies selon Accept-Encoding
+- fichiers à empreinte (assets/index-<empreinte>.js) : mis en cache un an, `immutable`
+- index.html : revalidé à chaque chargement (ETag / Last-Modified, réponse 304 sans corps)
+- requêtes partielles (Range, ex. bot.png) : servies par FileResponse, sur le fichier d'origine
+
+Précompression, après `npm run build` (brotli seulement si le paquet `brotli` est installé) :
+    python -m app.utils.static_files ../frontend/farmbot-kiosk-frontend/dist
+"""
+import gzip
+import os
+import re
+import sys
+from mimetypes import guess_type
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel : sans lui, seulement les variantes gzip
+    brotli = None
+
+# Ordre de préférence quand le client accepte plusieurs encodages
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".ico", ".wasm"}
+MIN_COMPRESS_SIZE = 1024
+
+# Vite : assets/<nom>-<empreinte de 8 caractères>.<ext>
+HASHED_ASSET = re.compile(r"(^|/)assets/.+-[A-Za-z0-9_-]{8}\.\w+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+SHORT = "public, max-age=300"
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class KioskStaticFiles(StaticFiles):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (chemin, mtime, taille du fichier d'origine) -> variantes à jour; un nouveau build change la clé
+        self._variants: Dict[Tuple[str, float, int], List[Tuple[str, str, os.stat_result]]] = {}
+
+    @staticmethod
+    def _is_current(full_path: str, stat_result: os.stat_result, encoding: str, variant_path: str,
+                    variant_stat: os.stat_result) -> bool:
+        """Une variante d'un build précédent ne doit pas être servie à la place du nouveau fichier."""
+        decompress = {"gzip": gzip.decompress, "br": brotli.decompress if brotli else None}[encoding]
+        if decompress is None:
+            return variant_stat.st_mtime >= stat_result.st_mtime
+        # Les dates ne suffisent pas (git checkout, copie) : on compare le contenu, une fois par build
+        try:
+            with open(full_path, "rb") as original, open(variant_path, "rb") as variant:
+                return decompress(variant.read()) == original.read()
+        except (OSError, ValueError, EOFError) + ((brotli.error,) if brotli else ()):
+            return False
+
+    def _find_variants(self, full_path: str, stat_result: os.stat_result):
+        key = (full_path, stat_result.st_mtime, stat_result.st_size)
+        variants = self._variants.get(key)
+        if variants is None:
+            variants = []
+            for encoding, suffix in ENCODINGS:
+                try:
+                    variant_stat = os.stat(full_path + suffix)
+                except OSError:
+                    continue
+                if self._is_current(full_path, stat_result, encoding, full_path + suffix, variant_stat):
+                    variants.append((encoding, full_path + suffix, variant_stat))
+            self._variants[key] = variants
+        return variants
+
+    def cache_control(self, full_path: str) -> str:
+        if HASHED_ASSET.search(full_path.replace(os.sep, "/")):
+            return IMMUTABLE
+        if full_path.endswith(".html"):
+            return REVALIDATE
+        return SHORT
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope, status_code: int = 200):
+        request_headers = Headers(scope=scope)
+        headers = {"cache-control": self.cache_control(full_path)}
+        path, encoding = full_path, None
+
+        variants = self._find_variants(full_path, stat_result)
+        if variants:
+            headers["vary"] = "Accept-Encoding"
+            # Une plage porte sur les octets du fichier d'origine : pas de variante compressée
+            if "range" not in request_headers:
+                accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+                for variant_encoding, variant_path, variant_stat in variants:
+                    if variant_encoding in accepted:
+                        path, encoding, stat_result = variant_path, variant_encoding, variant_stat
+                        headers["content-encoding"] = encoding
+                        break
+
+        # L'ETag vient du fichier servi : chaque variante a le sien
+        response = FileResponse(path, status_code=status_code, headers=headers,
+                                media_type=guess_type(full_path)[0] or "text/plain", stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def precompress(directory: str, min_size: int = MIN_COMPRESS_SIZE) -> List[Tuple[str, int, dict]]:
+    """Écrit les variantes .gz (et .br) des fichiers texte du build. Retourne (fichier, taille, tailles compressées)."""
+    written = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if os.path.splitext(name)[1] not in COMPRESSIBLE:
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < min_size:
+                continue
+
+            compressed = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                compressed[".br"] = brotli.compress(data, quality=11)
+            sizes = {}
+            for suffix, body in compressed.items():
+                if len(body) >= len(data):
+                    continue  # Rien à gagner : le fichier d'origine sera servi
+                with open(path + suffix, "wb") as f:
+                    f.write(body)
+                sizes[suffix] = len(body)
+            written.append((os.path.relpath(path, directory), len(data), sizes))
+    return written
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    directory = argv[0] if argv else "app/static"
+    for name, size, sizes in precompress(directory):
+        variants = ", ".join(f"{suffix} {compressed} o" for suffix, compressed in sizes.items())
+        print(f"{name}: {size} o -> {variants or 'non compressé'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# app/utils/status_broadcaster.py
+import asyncio
+import threading
+from typing import Optional
+
+
+class StatusSubscription:
+    """
+    Abonnement d'un client (kiosque) au flux de statut.
+
+    Le client ne reçoit que les champs qui ont changé depuis son dernier envoi.
+    Les mises à jour qui arrivent pendant qu'il est occupé sont fusionnées dans
+    `_pending`, donc un client lent ne fait jamais grossir une file : il reçoit
+    simplement un seul delta plus gros au prochain envoi.
+    """
+
+    def __init__(self, broadcaster: "StatusBroadcaster", snapshot: dict):
+        self.broadcaster = broadcaster
+        self._state = dict(snapshot)
+        self._pending = dict(snapshot)
+        self._event = asyncio.Event()
+        self.first = True
+        if self._pending:
+            self._event.set()
+
+    def offer(self, summary: dict):
+        changed = False
+        for key, value in summary.items():
+            if key not in self._state or self._state[key] != value:
+                self._state[key] = value
+                self._pending[key] = value
+                changed = True
+        if changed:
+            self._event.set()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Attend le prochain delta. Retourne None si rien n'a changé avant `timeout`
+        (utile pour envoyer un keep-alive).
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        # Laisse les rafales MQTT se regrouper en un seul message
+        if self.broadcaster.coalesce_interval > 0:
+            await asyncio.sleep(self.broadcaster.coalesce_interval)
+
+        self._event.clear()
+        delta, self._pending = self._pending, {}
+        first, self.first = self.first, False
+        return {"type": "snapshot" if first else "delta", "data": delta}
+
+    def close(self):
+        self.broadcaster.unsubscribe(self)
+
+
+class StatusBroadcaster:
+    """
+    Diffuse les mises à jour de statut MQTT à tous les clients connectés.
+
+    `publish` est appelé depuis le thread paho-mqtt; la diffusion est renvoyée
+    vers la boucle asyncio du serveur avec `call_soon_threadsafe`.
+    """
+
+    def __init__(self, coalesce_interval: float = 0.05, send_timeout: float = 5.0):
+        self.coalesce_interval = coalesce_interval
+        self.send_timeout = send_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers = set()
+        self._snapshot = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, summary: dict):
+        with self._lock:
+            self._snapshot = summary
+            has_subscribers = bool(self._subscribers)
+        loop = self._loop
+        if loop is None or loop.is_closed() or not has_subscribers:
+            return
+        try:
+            loop.call_soon_threadsafe(self._fan_out, summary)
+        except RuntimeError:
+            pass  # La boucle est en train de s'arrêter
+
+    def _fan_out(self, summary: dict):
+        for subscription in list(self._subscribers):
+            subscription.offer(summary)
+
+    def subscribe(self) -> StatusSubscription:
+        self._loop = asyncio.get_running_loop()
+        with self._lock:
+            subscription = StatusSubscription(self, self._snapshot)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: StatusSubscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
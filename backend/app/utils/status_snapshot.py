@@ -0,0 +1,65 @@
+# app/utils/status_snapshot.py
+import json
+import threading
+import uuid
+from collections import deque
+from typing import Optional
+
+
+class StatusSnapshot:
+    """
+    Dernier résumé de statut visible par les kiosques, avec :
+    - un numéro de version incrémenté seulement quand un champ visible change
+    - le JSON déjà sérialisé (servi tel quel par /live_status)
+    - un ETag pour répondre 304 aux requêtes dont le statut n'a pas changé
+    - un historique borné des deltas ("qu'est-ce qui a changé depuis la version N")
+    """
+
+    def __init__(self, history: int = 256):
+        # Identifiant de démarrage : un ETag d'un processus précédent ne peut pas correspondre
+        self._boot = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._changes = deque(maxlen=history)
+        self.version = 0
+        self.summary = {}
+        self.body = b"{}"
+        self.etag = self._make_etag()
+
+    def _make_etag(self) -> str:
+        return f'"{self._boot}-{self.version}"'
+
+    def update(self, summary: dict) -> Optional[dict]:
+        """Retourne le delta si un champ a changé, sinon None (rien n'est re-sérialisé)."""
+        with self._lock:
+            delta = {k: v for k, v in summary.items() if k not in self.summary or self.summary[k] != v}
+            if not delta:
+                return None
+            self.version += 1
+            self.summary = summary
+            self.body = json.dumps(summary).encode()
+            self.etag = self._make_etag()
+            self._changes.append((self.version, delta))
+            return delta
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return self.etag in tags or "*" in tags
+
+    def changes_since(self, version: int) -> dict:
+        """
+        Delta fusionné depuis `version`. Si l'historique ne remonte pas assez loin,
+        retourne le résumé complet avec full=True.
+        """
+        with self._lock:
+            if version >= self.version:
+                return {"version": self.version, "full": False, "changes": {}}
+            oldest = self._changes[0][0] if self._changes else self.version + 1
+            if version < oldest - 1:
+                return {"version": self.version, "full": True, "changes": dict(self.summary)}
+            merged = {}
+            for change_version, delta in self._changes:
+                if change_version > version:
+                    merged.update(delta)
+            return {"version": self.version, "full": False, "changes": merged}
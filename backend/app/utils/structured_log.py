@@ -0,0 +1,231 @@
+# app/utils/structured_log.py
+"""
+Journalisation structurée et non bloquante pour le backend.
+
+- les modules utilisent `logging.getLogger(__name__)` comme d'habitude
+- sur le chemin de la requête, un enregistrement est seulement filtré (niveau,
+  échantillonnage, limite de débit), enrichi des identifiants de corrélation
+  puis posé dans une file bornée : aucun formatage ni écriture
+- un thread (QueueListener) formate en JSON (une ligne par enregistrement) et écrit
+- file pleine : l'enregistrement est abandonné et compté, la requête n'attend jamais
+
+Configuration (variables d'environnement) :
+    FARMBOT_LOG_LEVEL     INFO (défaut), DEBUG, WARNING, ...
+    FARMBOT_LOG_FORMAT    json (défaut) ou text
+    FARMBOT_LOG_SAMPLING  fraction gardée des DEBUG/INFO par module,
+                          ex. "app.services.farmbot_service=0.1,app.utils.cache=0.5"
+    FARMBOT_LOG_RATE      enregistrements DEBUG/INFO/WARNING max par seconde et par module (défaut 50)
+"""
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from app.utils.metrics import REGISTRY
+
+LOG_QUEUE_SIZE = 10000
+
+# Identifiants de corrélation : requête HTTP en cours et commande de mouvement en cours
+REQUEST_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+MOVE_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("move_id", default=None)
+
+LOG_DROPPED = REGISTRY.counter(
+    "farmbot_log_dropped_total", "Journaux abandonnés (échantillonnage, limite de débit, file pleine)", ("reason",))
+
+# Attributs standard d'un LogRecord : tout le reste vient de `extra=` et va dans le JSON
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+_CONTEXT_ATTRS = ("request_id", "move_id")
+
+
+def new_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+class ContextFilter(logging.Filter):
+    """Copie les identifiants de corrélation dans l'enregistrement (dans le thread appelant)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = REQUEST_ID.get()
+        record.move_id = MOVE_ID.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Échantillonnage et limite de débit par module. WARNING et plus ne sont jamais
+    échantillonnés; ERROR et plus ne sont jamais limités.
+    """
+
+    def __init__(self, sampling: Dict[str, float], rate: float):
+        super().__init__()
+        self.sampling = sampling
+        self.rate = rate
+        self._buckets: Dict[str, list] = {}  # module -> [jetons, dernière recharge]
+        self._lock = threading.Lock()
+
+    def _sample_rate(self, name: str) -> float:
+        # Le réglage le plus précis gagne : "app.services" couvre "app.services.farmbot_service"
+        while name:
+            if name in self.sampling:
+                return self.sampling[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        if record.levelno < logging.WARNING:
+            fraction = self._sample_rate(record.name)
+            if fraction < 1.0 and random.random() >= fraction:
+                LOG_DROPPED.labels("sampled").inc()
+                return False
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(record.name, [self.rate, now])
+            bucket[0] = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                LOG_DROPPED.labels("rate_limited").inc()
+                return False
+            bucket[0] -= 1.0
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Pas de formatage ici (QueueHandler formate par défaut dans le thread appelant) :
+        # le message et la trace sont construits par le thread d'écriture
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.labels("queue_full").inc()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in _CONTEXT_ATTRS:
+            value = getattr(record, key, None)
+            if value:
+                entry[key] = value
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in _CONTEXT_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Lisible en développement : message, puis les champs structurés en clé=valeur."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = {k: v for k, v in vars(record).items()
+                  if k not in _RECORD_ATTRS and v is not None}
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+def _parse_sampling(value: str) -> Dict[str, float]:
+    sampling = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, fraction = item.partition("=")
+        sampling[name.strip()] = float(fraction)
+    return sampling
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None,
+                      sampling: Optional[Dict[str, float]] = None, rate: Optional[float] = None,
+                      stream=None):
+    """Installe la file et le thread d'écriture sur le logger "app" (les journaux d'uvicorn ne changent pas)."""
+    global _listener
+    if _listener is not None:
+        return
+    level = level or os.getenv("FARMBOT_LOG_LEVEL", "INFO")
+    fmt = fmt or os.getenv("FARMBOT_LOG_FORMAT", "json")
+    sampling = sampling if sampling is not None else _parse_sampling(os.getenv("FARMBOT_LOG_SAMPLING", ""))
+    rate = rate if rate is not None else float(os.getenv("FARMBOT_LOG_RATE", "50"))
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    handler = NonBlockingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    handler.addFilter(SamplingFilter(sampling, rate))
+    handler.addFilter(ContextFilter())
+
+    logger = logging.getLogger("app")
+    logger.setLevel(level.upper())
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Vide la file (les derniers journaux sont écrits) et arrête le thread d'écriture."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """
+    Middleware ASGI : chaque requête reçoit un identifiant (en-tête X-Request-Id du client
+    ou nouveau), présent dans tous ses journaux et renvoyé dans la réponse.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+        request_id = request_id or new_id()
+        token = REQUEST_ID.set(request_id)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_ID.reset(token)
@@ -0,0 +1,177 @@
+# app/utils/web_api.py
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from app.utils.metrics import REGISTRY
+
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "farmbot_webapi_requests_total", "Appels à l'API Web FarmBot (nouveaux essais compris)", ("endpoint", "method", "status"))
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    "farmbot_webapi_request_seconds", "Durée des appels à l'API Web FarmBot", ("endpoint", "method"))
+UPSTREAM_COALESCED = REGISTRY.counter(
+    "farmbot_webapi_coalesced_total", "GET servis par un appel identique déjà en cours", ("endpoint",))
+
+
+class WebAPIError(Exception):
+    def __init__(self, status_code: Optional[int], message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# Rejouer ces méthodes ne change rien côté serveur; un POST (ou PATCH) qui a peut-être été
+# traité n'est rejoué que si le serveur l'a refusé (429) ou n'a jamais été joint
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class WebAPIClient:
+    """
+    Client asynchrone pour l'API Web FarmBot (my.farm.bot).
+
+    - une seule connexion keep-alive partagée (pool httpx)
+    - nombre limité de requêtes simultanées vers le serveur
+    - nouvel essai avec délai exponentiel + aléa (borné à `max_backoff`) : sur 429 / 5xx /
+      erreurs réseau pour les méthodes idempotentes, sur 429 ou connexion impossible sinon
+    - 'single-flight' : N GET identiques en même temps => un seul appel au serveur
+    """
+
+    def __init__(self, token: dict, max_concurrency: int = 6, max_connections: int = 10,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0, timeout: float = 15.0,
+                 base_url: Optional[str] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        iss = token["token"]["unencoded"]["iss"]  # ex. "//my.farm.bot:443"
+        self.base_url = base_url or f"https:{iss}/api/"
+        self.transport = transport  # ex. httpx.ASGITransport vers une fausse API Web locale
+        self.headers = {
+            "authorization": token["token"]["encoded"],
+            "content-type": "application/json",
+        }
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._download_client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight = {}
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        # Créé à la première utilisation, dans la boucle asyncio du serveur
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(max_connections=self.max_connections,
+                                  max_keepalive_connections=self.max_connections)
+            self._client = httpx.AsyncClient(base_url=self.base_url, headers=self.headers,
+                                             limits=limits, timeout=self.timeout, transport=self.transport)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    @staticmethod
+    def _path(endpoint: str, database_id=None) -> str:
+        return endpoint if database_id is None else f"{endpoint}/{database_id}"
+
+    async def get(self, endpoint: str, database_id=None, params: Optional[dict] = None):
+        path = self._path(endpoint, database_id)
+        key = (path, tuple(sorted((params or {}).items())))
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced_calls += 1
+            UPSTREAM_COALESCED.labels(endpoint).inc()
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(self.request("GET", path, params=params))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def post(self, endpoint: str, payload: Optional[dict] = None):
+        return await self.request("POST", endpoint, json=payload)
+
+    async def patch(self, endpoint: str, payload: dict, database_id=None):
+        return await self.request("PATCH", self._path(endpoint, database_id), json=payload)
+
+    async def delete(self, endpoint: str, database_id=None):
+        return await self.request("DELETE", self._path(endpoint, database_id))
+
+    async def request(self, method: str, path: str, json=None, params: Optional[dict] = None):
+        client = self._ensure_client()
+        endpoint = path.split("/", 1)[0]  # "images/123" -> "images" : une série par ressource
+        latency = UPSTREAM_LATENCY.labels(endpoint, method)
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    self.upstream_calls += 1
+                    started = time.perf_counter()
+                    try:
+                        response = await client.request(method, path, json=json, params=params)
+                    finally:
+                        latency.observe(time.perf_counter() - started)
+            except httpx.TransportError as e:
+                UPSTREAM_REQUESTS.labels(endpoint, method, "error").inc()
+                error = WebAPIError(None, f"{method} {path}: {e}")
+                retry = method in IDEMPOTENT_METHODS or isinstance(e, NOT_SENT_ERRORS)
+            else:
+                UPSTREAM_REQUESTS.labels(endpoint, method, str(response.status_code)).inc()
+                if response.status_code < 400:
+                    return response.json() if response.content else None
+                error = WebAPIError(response.status_code, f"{method} {path}: HTTP {response.status_code} {response.text[:200]}")
+                retry = response.status_code == 429 or (
+                    method in IDEMPOTENT_METHODS and response.status_code in RETRY_STATUS)
+                retry_after = response.headers.get("retry-after")
+
+            if not retry or attempt >= self.retries:
+                raise error
+            await asyncio.sleep(self._delay(attempt, retry_after))
+            attempt += 1
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        seconds = self._parse_retry_after(retry_after) if retry_after is not None else None
+        if seconds is None:
+            # Délai exponentiel avec aléa complet pour ne pas synchroniser les clients
+            seconds = random.uniform(0, self.backoff * (2 ** attempt))
+        return min(max(seconds, 0.0), self.max_backoff)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Retry-After : un nombre de secondes ou une date HTTP."""
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    async def download(self, url: str) -> bytes:
+        """
+        Télécharge un fichier (ex. attachment_url d'une photo). Client séparé : le jeton
+        de l'API ne doit pas être envoyé au stockage externe.
+        """
+        if self._download_client is None or self._download_client.is_closed:
+            self._download_client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True,
+                                                      transport=self.transport)
+        response = await self._download_client.get(url)
+        if response.status_code >= 400:
+            raise WebAPIError(response.status_code, f"GET {url}: HTTP {response.status_code}")
+        return response.content
+
+    async def aclose(self):
+        for client in (self._client, self._download_client):
+            if client is not None:
+                await client.aclose()
+        self._client = None
+        self._download_client = None
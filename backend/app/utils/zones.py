@@ -1,5 +1,6 @@
 import json
-from typing import List, Optional
+import math
+from typing import Iterable, List, Optional, Tuple
 
 
 class Zone:
@@ -15,6 +16,15 @@ class Zone:
     def contains(self, x: float, y: float) -> bool:
         return self.x1 <= x <= self.x2 and self.y1 <= y <= self.y2
 
+    def segment_interval(self, x0: float, y0: float, x1: float, y1: float,
+                         radius: float = 0.0) -> Optional[Tuple[float, float]]:
+        """
+        Intersection exacte du segment (x0, y0) -> (x1, y1) avec la zone, en tenant compte
+        d'une tête d'outil circulaire de rayon `radius`.
+        Retourne (t_entree, t_sortie) dans [0, 1], ou None si le segment ne touche pas la zone.
+        """
+        return _sweep_segment(x0, y0, x1, y1, self.x1, self.y1, self.x2, self.y2, radius)
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -39,12 +49,83 @@ class Zone:
         )
 
 
+def _clip_segment(x0, y0, x1, y1, xmin, ymin, xmax, ymax) -> Optional[Tuple[float, float]]:
+    dx = x1 - x0
+    dy = y1 - y0
+    t_enter, t_exit = 0.0, 1.0
+    for p, q in ((-dx, x0 - xmin), (dx, xmax - x0), (-dy, y0 - ymin), (dy, ymax - y0)):
+        if p == 0:
+            if q < 0:
+                return None  # parallèle à ce bord et à l'extérieur
+            continue
+        t = q / p
+        if p < 0:
+            if t > t_exit:
+                return None
+            t_enter = max(t_enter, t)
+        else:
+            if t < t_enter:
+                return None
+            t_exit = min(t_exit, t)
+    return t_enter, t_exit
+
+
+def _clip_circle(x0, y0, dx, dy, cx, cy, r) -> Optional[Tuple[float, float]]:
+    fx = x0 - cx
+    fy = y0 - cy
+    a = dx * dx + dy * dy
+    c = fx * fx + fy * fy - r * r
+    if a == 0:
+        return (0.0, 1.0) if c <= 0 else None
+    b = 2 * (fx * dx + fy * dy)
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+    root = math.sqrt(disc)
+    t_enter = max(0.0, (-b - root) / (2 * a))
+    t_exit = min(1.0, (-b + root) / (2 * a))
+    if t_enter > t_exit:
+        return None
+    return t_enter, t_exit
+
+
+def _sweep_segment(x0, y0, x1, y1, xmin, ymin, xmax, ymax, radius=0.0) -> Optional[Tuple[float, float]]:
+    """
+    Segment contre le rectangle grossi de `radius` (somme de Minkowski : rectangle aux
+    coins arrondis). Cette forme est convexe, donc l'intersection est un seul intervalle :
+    l'union des intervalles de ses morceaux (deux rectangles en croix + quatre disques).
+    """
+    if radius <= 0:
+        return _clip_segment(x0, y0, x1, y1, xmin, ymin, xmax, ymax)
+
+    dx = x1 - x0
+    dy = y1 - y0
+    pieces = [
+        _clip_segment(x0, y0, x1, y1, xmin - radius, ymin, xmax + radius, ymax),
+        _clip_segment(x0, y0, x1, y1, xmin, ymin - radius, xmax, ymax + radius),
+    ]
+    for cx, cy in ((xmin, ymin), (xmin, ymax), (xmax, ymin), (xmax, ymax)):
+        pieces.append(_clip_circle(x0, y0, dx, dy, cx, cy, radius))
+
+    hits = [p for p in pieces if p is not None]
+    if not hits:
+        return None
+    return min(p[0] for p in hits), max(p[1] for p in hits)
+
+
 class ZoneManager:
     def __init__(self, zones: Optional[List[Zone]] = None):
         self.zones = zones or []
+        self._build_index()
+
+    def _build_index(self):
+        # Table compacte des bornes, dans l'ordre de priorité de get_zone_at
+        self._bounds = [(z.x1, z.y1, z.x2, z.y2, z) for z in self.zones]
+        self._forbidden = [b for b in self._bounds if b[4].type == "forbidden"]
 
     def add_zone(self, zone: Zone):
         self.zones.append(zone)
+        self._build_index()
 
     def get_zone_at(self, x: float, y: float) -> Optional[Zone]:
         for zone in self.zones:
@@ -52,27 +133,108 @@ class ZoneManager:
                 return zone
         return None
 
-    def is_operation_allowed(self, x: float, y: float, z: float, action_type: str, safe_z: float) -> bool:
-        zone = self.get_zone_at(x, y)
+    def get_zones_at(self, points: Iterable[Tuple[float, float]]) -> List[Optional[Zone]]:
+        """
+        Version en lot de get_zone_at. Les bornes sont lues une fois par appel (table de
+        tuples plats) et un point hors du rectangle englobant de toutes les zones est
+        écarté sans parcourir la table.
+        """
+        bounds = self._bounds
+        if not bounds:
+            return [None for _ in points]
+        min_x = min(b[0] for b in bounds)
+        min_y = min(b[1] for b in bounds)
+        max_x = max(b[2] for b in bounds)
+        max_y = max(b[3] for b in bounds)
+        result = []
+        append = result.append
+        for x, y in points:
+            found = None
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                for x1, y1, x2, y2, zone in bounds:
+                    if x1 <= x <= x2 and y1 <= y <= y2:
+                        found = zone
+                        break
+            append(found)
+        return result
+
+    def forbidden_crossings(self, x0: float, y0: float, x1: float, y1: float,
+                            radius: float = 0.0) -> List[dict]:
+        """
+        Zones interdites balayées par la tête d'outil (rayon `radius`) le long du segment,
+        triées par point d'entrée, avec les paramètres d'entrée/sortie.
+        """
+        crossings = []
+        for zx1, zy1, zx2, zy2, zone in self._forbidden:
+            interval = _sweep_segment(x0, y0, x1, y1, zx1, zy1, zx2, zy2, radius)
+            if interval is not None:
+                crossings.append({"zone": zone.id, "t_enter": interval[0], "t_exit": interval[1]})
+        crossings.sort(key=lambda c: c["t_enter"])
+        return crossings
+
+    def validate_plan(self, waypoints: List[dict], safe_z: float, action_type: str = "move",
+                      start: Optional[dict] = None, radius: float = 0.0) -> dict:
+        """
+        Valide un plan complet (liste de {"x", "y", "z"?}) avant de l'exécuter.
+
+        Pour chaque point : la zone d'arrivée, si l'opération y est permise et les zones
+        interdites traversées par le segment qui y mène (depuis `start` pour le premier).
+        """
+        zones = self.get_zones_at((w["x"], w["y"]) for w in waypoints)
+
+        results = []
+        previous = start
+        for index, (waypoint, zone) in enumerate(zip(waypoints, zones)):
+            x, y, z = waypoint["x"], waypoint["y"], waypoint.get("z")
+            allowed = self._is_allowed_in(zone, z, action_type, safe_z)
+
+            crossings = []
+            if previous is not None and previous.get("x") is not None and previous.get("y") is not None:
+                crossings = self.forbidden_crossings(previous["x"], previous["y"], x, y, radius)
+
+            results.append({
+                "index": index,
+                "x": x,
+                "y": y,
+                "z": z,
+                "zone": zone.id if zone else None,
+                "zone_type": zone.type if zone else None,
+                "allowed": allowed,
+                "crosses_forbidden": crossings,
+            })
+            previous = waypoint
+
+        return {
+            "valid": all(r["allowed"] for r in results),
+            "crossing_count": sum(1 for r in results if r["crosses_forbidden"]),
+            "waypoints": results,
+        }
+
+    @staticmethod
+    def _is_allowed_in(zone: Optional[Zone], z: Optional[float], action_type: str, safe_z: float) -> bool:
         if zone is None or zone.type == "allowed":
             return True
 
         if zone.type == "forbidden":
             if action_type in ("take_photo", "scan", "move"):
                 return True
-            if z > safe_z:
-                return True
-            return False
-        
+            return z is not None and z > safe_z
+
         if zone.type == "admin_only":
-            return False  # Could be extended to check permissions
-        
+            return False
+
         return True
 
+    def is_operation_allowed(self, x: float, y: float, z: float, action_type: str, safe_z: float) -> bool:
+        zone = self.get_zone_at(x, y)
+        # "admin_only" could be extended to check permissions
+        return self._is_allowed_in(zone, z, action_type, safe_z)
+
     def load_from_file(self, path: str):
         with open(path, "r") as f:
             data = json.load(f)
             self.zones = [Zone.from_dict(z) for z in data]
+        self._build_index()
 
     def save_to_file(self, path: str):
         with open(path, "w") as f:
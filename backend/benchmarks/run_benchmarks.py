@@ -0,0 +1,339 @@
+# benchmarks/run_benchmarks.py
+"""
+Banc d'essai de bout en bout : l'application réelle (uvicorn) branchée sur les doublures
+de benchmarks/standins.py, chargée par N kiosques simulés, plus des micro-bancs des
+chemins chauds (zones, ingestion des statuts MQTT) et un parcours complet de toutes les
+plantes sur le robot simulé, en temps accéléré.
+
+    cd backend
+    python -m benchmarks.run_benchmarks --kiosks 20 --duration 10 --output bench.json
+    python -m benchmarks.run_benchmarks --compare bench.json      # échoue (code 1) si régression
+
+Le résultat JSON contient le commit, la machine et, pour chaque point mesuré, p50 / p99 (ms)
+et le débit; --compare signale toute dégradation au-delà de --tolerance.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from app.services.simulator import simulated_service
+from benchmarks.standins import GARDEN, standin_service
+
+ENDPOINTS = ["/live_status", "/zones", "/logs", "/move"]
+
+# Sens de chaque mesure pour --compare : une latence qui monte ou un débit qui baisse est une régression
+LOWER_IS_BETTER = ("p50_ms", "p99_ms", "mean_ms", "ns_per_op", "error_rate", "wall_s", "simulated_s")
+HIGHER_IS_BETTER = ("rps", "ops_per_s")
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Percentile par rang le plus proche (liste déjà triée)."""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    total = len(ordered) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(1000 * sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(1000 * percentile(ordered, 50), 3),
+        "p99_ms": round(1000 * percentile(ordered, 99), 3),
+    }
+
+
+# === Charge HTTP : N kiosques ===
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class StandInServer:
+    """Backend lancé dans un processus séparé pour ne pas partager le GIL avec les kiosques."""
+
+    def __init__(self, port: int, speedup: float, status_hz: float, log_path: Optional[str] = None):
+        self.port = port
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.command = [sys.executable, "-m", "benchmarks.standins", "--port", str(port),
+                        "--speedup", str(speedup), "--status-hz", str(status_hz)]
+        self.log_path = log_path
+        self.process = None
+
+    def __enter__(self):
+        output = open(self.log_path, "w") if self.log_path else subprocess.DEVNULL
+        self.process = subprocess.Popen(self.command, stdout=output, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Le serveur s'est arrêté (code {self.process.returncode})")
+            try:
+                # Prêt quand la session du robot par défaut (ouverte au démarrage) est utilisable
+                if httpx.get(self.base_url + "/ready", timeout=1).status_code == 200:
+                    return self
+            except httpx.TransportError:
+                pass
+            time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError("Le serveur n'a pas démarré dans les 30 s")
+
+    def __exit__(self, exc_type, exc, tb):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def kiosk_request(endpoint: str, kiosk: int, rng: random.Random) -> Callable:
+    """Requête typique d'un kiosque pour chaque point d'accès mesuré."""
+    if endpoint == "/move":
+        def send(client, state):
+            params = {"x": rng.uniform(0, GARDEN["x"]), "y": rng.uniform(0, GARDEN["y"]),
+                      "client_id": f"kiosk-{kiosk}"}
+            return client.post("/move", params=params)
+    elif endpoint == "/live_status":
+        # Les kiosques interrogent avec If-None-Match : la plupart des réponses sont des 304
+        def send(client, state):
+            headers = {"If-None-Match": state["etag"]} if state.get("etag") else {}
+            return client.get("/live_status", headers=headers)
+    elif endpoint == "/logs":
+        def send(client, state):
+            return client.get("/logs", params={"limit": 50})
+    else:
+        def send(client, state):
+            return client.get(endpoint)
+    return send
+
+
+async def run_kiosk(base_url: str, endpoint: str, kiosk: int, stop_at: float, latencies: list, errors: list):
+    rng = random.Random(kiosk)
+    send = kiosk_request(endpoint, kiosk, rng)
+    state = {}
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                response = await send(client, state)
+            except httpx.HTTPError:
+                errors.append(1)
+                continue
+            elapsed = time.perf_counter() - started
+            if response.status_code >= 400:
+                errors.append(1)
+                continue
+            state["etag"] = response.headers.get("etag", state.get("etag"))
+            latencies.append(elapsed)
+
+
+async def load_endpoint(base_url: str, endpoint: str, kiosks: int, duration: float) -> dict:
+    latencies, errors = [], []
+    started = time.monotonic()
+    stop_at = started + duration
+    await asyncio.gather(*(run_kiosk(base_url, endpoint, k, stop_at, latencies, errors) for k in range(kiosks)))
+    return summarize(latencies, len(errors), time.monotonic() - started)
+
+
+def run_http(args) -> Dict[str, dict]:
+    results = {}
+    with StandInServer(free_port(), args.speedup, args.status_hz, args.server_log) as server:
+        for endpoint in args.endpoints:
+            # Courte chauffe (caches, connexions) avant la mesure
+            asyncio.run(load_endpoint(server.base_url, endpoint, min(args.kiosks, 2), args.warmup))
+            results[endpoint] = asyncio.run(load_endpoint(server.base_url, endpoint, args.kiosks, args.duration))
+            print(f"  {endpoint:<14} {format_http(results[endpoint])}", file=sys.stderr)
+    return results
+
+
+def format_http(r: dict) -> str:
+    return (f"{r['rps']:>9.1f} req/s  p50 {r['p50_ms']:>8.2f} ms  p99 {r['p99_ms']:>8.2f} ms"
+            f"  ({r['requests']} requêtes, {r['errors']} erreurs)")
+
+
+# === Micro-bancs ===
+def bench(fn: Callable[[int], None], min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Meilleure de `repeat` séries d'au moins `min_time` s; fn(i) exécute une opération."""
+    best = None
+    for _ in range(repeat):
+        count, started = 0, time.perf_counter()
+        while True:
+            for i in range(count, count + 1000):
+                fn(i)
+            count += 1000
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        per_op = elapsed / count
+        best = per_op if best is None else min(best, per_op)
+    return {"ns_per_op": round(best * 1e9, 1), "ops_per_s": round(1 / best, 1)}
+
+
+def run_micro(args) -> Dict[str, dict]:
+    # Service réel hors serveur (pas de boucle asyncio : l'ingestion suit le chemin du thread MQTT).
+    # start() n'est pas appelé : MQTT reste déconnecté, seuls les statuts injectés ci-dessous sont ingérés
+    service = standin_service(image_cache_dir=tempfile.mkdtemp(prefix="farmbot_images_"))
+
+    rng = random.Random(42)
+    points = [(rng.uniform(0, GARDEN["x"]), rng.uniform(0, GARDEN["y"])) for _ in range(4096)]
+    statuses = []
+    for i, (x, y) in enumerate(points):
+        status = service.fb.status()
+        status["location_data"]["position"] = {"x": x, "y": y, "z": 0.0}
+        status["informational_settings"]["busy"] = i % 2 == 0
+        statuses.append(status)
+    service._update_status(statuses[0])
+
+    results = {
+        "zone_manager.get_zone_at": bench(lambda i: service.zone_manager.get_zone_at(*points[i & 4095]),
+                                          args.min_time),
+        "would_cross_forbidden_zone": bench(lambda i: service.would_cross_forbidden_zone(*points[i & 4095]),
+                                            args.min_time),
+        "status_ingestion": bench(lambda i: service._update_status(statuses[i & 4095]), args.min_time),
+    }
+    for name, r in results.items():
+        print(f"  {name:<28} {r['ops_per_s']:>12.1f} ops/s  {r['ns_per_op']:>10.1f} ns/op", file=sys.stderr)
+    asyncio.run(service.close())
+    service.fb.close()
+    return results
+
+
+# === Parcours complet sur le robot simulé ===
+async def scan_all_plants(speedup: float, points_path: Optional[str]) -> dict:
+    service = simulated_service(speedup=speedup, points_path=points_path,
+                                image_cache_dir=tempfile.mkdtemp(prefix="farmbot_images_"))
+    try:
+        await service.start()
+        await service.wait_until_idle(timeout=5)
+        started = time.perf_counter()
+        job = await service.start_visit_points("Plant")
+        while not job.done:
+            await asyncio.sleep(0.05)
+        wall = time.perf_counter() - started
+        errors = sum(1 for step in job.steps if step["status"] != "done")
+        return {
+            "points": len(job.steps),
+            "status": job.status,
+            "step_errors": errors,
+            "wall_s": round(wall, 3),
+            "simulated_s": round(service.fb.travel_time, 1),
+            "estimated_s": round(job.params["route"]["cost"], 1),
+        }
+    finally:
+        await service.close()
+
+
+def run_scan(args) -> Dict[str, dict]:
+    result = asyncio.run(scan_all_plants(args.speedup, args.scan_points))
+    print(f"  visit_points {result['points']} plantes : {result['simulated_s']} s simulées "
+          f"(prévu {result['estimated_s']} s) en {result['wall_s']} s réelles, {result['step_errors']} erreurs",
+          file=sys.stderr)
+    return {"visit_points": result}
+
+
+# === Résultats et comparaison ===
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Mesures dégradées de plus de `tolerance` (fraction) par rapport à la référence."""
+    regressions = []
+    for section in ("http", "micro", "scan"):
+        for name, metrics in current.get(section, {}).items():
+            before = baseline.get(section, {}).get(name)
+            if not before:
+                continue
+            for metric, value in metrics.items():
+                old = before.get(metric)
+                if not old or metric not in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+                    continue
+                change = (value - old) / old
+                worse = change > tolerance if metric in LOWER_IS_BETTER else change < -tolerance
+                if worse:
+                    regressions.append(f"{section} {name} {metric}: {old} -> {value} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai du backend FarmBot (doublures locales)")
+    parser.add_argument("--kiosks", type=int, default=10, help="Nombre de kiosques simultanés")
+    parser.add_argument("--duration", type=float, default=5.0, help="Durée (s) de la charge par point d'accès")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Chauffe (s) avant chaque mesure")
+    parser.add_argument("--endpoints", nargs="+", default=ENDPOINTS, choices=ENDPOINTS)
+    parser.add_argument("--speedup", type=float, default=1000.0, help="Accélération du temps du robot simulé")
+    parser.add_argument("--status-hz", type=float, default=2.0, help="Fréquence des statuts MQTT simulés")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Durée minimale (s) d'une série de micro-banc")
+    parser.add_argument("--skip-http", action="store_true")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-scan", action="store_true")
+    parser.add_argument("--scan-points", help="points.json d'une sauvegarde (sinon 300 plantes générées)")
+    parser.add_argument("--server-log", help="Fichier où écrire la sortie du serveur")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", metavar="BASELINE", help="Résultats de référence (JSON)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Dégradation tolérée (0.2 = 20 %%)")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "kiosks": args.kiosks,
+            "duration": args.duration,
+            "speedup": args.speedup,
+            "status_hz": args.status_hz,
+        },
+    }
+    if not args.skip_http:
+        print(f"HTTP ({args.kiosks} kiosques, {args.duration} s par point d'accès)", file=sys.stderr)
+        results["http"] = run_http(args)
+    if not args.skip_micro:
+        print("Micro-bancs", file=sys.stderr)
+        results["micro"] = run_micro(args)
+    if not args.skip_scan:
+        print(f"Parcours simulé (x{args.speedup:g})", file=sys.stderr)
+        results["scan"] = run_scan(args)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"Comparaison avec {args.compare} ({baseline.get('meta', {}).get('commit')})", file=sys.stderr)
+        for line in regressions:
+            print(f"  RÉGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("  aucune régression", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/standins.py
+"""
+Doublures locales pour faire tourner l'application sans robot ni nuage :
+- robot, bus de statut (à la place du broker MQTT) : app/services/simulator.py, en temps accéléré
+- fake_web_api : fausse API Web FarmBot (FastAPI) servant les données du simulateur, branchée
+  sur le vrai WebAPIClient par httpx.ASGITransport (le client HTTP fait donc partie de la mesure)
+
+Lancé en module, sert l'application réelle branchée sur ces doublures :
+    python -m benchmarks.standins --port 8765
+"""
+import argparse
+import asyncio
+import tempfile
+
+import httpx
+from fastapi import FastAPI, Query
+
+from app.services.farmbot_service import FarmBotService
+from app.services.simulator import SIMULATED_TOKEN, SimulatedBackend, generate_points
+from app.utils.web_api import WebAPIClient
+
+
+def fake_web_api(records: dict, latency: float = 0.0) -> FastAPI:
+    """Fausse API Web FarmBot : seulement les ressources lues par le backend."""
+    api = FastAPI()
+    api.state.calls = 0
+
+    @api.get("/api/{resource}")
+    async def read(resource: str, pointer_type: str = Query(None)):
+        api.state.calls += 1
+        if latency:
+            await asyncio.sleep(latency)
+        return records.get(resource, [])
+
+    return api
+
+
+def standin_service(speedup: float = 1000.0, status_hz: float = 2.0, points: int = 300,
+                    **kwargs) -> FarmBotService:
+    """
+    FarmBotService réel, branché sur les doublures (mêmes arguments que FleetManager._open).
+    Comme pour FleetManager, `await service.start()` le connecte.
+    """
+    # status_hz est une fréquence réelle : l'intervalle du simulateur est en secondes simulées
+    backend = SimulatedBackend(speedup, generate_points(points), status_interval=speedup / status_hz)
+    api = WebAPIClient(SIMULATED_TOKEN, base_url="http://webapi.local/api/",
+                       transport=httpx.ASGITransport(app=fake_web_api(backend.api.records)))
+    kwargs.pop("token_path", None)
+    service = FarmBotService(**kwargs, **{**backend.service_kwargs(), "api": api})
+    backend.bot.publish_status()
+    return service
+
+
+def install(fleet, speedup: float = 1000.0, status_hz: float = 2.0, points: int = 300):
+    """Remplace la configuration de la flotte par un robot local branché sur les doublures."""
+    def factory(**kwargs):
+        return standin_service(speedup, status_hz, points, **kwargs)
+
+    fleet.devices = {"default": {"token": None, "zones": "app/utils/zones.json",
+                                 "image_cache": tempfile.mkdtemp(prefix="farmbot_images_")}}
+    fleet.factory = factory
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Backend FarmBot branché sur des doublures locales")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--speedup", type=float, default=1000.0, help="Accélération du temps simulé")
+    parser.add_argument("--status-hz", type=float, default=2.0, help="Fréquence (réelle) des statuts MQTT")
+    args = parser.parse_args()
+
+    from app.api import routes
+    from app.main import app
+
+    install(routes.fleet, speedup=args.speedup, status_hz=args.status_hz)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
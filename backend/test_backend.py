@@ -0,0 +1,812 @@
+import asyncio
+import itertools
+import io
+import json
+import logging
+import math
+import random
+import threading
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import get_service, router
+from app.services.fleet_manager import FleetManager
+from app.services.motion_dispatcher import MotionDispatcher
+from app.services.simulator import SIMULATED_TOKEN, simulated_service
+from app.utils import static_files
+from app.utils.cache import TTLCache
+from app.utils.log_buffer import LogBuffer
+from app.utils.metrics import MetricsRegistry
+from app.utils.motion_model import MotionModel
+from app.utils.route_planner import RoutePlanner
+from app.utils.static_files import KioskStaticFiles, precompress
+from app.utils.status_broadcaster import StatusBroadcaster
+from app.utils.status_snapshot import StatusSnapshot
+from app.utils.structured_log import ContextFilter, JsonFormatter, RequestIdMiddleware
+from app.utils.web_api import WebAPIClient, WebAPIError
+from app.utils.zones import Zone, ZoneManager
+
+# === Zones : segment contre zone interdite ===
+
+def forbidden(x1=100, y1=100, x2=200, y2=200):
+    return ZoneManager([Zone("f", "interdite", x1, y1, x2, y2, "forbidden")])
+
+
+def test_segment_through_zone_enters_and_exits():
+    zone = Zone("f", "interdite", 100, 100, 200, 200, "forbidden")
+    t_enter, t_exit = zone.segment_interval(0, 150, 300, 150)
+    assert t_enter == pytest.approx(100 / 300)
+    assert t_exit == pytest.approx(200 / 300)
+
+
+def test_segment_grazing_a_corner_touches_the_zone():
+    # La diagonale passe exactement par le coin (100, 100)
+    crossings = forbidden().forbidden_crossings(0, 200, 200, 0)
+    assert len(crossings) == 1
+    assert crossings[0]["t_enter"] == pytest.approx(0.5)
+    assert crossings[0]["t_exit"] == pytest.approx(0.5)
+
+
+def test_segment_just_outside_a_corner_misses_the_zone():
+    # Même diagonale décalée d'un millimètre : elle frôle le coin sans le toucher
+    assert forbidden().forbidden_crossings(0, 199, 199, 0) == []
+
+
+def test_segment_along_an_edge_touches_the_zone():
+    assert forbidden().forbidden_crossings(50, 100, 250, 100) != []
+    assert forbidden().forbidden_crossings(50, 99.9, 250, 99.9) == []
+
+
+def test_segment_entirely_inside_the_zone():
+    crossings = forbidden().forbidden_crossings(120, 120, 180, 170)
+    assert [(c["t_enter"], c["t_exit"]) for c in crossings] == [(0.0, 1.0)]
+
+
+def test_zero_length_segment():
+    manager = forbidden()
+    assert manager.forbidden_crossings(150, 150, 150, 150)[0]["t_enter"] == 0.0
+    assert manager.forbidden_crossings(50, 50, 50, 50) == []
+    # Avec le rayon de la tête : un point immobile près du bord touche la zone
+    assert manager.forbidden_crossings(95, 150, 95, 150, radius=10) != []
+    assert manager.forbidden_crossings(85, 150, 85, 150, radius=10) == []
+
+
+def test_radius_inflates_the_edges():
+    manager = forbidden()
+    # Parallèle au bord gauche, à 5 mm : touché seulement si le rayon dépasse 5 mm
+    assert manager.forbidden_crossings(95, 0, 95, 300) == []
+    assert manager.forbidden_crossings(95, 0, 95, 300, radius=4) == []
+    crossing = manager.forbidden_crossings(95, 0, 95, 300, radius=6)
+    # Entrée et sortie sur les coins arrondis : y = 100 - sqrt(6² - 5²) et 200 + sqrt(6² - 5²)
+    chord = math.sqrt(6 ** 2 - 5 ** 2)
+    assert crossing[0]["t_enter"] == pytest.approx((100 - chord) / 300)
+    assert crossing[0]["t_exit"] == pytest.approx((200 + chord) / 300)
+    # Perpendiculaire au bord : le rayon s'ajoute entièrement
+    crossing = manager.forbidden_crossings(0, 150, 300, 150, radius=6)
+    assert crossing[0]["t_enter"] == pytest.approx((100 - 6) / 300)
+    assert crossing[0]["t_exit"] == pytest.approx((200 + 6) / 300)
+
+
+def test_radius_rounds_the_corners():
+    # Diagonale à 10 mm du coin (100, 100) : la boîte englobante grossie de 8 mm la
+    # toucherait, mais pas le coin arrondi (somme de Minkowski)
+    offset = 10 * math.sqrt(2)
+    x0, y0, x1, y1 = 0, 200 - offset, 200 - offset, 0
+    manager = forbidden()
+    assert manager.forbidden_crossings(x0, y0, x1, y1, radius=8) == []
+    crossing = manager.forbidden_crossings(x0, y0, x1, y1, radius=12)
+    assert len(crossing) == 1
+    assert crossing[0]["t_enter"] < 0.5 < crossing[0]["t_exit"]
+
+
+def test_crossings_are_sorted_by_entry():
+    manager = ZoneManager([
+        Zone("far", "loin", 300, 0, 350, 100, "forbidden"),
+        Zone("near", "près", 100, 0, 150, 100, "forbidden"),
+        Zone("ok", "permise", 200, 0, 250, 100, "allowed"),
+    ])
+    assert [c["zone"] for c in manager.forbidden_crossings(0, 50, 400, 50)] == ["near", "far"]
+
+
+def test_batch_zone_lookup_matches_single_lookups():
+    manager = ZoneManager()
+    manager.load_from_file("app/utils/zones.json")
+    points = [(x, y) for x in range(-100, 3200, 37) for y in range(-50, 800, 29)] + [(1428, 670), (2959, 0)]
+    assert manager.get_zones_at(points) == [manager.get_zone_at(x, y) for x, y in points]
+    assert ZoneManager().get_zones_at([(1, 1)]) == [None]
+
+
+# === Modèle cinématique ===
+# Valeurs par défaut du firmware sur X : 50 à 400 pas/s, rampe de 300 pas, 5 pas/mm
+
+def test_long_move_follows_a_trapezoid():
+    # accélération = (400² - 50²) / (2 * 300) = 262.5 pas/s², rampes de 300 pas chacune
+    expected = 2 * (400 - 50) / 262.5 + (5000 - 600) / 400
+    assert MotionModel().axis_time("x", 1000) == pytest.approx(expected)
+
+
+def test_short_move_follows_a_triangle():
+    v_peak = math.sqrt(50 ** 2 + 262.5 * 250)
+    assert MotionModel().axis_time("x", 50) == pytest.approx(2 * (v_peak - 50) / 262.5)
+    # Les deux profils se rejoignent quand le mouvement atteint juste la vitesse max (600 pas)
+    model = MotionModel()
+    assert model.axis_time("x", 120) == pytest.approx(model.axis_time("x", 120.001), abs=1e-3)
+
+
+def test_xy_axes_move_together_and_speed_slows_them_down():
+    model = MotionModel()
+    assert model.xy_time((0, 0), (1000, 200)) == model.axis_time("x", 1000)
+    assert model.axis_time("x", 1000, speed_pct=50) > model.axis_time("x", 1000)
+
+
+def test_safe_z_move_lifts_crosses_then_descends():
+    model = MotionModel()
+    start, end = {"x": 0, "y": 0, "z": -100}, {"x": 1000, "y": 0, "z": -50}
+    expected = model.axis_time("z", 100) + model.axis_time("x", 1000) + model.axis_time("z", 50)
+    assert model.move_time(start, end, safe_z=0) == pytest.approx(expected)
+    # Sans safe_z, Z bouge en même temps que X et Y
+    assert model.move_time(start, end) == model.axis_time("x", 1000)
+
+
+def test_missing_or_null_position_counts_from_the_origin():
+    model = MotionModel()
+    origin = model.move_time({"x": 0, "y": 0, "z": 0}, {"x": 500, "y": 300}, safe_z=0)
+    assert model.move_time({}, {"x": 500, "y": 300}, safe_z=0) == origin
+    assert model.move_time({"x": None, "y": None, "z": None}, {"x": 500, "y": 300}, safe_z=0) == origin
+    assert model.plan_time([{"x": 500, "y": 300}], {"x": None, "y": None, "z": None})["total"] == round(origin, 3)
+
+
+def test_timeout_scales_with_the_estimate():
+    model = MotionModel()
+    assert model.timeout_for(0) == 5
+    assert model.timeout_for(10) == 20
+    assert model.timeout_for(10, factor=2, margin=1) == 21
+
+
+def test_firmware_params_override_the_defaults():
+    slow = MotionModel({"movement_max_spd_x": 200, "movement_min_spd_x": None})
+    assert slow.params["movement_min_spd_x"] == 50
+    assert slow.axis_time("x", 1000) > MotionModel().axis_time("x", 1000)
+
+
+# === Planificateur de parcours ===
+
+def random_points(count, seed):
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 2000), rng.uniform(0, 1000)) for _ in range(count)]
+
+
+def test_exact_route_is_optimal_and_never_worse_than_the_heuristic():
+    points, start = random_points(7, seed=3), (0.0, 0.0)
+    planner = RoutePlanner()
+    exact = planner.plan(points, start)
+    brute = min(planner.route_cost([points[i] for i in order], start)
+                for order in itertools.permutations(range(len(points))))
+    heuristic = RoutePlanner(exact_limit=0).plan(points, start)
+
+    assert exact["method"] == "exact" and heuristic["method"] == "heuristic"
+    assert exact["cost"] == pytest.approx(brute, abs=1e-3)
+    assert exact["cost"] <= heuristic["cost"] <= heuristic["baseline_cost"]
+
+
+def test_heuristic_takes_over_above_the_exact_limit():
+    points = random_points(12, seed=5)
+    result = RoutePlanner(exact_limit=9).plan(points, (0.0, 0.0))
+    assert result["method"] == "heuristic"
+    assert sorted(result["order"]) == list(range(12))
+    assert result["cost"] <= result["baseline_cost"]
+
+
+def test_route_cost_adds_a_z_hop_across_a_forbidden_zone():
+    planner = RoutePlanner(forbidden(100, 0, 150, 1000))
+    assert planner.travel_cost((0, 500), (300, 500)) == pytest.approx(300 / 80 + 6)
+    assert planner.travel_cost((0, 500), (90, 500)) == pytest.approx(90 / 80)
+
+
+# === Cache TTL ===
+
+def test_stale_entry_is_served_while_one_refresh_runs():
+    async def main():
+        cache = TTLCache()
+        cache.set("k", "ancienne", ttl=0, stale=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "nouvelle"
+
+        # Périmée : servie telle quelle, un seul rechargement malgré trois lectures
+        stale = [await cache.get_or_load_async("k", loader, ttl=60) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        return stale, await cache.get_or_load_async("k", loader, ttl=60), len(calls)
+
+    assert asyncio.run(main()) == (["ancienne"] * 3, "nouvelle", 1)
+
+
+def test_failed_refresh_keeps_the_stale_value():
+    async def main():
+        cache = TTLCache()
+        cache.set("k", "ancienne", ttl=0, stale=60)
+
+        async def failing():
+            raise RuntimeError("nuage injoignable")
+
+        first = await cache.get_or_load_async("k", failing)
+        await asyncio.sleep(0.01)
+        return first, await cache.get_or_load_async("k", failing)
+
+    assert asyncio.run(main()) == ("ancienne", "ancienne")
+
+
+# === Répartiteur de mouvements ===
+
+def test_dispatcher_replaces_a_clients_pending_move():
+    async def main():
+        dispatcher = MotionDispatcher()
+        gate = asyncio.Event()
+        ran = []
+
+        async def blocking():
+            await gate.wait()
+
+        def move(name):
+            async def run():
+                ran.append(name)
+                return name
+            return run
+
+        dispatcher.submit("autre", "move", blocking)
+        await asyncio.sleep(0)
+        first = dispatcher.submit("kiosque", "move", move("premier"))
+        second = dispatcher.submit("kiosque", "move", move("second"))
+        gate.set()
+        results = await first.wait(), await second.wait()
+        dispatcher.close()
+        return results, first.status, ran
+
+    results, first_status, ran = asyncio.run(main())
+    assert results[0]["status"] == "superseded"
+    assert first_status == "superseded"
+    assert results[1] == "second" and ran == ["second"]
+
+
+def test_dispatcher_clear_cancels_pending_commands():
+    async def main():
+        dispatcher = MotionDispatcher()
+        gate = asyncio.Event()
+
+        async def blocking():
+            await gate.wait()
+
+        running = dispatcher.submit("a", "move", blocking)
+        await asyncio.sleep(0)
+        pending = dispatcher.submit("b", "move", blocking)
+        cleared = dispatcher.clear("e-stop")
+        gate.set()
+        await running.wait()
+        result = await pending.wait()
+        dispatcher.close()
+        return cleared, result, pending.status, running.status
+
+    assert asyncio.run(main()) == (1, {"status": "cancelled", "reason": "e-stop"}, "cancelled", "done")
+
+
+def test_dispatcher_close_resolves_the_running_command():
+    async def main():
+        dispatcher = MotionDispatcher()
+        command = dispatcher.submit("kiosque", "move", lambda: asyncio.sleep(60))
+        await asyncio.sleep(0.01)
+        dispatcher.close()
+        return await asyncio.wait_for(command.wait(), 1), command.status
+
+    result, status = asyncio.run(main())
+    assert result == {"status": "cancelled", "reason": "shutdown"}
+    assert status == "cancelled"
+
+
+# === Résumé de statut (versions, ETag) ===
+
+def test_snapshot_version_changes_only_with_visible_fields():
+    snapshot = StatusSnapshot()
+    first_etag = snapshot.etag
+    assert snapshot.update({"busy": False, "position": {"x": 0}}) == {"busy": False, "position": {"x": 0}}
+    assert snapshot.update({"busy": False, "position": {"x": 0}}) is None
+    assert snapshot.update({"busy": True, "position": {"x": 0}}) == {"busy": True}
+    assert snapshot.version == 2 and snapshot.etag != first_etag
+    assert snapshot.changes_since(1) == {"version": 2, "full": False, "changes": {"busy": True}}
+    assert snapshot.changes_since(0)["changes"] == {"busy": True, "position": {"x": 0}}
+
+
+def test_snapshot_history_too_short_returns_the_full_summary():
+    snapshot = StatusSnapshot(history=2)
+    for x in range(4):
+        snapshot.update({"position": {"x": x}, "busy": False})
+    assert snapshot.changes_since(0) == {"version": 4, "full": True, "changes": {"position": {"x": 3}, "busy": False}}
+    assert snapshot.matches(snapshot.etag) and snapshot.matches(f'"autre", {snapshot.etag}')
+    assert not snapshot.matches('"autre"') and not snapshot.matches(None)
+
+
+def test_broadcaster_delivers_only_the_latest_status_after_a_burst():
+    async def main():
+        broadcaster = StatusBroadcaster(coalesce_interval=0)
+        broadcaster.publish({"busy": False, "position": {"x": 0}})
+        subscription = broadcaster.subscribe()
+        first = await subscription.next(timeout=1)
+        for x in range(1, 51):
+            broadcaster.publish({"busy": True, "position": {"x": x}})
+        await asyncio.sleep(0)  # publish renvoie la diffusion vers la boucle
+        burst = await subscription.next(timeout=1)
+        idle = await subscription.next(timeout=0.01)
+        subscription.close()
+        return first, burst, idle, broadcaster.client_count
+
+    first, burst, idle, clients = asyncio.run(main())
+    assert first == {"type": "snapshot", "data": {"busy": False, "position": {"x": 0}}}
+    assert burst == {"type": "delta", "data": {"busy": True, "position": {"x": 50}}}
+    assert idle is None and clients == 0
+
+
+def test_broadcaster_accepts_statuses_from_the_mqtt_thread():
+    async def main():
+        broadcaster = StatusBroadcaster(coalesce_interval=0.01)
+        subscription = broadcaster.subscribe()
+        thread = threading.Thread(target=broadcaster.publish, args=({"busy": True},))
+        thread.start()
+        thread.join()
+        return await subscription.next(timeout=1)
+
+    assert asyncio.run(main()) == {"type": "snapshot", "data": {"busy": True}}
+
+
+# === Journaux du robot ===
+
+def robot_log(created_at, message=None, type="info"):
+    return {"created_at": created_at, "message": message or f"journal {created_at}", "type": type, "verbosity": 1}
+
+
+def test_log_buffer_drops_the_oldest_and_filters_by_date():
+    logs = LogBuffer(max_entries=3)
+    for created_at in (1, 2, 4, 5):
+        logs.append(robot_log(created_at))
+    logs.append(robot_log(3))  # arrivé en retard : rangé à sa place
+    logs.append(robot_log(5))  # doublon ignoré
+
+    assert [log["created_at"] for log in logs.query()] == [5, 4, 3]
+    assert [log["created_at"] for log in logs.query(since=3)] == [5, 4]
+    assert [log["created_at"] for log in logs.query(limit=1)] == [5]
+
+
+def test_log_buffer_is_bounded_in_bytes_and_filters_by_type():
+    one = len(json.dumps(robot_log(1), separators=(",", ":")))
+    logs = LogBuffer(max_bytes=one * 2 + 10)
+    logs.extend([robot_log(3, type="error"), robot_log(1), robot_log(2)])
+    assert len(logs) == 2 and logs.total_bytes <= one * 2 + 10
+    assert [log["created_at"] for log in logs.query(types=["error"])] == [3]
+
+
+# === Métriques ===
+
+def test_metrics_render_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    calls = registry.counter("farmbot_api_calls_total", "Appels", ("resource", "status"))
+    calls.labels("points", "200").inc()
+    calls.labels("points", "200").inc(2)
+    calls.labels('a"b', "500").inc()
+    latency = registry.histogram("farmbot_api_seconds", "Durée", ("resource",), buckets=(0.1, 1))
+    latency.labels("points").observe(0.05)
+    latency.labels("points").observe(0.5)
+    registry.collector(lambda: [("farmbot_queue_depth", "File", "gauge", [({"device": "banc"}, 2)])])
+
+    assert registry.render().splitlines() == [
+        "# HELP farmbot_api_calls_total Appels",
+        "# TYPE farmbot_api_calls_total counter",
+        'farmbot_api_calls_total{resource="a\\"b",status="500"} 1',
+        'farmbot_api_calls_total{resource="points",status="200"} 3',
+        "# HELP farmbot_api_seconds Durée",
+        "# TYPE farmbot_api_seconds histogram",
+        'farmbot_api_seconds_bucket{resource="points",le="0.1"} 1',
+        'farmbot_api_seconds_bucket{resource="points",le="1"} 2',
+        'farmbot_api_seconds_bucket{resource="points",le="+Inf"} 2',
+        'farmbot_api_seconds_sum{resource="points"} 0.55',
+        'farmbot_api_seconds_count{resource="points"} 2',
+        "# HELP farmbot_queue_depth File",
+        "# TYPE farmbot_queue_depth gauge",
+        'farmbot_queue_depth{device="banc"} 2',
+    ]
+
+
+def test_metrics_registry_returns_the_existing_metric_on_reload():
+    registry = MetricsRegistry()
+    first = registry.counter("farmbot_reloads_total", "Rechargements")
+    first.inc()
+    assert registry.counter("farmbot_reloads_total", "Rechargements") is first
+
+
+# === Journaux structurés ===
+
+def test_request_id_reaches_the_json_log_line():
+    output = io.StringIO()
+    handler = logging.StreamHandler(output)
+    handler.setFormatter(JsonFormatter())
+    handler.addFilter(ContextFilter())
+    logger = logging.getLogger("app.test_request_id")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        logger.info("Ping", extra={"device_id": "banc"})
+        return {}
+
+    try:
+        with TestClient(RequestIdMiddleware(app)) as client:
+            given = client.get("/ping", headers={"X-Request-Id": "kiosque-42"})
+            generated = client.get("/ping")
+    finally:
+        logger.removeHandler(handler)
+
+    first, second = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert given.headers["x-request-id"] == "kiosque-42"
+    assert {k: first[k] for k in ("level", "logger", "msg", "request_id", "device_id")} == {
+        "level": "INFO", "logger": "app.test_request_id", "msg": "Ping",
+        "request_id": "kiosque-42", "device_id": "banc"}
+    assert second["request_id"] == generated.headers["x-request-id"] != "kiosque-42"
+    assert "move_id" not in first
+
+
+# === Fichiers du kiosque ===
+
+def kiosk_client(tmp_path):
+    script = b"console.log('kiosque');\n" * 200
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-AbCd1234.js").write_bytes(script)
+    (tmp_path / "index.html").write_bytes(b"<!doctype html><script src=/assets/index-AbCd1234.js></script>" * 40)
+    (tmp_path / "bot.png").write_bytes(bytes(range(256)) * 8)
+    precompress(str(tmp_path))
+    # Variante brotli : vraie si le paquet est installé, sinon acceptée sur sa date
+    brotli = static_files.brotli
+    (tmp_path / "assets" / "index-AbCd1234.js.br").write_bytes(brotli.compress(script) if brotli else b"br")
+    app = FastAPI()
+    app.mount("/", KioskStaticFiles(directory=str(tmp_path), html=True))
+    return TestClient(app)
+
+
+def test_static_files_negotiate_the_precompressed_variant(tmp_path):
+    client = kiosk_client(tmp_path)
+    path = "/assets/index-AbCd1234.js"
+    both = client.get(path, headers={"Accept-Encoding": "gzip, br"})
+    gzip_only = client.get(path, headers={"Accept-Encoding": "gzip;q=1, br;q=0"})
+    identity = client.get(path, headers={"Accept-Encoding": "identity"})
+
+    assert both.headers["content-encoding"] == "br"
+    assert gzip_only.headers["content-encoding"] == "gzip"
+    assert gzip_only.content == (tmp_path / "assets" / "index-AbCd1234.js").read_bytes()
+    assert "content-encoding" not in identity.headers
+    assert {r.headers["vary"] for r in (both, gzip_only, identity)} == {"Accept-Encoding"}
+    assert len({r.headers["etag"] for r in (both, gzip_only, identity)}) == 3
+
+
+def test_static_files_cache_hashed_assets_only(tmp_path):
+    client = kiosk_client(tmp_path)
+    asset = client.get("/assets/index-AbCd1234.js")
+    index = client.get("/")
+    image = client.get("/bot.png")
+
+    assert asset.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert index.headers["cache-control"] == "no-cache"
+    assert image.headers["cache-control"] == "public, max-age=300"
+    assert "vary" not in image.headers  # pas de variante compressée pour une image
+    revalidated = client.get("/", headers={"If-None-Match": index.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+# === Client de l'API Web : nouveaux essais ===
+
+def web_api(handler, **kwargs):
+    return WebAPIClient(SIMULATED_TOKEN, base_url="http://webapi.local/api/", backoff=0,
+                        transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_get_is_retried_on_server_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503) if len(calls) < 3 else httpx.Response(200, json={"ok": True})
+
+    assert asyncio.run(web_api(handler).get("device")) == {"ok": True}
+    assert calls == ["GET"] * 3
+
+
+def test_post_is_not_replayed_after_a_server_error_or_timeout():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("lecture trop longue", request=request)
+        return httpx.Response(502)
+
+    client = web_api(handler)
+    with pytest.raises(WebAPIError):
+        asyncio.run(client.post("points", {"x": 1}))
+    with pytest.raises(WebAPIError):
+        asyncio.run(client.post("points", {"x": 1}))
+    assert calls == ["POST", "POST"]
+
+
+def test_post_is_retried_when_throttled_or_never_sent():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connexion refusée", request=request)
+        if len(calls) == 2:
+            return httpx.Response(429, headers={"retry-after": "0"})
+        return httpx.Response(200, json={"id": 1})
+
+    assert asyncio.run(web_api(handler).post("points", {"x": 1})) == {"id": 1}
+    assert len(calls) == 3
+
+
+def test_retry_after_is_clamped_and_accepts_http_dates():
+    client = web_api(lambda request: httpx.Response(200), max_backoff=5)
+    assert client._delay(0, "3") == 3
+    assert client._delay(0, "3600") == 5
+    assert client._delay(0, formatdate(time.time() + 3600, usegmt=True)) == 5
+    assert client._delay(0, formatdate(time.time() - 60, usegmt=True)) == 0
+    assert 0 <= client._delay(10, "pas une date") <= 5
+
+
+# === FarmBotService sur le robot simulé ===
+
+def run_on_simulator(tmp_path, scenario, speedup=1000, **kwargs):
+    """Exécute `scenario(service)` sur un service démarré, branché sur le robot simulé."""
+    async def main():
+        service = simulated_service(speedup=speedup, image_cache_dir=str(tmp_path / "images"), **kwargs)
+        try:
+            await service.start()
+            await service.wait_for_status(lambda status: status.get("location_data"), 5)
+            return await scenario(service)
+        finally:
+            await service.close()
+            service.fb.close()
+    return asyncio.run(main())
+
+
+def api_client(service):
+    """Client HTTP sur les routes du robot, branchées sur `service`."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_service] = lambda: service
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://kiosque")
+
+
+async def wait_job(job, timeout=10):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not job.done:
+        assert loop.time() < deadline, "travail non terminé"
+        await asyncio.sleep(0.01)
+    return job
+
+
+def test_live_status_answers_304_until_the_status_changes(tmp_path):
+    async def scenario(service):
+        service.mqtt.stop()  # seuls les statuts publiés par le test changent le résumé
+        async with api_client(service) as client:
+            first = await client.get("/live_status")
+            etag = first.headers["etag"]
+            repeated = await client.get("/live_status", headers={"If-None-Match": etag})
+
+            status = service.fb.status()
+            status["location_data"]["position"]["x"] += 10
+            service._update_status(status)
+            changed = await client.get("/live_status", headers={"If-None-Match": etag})
+        return first, repeated, changed
+
+    first, repeated, changed = run_on_simulator(tmp_path, scenario)
+    assert first.status_code == 200 and first.json()["position"]
+    assert repeated.status_code == 304 and repeated.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    assert changed.json()["position"]["x"] == first.json()["position"]["x"] + 10
+
+
+def test_validate_plan_reports_zones_and_crossings(tmp_path):
+    # zones.json : admin_only jusqu'à x = 1428, interdite jusqu'à 1531, puis permise
+    plan = {"waypoints": [{"x": 1000, "y": 300}, {"x": 1480, "y": 300}, {"x": 1700, "y": 300, "z": -100}],
+            "action_type": "water", "from_current": False}
+
+    async def scenario(service):
+        async with api_client(service) as client:
+            watering = await client.post("/validate_plan", json=plan)
+            moving = await client.post("/validate_plan", json={**plan, "waypoints": plan["waypoints"][1:],
+                                                               "action_type": "move"})
+        return watering.json(), moving.json()
+
+    watering, moving = run_on_simulator(tmp_path, scenario)
+    assert [(w["zone_type"], w["allowed"]) for w in watering["waypoints"]] == [
+        ("admin_only", False), ("forbidden", False), ("allowed", True)]
+    assert not watering["valid"]
+    assert watering["waypoints"][0]["crosses_forbidden"] == []
+    assert [c["zone"] for w in watering["waypoints"][1:] for c in w["crosses_forbidden"]] == ["forbidden_1"] * 2
+    assert watering["crossing_count"] == 2
+    # Un simple déplacement peut passer au-dessus d'une zone interdite
+    assert moving["valid"] and moving["waypoints"][0]["index"] == 0
+
+
+def test_job_steps_restore_the_movement_timeout(tmp_path):
+    async def scenario(service):
+        job = await service.start_grid_travel(start_x=1600, start_y=100, width=200, length=200, rows=2, columns=2)
+        await wait_job(job)
+        return job, service.fb.state.timeout["movements"]
+
+    job, timeout = run_on_simulator(tmp_path, scenario)
+    assert job.status == "completed"
+    assert timeout == 120
+
+
+def test_job_leg_below_safe_height_gets_a_long_enough_timeout(tmp_path):
+    # Sous la hauteur sécuritaire (0), _execute_safe_move monte avant de traverser : l'estimation aussi
+    async def scenario(service):
+        service.fb.position.update(x=1600, y=300, z=-150)
+        service.fb.publish_status()
+        await service.wait_for_status(lambda status: status["location_data"]["position"]["z"] == -150, 5)
+        job = await service.start_grid_travel(start_x=1900, start_y=300, width=0, length=0, rows=1, columns=1)
+        await wait_job(job)
+        return job, service.fb.move_timeouts
+
+    job, move_timeouts = run_on_simulator(tmp_path, scenario)
+    assert job.status == "completed"
+    assert move_timeouts == 0
+
+
+def test_job_leg_crossing_a_forbidden_zone_is_lifted(tmp_path):
+    # zones.json : zone interdite entre x = 1428 et x = 1531, sur toute la largeur
+    async def scenario(service):
+        moves = []
+        move = service.fb.move
+
+        def recording_move(*args, **kwargs):
+            moves.append((args, kwargs))
+            return move(*args, **kwargs)
+
+        service.fb.move = recording_move
+        job = await service.start_grid_travel(start_x=1300, start_y=100, width=400, length=0,
+                                              rows=1, columns=2, order="optimal")
+        await wait_job(job)
+        return job, moves
+
+    job, moves = run_on_simulator(tmp_path, scenario)
+    assert job.status == "completed"
+    assert [(kwargs["x"], kwargs["safe_z"]) for _, kwargs in moves] == [(1300, None), (1700, True)]
+
+
+def test_safe_height_is_read_through_the_web_api_client(tmp_path):
+    def library_call():
+        raise AssertionError("fb.safe_z() fait son propre appel bloquant à l'API Web")
+
+    async def main():
+        service = simulated_service(speedup=1000, image_cache_dir=str(tmp_path / "images"))
+        service.fb.safe_z = library_call
+        service.api.records["fbos_config"]["safe_height"] = -40
+        try:
+            await service.start()
+            return service.safe_height, service.readiness["safe_z"]
+        finally:
+            await service.close()
+            service.fb.close()
+
+    assert asyncio.run(main()) == (-40, "ready")
+
+
+def test_unprocessed_photo_is_not_cached(tmp_path):
+    record = {"id": 7, "created_at": "2025-05-21T16:23:47.000Z", "attachment_url": "sim://provisoire.jpg",
+              "attachment_processed_at": None, "meta": {"name": "photo"}}
+
+    async def scenario(service):
+        service.api.records["images"] = [record]
+        response = await service._photo_response(record)
+        path = await service.photo_path(7)
+        return response, path, service.image_cache.has(7)
+
+    response, path, cached = run_on_simulator(tmp_path, scenario)
+    assert response == {"url": "sim://provisoire.jpg", "id": 7, "processing": True}
+    assert path is None and not cached
+
+
+def test_image_lookup_does_not_sleep_after_the_last_attempt(tmp_path):
+    async def scenario(service):
+        started = time.perf_counter()
+        record = await service._find_image_record("introuvable", attempts=1)
+        return record, time.perf_counter() - started
+
+    record, elapsed = run_on_simulator(tmp_path, scenario)
+    assert record is None
+    assert elapsed < 0.5
+
+
+def test_logs_reseed_after_a_cancelled_seed(tmp_path):
+    async def scenario(service):
+        service._seed_task = asyncio.ensure_future(asyncio.sleep(60))
+        service._seed_task.cancel()
+        await asyncio.sleep(0)
+        return await service.get_logs(limit=5)
+
+    assert len(run_on_simulator(tmp_path, scenario)) == 5
+
+
+def test_lock_during_a_safe_move_skips_the_descent(tmp_path):
+    async def scenario(service):
+        moves = []
+        move = service.fb.move
+
+        def recording_move(*args, **kwargs):
+            moves.append(kwargs)
+            return move(*args, **kwargs)
+
+        service.fb.move = recording_move
+        pending = asyncio.ensure_future(service.safe_move_to(x=2500, y=300, z=-100))
+        await asyncio.sleep(0.1)
+        await service.lock()
+        return await asyncio.wait_for(pending, 5), moves
+
+    result, moves = run_on_simulator(tmp_path, scenario, speedup=10)
+    assert result["status"] == "stopped"
+    assert [m.get("z") for m in moves] == [0]  # déplacement principal seulement, pas de descente
+
+
+def test_unknown_position_is_reported_instead_of_failing(tmp_path):
+    async def scenario(service):
+        service.mqtt.stop()  # plus de statut du robot simulé : la position nulle reste
+        status = service.fb.status()
+        status["location_data"]["position"] = {"x": None, "y": None, "z": None}
+        service._update_status(status)
+        estimate = service.estimate_move(1000, 500, safe_z=True)
+        moved = await service.safe_move_to(1000, 500)
+        homed = await service.goto_home()
+        return estimate, moved, homed
+
+    estimate, moved, homed = run_on_simulator(tmp_path, scenario)
+    assert estimate["duration"] > 0
+    assert moved == {"status": "error", "message": "Position actuelle inconnue"}
+    assert homed is None  # find_home a été envoyé malgré la position inconnue
+
+
+# === Flotte ===
+
+def test_fleet_never_evicts_the_default_device(tmp_path):
+    devices = {
+        device_id: {"simulator": {"speedup": 1000}, "image_cache": str(tmp_path / device_id),
+                    "device_config": str(tmp_path / f"{device_id}.json")}
+        for device_id in ("default", "banc")
+    }
+    config = tmp_path / "fleet.json"
+    config.write_text(json.dumps({"devices": devices}))
+
+    async def main():
+        fleet = FleetManager(str(config), idle_timeout=60)
+        try:
+            await fleet.get()
+            await fleet.get("banc")
+            for session in fleet.sessions.values():
+                session.last_used -= 120
+            evicted = await fleet.evict_idle()
+            return evicted, sorted(fleet.sessions), fleet.readiness()["ready"]
+        finally:
+            await fleet.close_all()
+
+    evicted, open_sessions, ready = asyncio.run(main())
+    assert evicted == 1
+    assert open_sessions == ["default"]
+    assert ready
@@ -15,6 +15,17 @@ if [ ! -f dist/index.html ]; then
   exit 1
 fi
 
+# 🗜️ Variantes précompressées (.gz, .br si brotli est installé) servies selon Accept-Encoding
+echo "🗜️ Précompression du bundle"
+PYTHON="$(pwd)/../../.venv/bin/python"
+[ -x "$PYTHON" ] || PYTHON=python3
+(cd ../../backend && "$PYTHON" -m app.utils.static_files ../frontend/farmbot-kiosk-frontend/dist)
+
+# 📦 Le backend sert aussi le kiosque (backend/app/static) : même build que /var/www
+echo "📦 Mise à jour de backend/app/static"
+rm -rf ../../backend/app/static/assets
+cp -r dist/* ../../backend/app/static/
+
 # 🔐 Backup de l'ancien contenu de /var/www
 echo "🧳 Sauvegarde de $TARGET_DIR vers $BACKUP_DIR"
 sudo cp -r $TARGET_DIR "$BACKUP_DIR"
@@ -29,4 +40,17 @@ echo "🔁 Redémarrage du backend FarmBot"
 cd ../../
 sudo systemctl restart farmbot-backend.service
 
+# ⏳ Attendre que le robot par défaut soit utilisable (GET /ready)
+echo "⏳ Attente du backend (/ready)"
+for i in $(seq 1 60); do
+  if curl -sf http://localhost:8000/ready > /dev/null; then
+    echo "🟢 Backend prêt après ~$((i / 2)) s"
+    break
+  fi
+  if [ "$i" -eq 60 ]; then
+    echo "⚠️ Backend pas encore prêt après 30 s : voir curl http://localhost:8000/ready"
+  fi
+  sleep 0.5
+done
+
 echo "✅ Déploiement terminé avec succès."
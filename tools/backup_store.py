@@ -0,0 +1,195 @@
+import datetime
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ndjson_backup import NDJSONWriter, read_json_array, read_ndjson
+
+# Resources kept in each snapshot (tool_slots is derived from points when reading)
+RESOURCES = ("tools", "points")
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    serialized = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class BackupStore:
+    """
+    Content-addressed backup store.
+
+    backups/packs/<snapshot>.ndjson.gz    records first seen in that snapshot, compressed together
+    backups/packs/index.json              record hash -> pack
+    backups/snapshots/<timestamp>.json    manifest: {resource: {record id: hash}}
+
+    Each record is kept once. A backup only writes the records that changed since
+    any previous snapshot, plus a small manifest. Diffs between snapshots only read
+    manifests. Folders written by the old backup_all (backups/<timestamp>/points.json, ...)
+    can still be read as snapshots.
+    """
+
+    def __init__(self, root: str = "backups"):
+        self.root = root
+        self.packs_dir = os.path.join(root, "packs")
+        self.snapshots_dir = os.path.join(root, "snapshots")
+        self._index: Optional[Dict[str, str]] = None
+        self._pending: set = set()
+        self._writer: Optional[NDJSONWriter] = None
+        self.objects_written = 0
+        self.bytes_written = 0
+
+    # === Objects ===
+    @property
+    def index(self) -> Dict[str, str]:
+        if self._index is None:
+            path = os.path.join(self.packs_dir, "index.json")
+            self._index = {}
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+        return self._index
+
+    def put(self, record: Dict[str, Any]) -> str:
+        """Adds the record to the pack being written, unless the store already has it."""
+        digest = record_hash(record)
+        if digest not in self.index and digest not in self._pending:
+            self._pending.add(digest)
+            self._writer.write({"h": digest, "r": record})
+        return digest
+
+    def _open_pack(self, pack: str):
+        self._pending = set()
+        self._writer = NDJSONWriter(os.path.join(self.packs_dir, f"{pack}.ndjson.gz"))
+
+    def _close_pack(self, pack: str):
+        """Records are streamed to the pack as they come; the index is updated once at the end."""
+        writer, self._writer = self._writer, None
+        if not self._pending:
+            writer.abort()
+            return
+        writer.close()
+        for digest in self._pending:
+            self.index[digest] = pack
+        self.objects_written += len(self._pending)
+        self.bytes_written += os.path.getsize(writer.path)
+        self._pending = set()
+        _write_atomic(os.path.join(self.packs_dir, "index.json"),
+                      json.dumps(self.index, separators=(",", ":")).encode())
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        pack = self.index[digest]
+        for entry in read_ndjson(os.path.join(self.packs_dir, f"{pack}.ndjson.gz")):
+            if entry["h"] == digest:
+                return entry["r"]
+        raise KeyError(digest)
+
+    def iter_records(self, hashes: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Streams the records with the given hashes, reading each pack once (pack order)."""
+        by_pack: Dict[str, set] = {}
+        for digest in hashes:
+            by_pack.setdefault(self.index[digest], set()).add(digest)
+        for pack, wanted in by_pack.items():
+            for entry in read_ndjson(os.path.join(self.packs_dir, f"{pack}.ndjson.gz")):
+                if entry["h"] in wanted:
+                    yield entry["r"]
+
+    # === Snapshots ===
+    def _taken(self, name: str) -> bool:
+        return (os.path.exists(os.path.join(self.snapshots_dir, f"{name}.json"))
+                or os.path.exists(os.path.join(self.packs_dir, f"{name}.ndjson.gz")))
+
+    def _new_snapshot_name(self) -> str:
+        """Timestamp to the second, with a counter when several backups run in the same second."""
+        base = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        name, counter = base, 1
+        while self._taken(name):
+            counter += 1
+            name = f"{base}-{counter}"
+        return name
+
+    def save_snapshot(self, resources: Dict[str, Iterable[Dict[str, Any]]], name: Optional[str] = None) -> str:
+        if name is None:
+            name = self._new_snapshot_name()
+        elif self._taken(name):
+            # Overwriting the pack would lose the records other snapshots point to
+            raise FileExistsError(f"Backup snapshot '{name}' already exists in {self.root}")
+        self._open_pack(name)
+        try:
+            # Records can be a lazy stream (e.g. straight from the API): only hashes are kept
+            manifest = {
+                "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "resources": {
+                    resource: {str(record["id"]): self.put(record) for record in records}
+                    for resource, records in resources.items()
+                },
+            }
+        except BaseException:
+            self._writer.abort()
+            self._writer = None
+            raise
+        self._close_pack(name)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        _write_atomic(os.path.join(self.snapshots_dir, f"{name}.json"),
+                      json.dumps(manifest, separators=(",", ":")).encode())
+        return name
+
+    def snapshots(self) -> List[str]:
+        names = set()
+        if os.path.isdir(self.snapshots_dir):
+            names.update(n[:-5] for n in os.listdir(self.snapshots_dir) if n.endswith(".json"))
+        if os.path.isdir(self.root):
+            names.update(n for n in os.listdir(self.root)
+                         if os.path.exists(os.path.join(self.root, n, "points.json")))
+        return sorted(names)
+
+    def _legacy_folder(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def manifest(self, name: str) -> Dict[str, Dict[str, str]]:
+        path = os.path.join(self.snapshots_dir, f"{name}.json")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["resources"]
+
+        folder = self._legacy_folder(name)
+        if not os.path.exists(os.path.join(folder, "points.json")):
+            raise FileNotFoundError(f"No backup snapshot named '{name}' in {self.root}")
+        # Old layout: full JSON copies; hashing them imports the records into the store
+        resources = {}
+        self._open_pack(f"legacy-{name}")
+        for resource in RESOURCES:
+            file_path = os.path.join(folder, f"{resource}.json")
+            if os.path.exists(file_path):
+                resources[resource] = {str(r["id"]): self.put(r) for r in read_json_array(file_path)}
+        self._close_pack(f"legacy-{name}")
+        return resources
+
+    def load(self, name: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Full records of a snapshot, with tool_slots rebuilt from points."""
+        resources = {}
+        for resource, hashes in self.manifest(name).items():
+            order = {digest: i for i, digest in enumerate(hashes.values())}
+            resources[resource] = sorted(self.iter_records(hashes.values()), key=lambda r: order[record_hash(r)])
+        resources["tool_slots"] = [p for p in resources.get("points", []) if p.get("pointer_type") == "ToolSlot"]
+        return resources
+
+    def diff(self, old: str, new: str) -> Dict[str, Dict[str, List[str]]]:
+        """Record IDs added, removed and changed between two snapshots (manifests only)."""
+        before, after = self.manifest(old), self.manifest(new)
+        result = {}
+        for resource in sorted(set(before) | set(after)):
+            a, b = before.get(resource, {}), after.get(resource, {})
+            result[resource] = {
+                "added": sorted(set(b) - set(a), key=int),
+                "removed": sorted(set(a) - set(b), key=int),
+                "changed": sorted((i for i in set(a) & set(b) if a[i] != b[i]), key=int),
+            }
+        return result
@@ -0,0 +1,139 @@
+import codecs
+import gzip
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Union
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """
+    Yields the items of a top-level JSON array read chunk by chunk (HTTP response,
+    file), without loading the whole document: only one item is held at a time.
+    """
+    buffer = ""
+    started = closed = False
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            # A multi-byte character may be split between two chunks
+            chunk = utf8.decode(chunk)
+        buffer += chunk
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                position += 1
+                continue
+            if buffer[position] in ",]":
+                closed = buffer[position] == "]"
+                position += 1
+                continue
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # incomplete item: wait for the next chunk
+            if end == len(buffer):
+                break  # a number may continue in the next chunk
+            yield item
+            position = end
+        buffer = buffer[position:]
+    if not closed or buffer.strip():
+        raise ValueError("Truncated JSON array")
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class NDJSONWriter:
+    """
+    Writes one JSON record per line (gzip-compressed if the path ends with .gz).
+    The file is written under a temporary name and only replaces `path` on close.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._tmp = path + ".tmp"
+        self._file = gzip.open(self._tmp, "wt", encoding="utf-8", compresslevel=6) if path.endswith(".gz") \
+            else open(self._tmp, "w", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+        self.count += 1
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> int:
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp, self.path)
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yields the records of an NDJSON (or .ndjson.gz) file."""
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_json_array(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yields the records of a JSON array file (the old points.json layout)."""
+    with _open(path, "r") as f:
+        yield from iter_json_array(iter(lambda: f.read(CHUNK_SIZE), ""))
+
+
+def json_to_ndjson(src: str, dst: str) -> int:
+    with NDJSONWriter(dst) as writer:
+        return writer.write_all(read_json_array(src))
+
+
+def ndjson_to_json(src: str, dst: str) -> int:
+    """Rebuilds the points.json layout (indented JSON array) one record at a time."""
+    count = 0
+    tmp = dst + ".tmp"
+    with _open(tmp, "w") as f:
+        f.write("[")
+        for record in read_ndjson(src):
+            f.write(",\n  " if count else "\n  ")
+            f.write(json.dumps(record, indent=2).replace("\n", "\n  "))
+            count += 1
+        f.write("\n]" if count else "]")
+    os.replace(tmp, dst)
+    return count
@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+Record = Dict[str, Any]
+
+
+@dataclass
+class Change:
+    action: str                    # "create", "update" or "delete"
+    source: Optional[Record]       # production record (None for a delete)
+    target: Optional[Record]       # simulator record (None for a create)
+    fields: Optional[Record] = None  # full payload for a create, changed fields only for an update
+
+
+@dataclass
+class SyncDiff:
+    creates: List[Change] = field(default_factory=list)
+    updates: List[Change] = field(default_factory=list)
+    deletes: List[Change] = field(default_factory=list)
+    unchanged: int = 0
+    # Production ID -> simulator ID for every matched pair (including the ones found by fallback)
+    matched: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def changes(self) -> List[Change]:
+        return self.creates + self.updates + self.deletes
+
+    def __bool__(self):
+        return bool(self.creates or self.updates or self.deletes)
+
+
+def diff_records(source: List[Record], target: List[Record], id_map: Dict[str, int],
+                 fields_of: Callable[[Record], Record], identity_of: Callable[[Record], Hashable],
+                 prune: bool = True) -> SyncDiff:
+    """
+    Three-way diff between production (source), the live simulator (target) and the ID
+    mapping recorded by the previous syncs (the common base).
+
+    Records are matched by the mapped ID first, then by identity_of (e.g. name + position)
+    for records never synced before. Matched pairs produce an update with only the fields
+    that differ. Mapped simulator records whose production record is gone are deleted;
+    with prune, so are simulator records that match nothing.
+    """
+    diff = SyncDiff()
+    live = {r["id"]: r for r in target}
+    mapped_targets = {sim_id for sim_id in id_map.values()}
+    unmatched = {}
+    for record in target:
+        if record["id"] not in mapped_targets:
+            unmatched.setdefault(identity_of(record), []).append(record)
+
+    claimed = set()
+    for record in source:
+        sim_id = id_map.get(str(record["id"]))
+        current = live.get(sim_id) if sim_id is not None else None
+        if current is None:
+            candidates = unmatched.get(identity_of(record))
+            current = candidates.pop(0) if candidates else None
+
+        wanted = fields_of(record)
+        if current is None:
+            diff.creates.append(Change("create", record, None, wanted))
+            continue
+
+        claimed.add(current["id"])
+        diff.matched[record["id"]] = current["id"]
+        have = fields_of(current)
+        changed = {k: v for k, v in wanted.items() if have.get(k) != v}
+        if changed:
+            diff.updates.append(Change("update", record, current, changed))
+        else:
+            diff.unchanged += 1
+
+    for record in target:
+        if record["id"] in claimed:
+            continue
+        if prune or record["id"] in mapped_targets:
+            diff.deletes.append(Change("delete", None, record))
+    return diff
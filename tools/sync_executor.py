@@ -0,0 +1,260 @@
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from ndjson_backup import CHUNK_SIZE, iter_json_array
+
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class SyncItem:
+    """One create/update/delete to push to the target FarmBot account."""
+    kind: str                      # "Tool", "ToolSlot", "Plant", ...
+    label: str
+    checksum: str
+    endpoint: str                  # "tools", "points", ...
+    payload: Optional[Dict[str, Any]]
+    remote_id: Optional[int] = None  # known remote ID => PATCH, otherwise POST
+    # Checksum of a remote record, used to find a record created by a POST whose response was lost
+    match: Optional[Callable[[Dict[str, Any]], str]] = None
+    delete: bool = False           # DELETE remote_id
+    source_id: Optional[int] = None  # ID of the record this item comes from (production)
+
+    @property
+    def method(self) -> str:
+        if self.delete:
+            return "DELETE"
+        return "POST" if self.remote_id is None else "PATCH"
+
+    @property
+    def outcome(self) -> str:
+        return {"POST": "created", "PATCH": "updated", "DELETE": "deleted"}[self.method]
+
+
+@dataclass
+class SyncResult:
+    item: SyncItem
+    status: str                    # "created", "updated", "deleted" or "failed"
+    remote_id: Optional[int] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class SyncReport:
+    results: List[SyncResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    throttled: int = 0
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def throughput(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ApiSession:
+    """
+    Minimal thread-safe Web API client (one pooled requests.Session).
+    The farmbot library keeps its last error in shared state, so it can't be used from several threads.
+    """
+
+    def __init__(self, token: Dict[str, Any], ssl: bool = True, timeout: float = 15.0, pool_size: int = 16):
+        iss = token["token"]["unencoded"]["iss"]
+        self.base_url = f"{'https' if ssl else 'http'}:{iss}/api/"
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            "authorization": token["token"]["encoded"],
+            "content-type": "application/json",
+        })
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @staticmethod
+    def from_farmbot(fb, **kwargs) -> "ApiSession":
+        return ApiSession(fb.state.token, ssl=getattr(fb.state, "ssl", True), **kwargs)
+
+    def request(self, method: str, path: str, payload=None) -> Tuple[int, Any, Optional[str]]:
+        """Returns (status_code, json body or text, Retry-After header). Raises requests.RequestException."""
+        response = self.session.request(method, self.base_url + path, json=payload, timeout=self.timeout)
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            body = response.text
+        return response.status_code, body, response.headers.get("retry-after")
+
+    def iter_records(self, endpoint: str) -> Iterator[Dict[str, Any]]:
+        """Streams a collection (JSON array) record by record, without holding the whole response."""
+        with self.session.get(self.base_url + endpoint, timeout=self.timeout, stream=True) as response:
+            if response.status_code >= 400:
+                raise requests.HTTPError(f"GET {endpoint}: HTTP {response.status_code}", response=response)
+            yield from iter_json_array(response.iter_content(CHUNK_SIZE))
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit: +1 slot after a full window of successes, halved on a 429,
+    and every worker pauses for the Retry-After delay the server asked for.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.active = 0
+        self.paused_until = 0.0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.active < self.limit:
+                    self.active += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def release(self, throttled: bool = False, retry_after: float = 0.0):
+        with self._cond:
+            self.active -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class SyncExecutor:
+    """
+    Pushes SyncItems concurrently on a bounded thread pool.
+
+    - concurrency adapts to the server (AdaptiveLimiter), 429 honours Retry-After
+    - PATCH is retried as is; a POST whose outcome is unknown (network error, 5xx)
+      is only retried after checking the record was not created anyway
+    - results are handed back one by one (on the calling thread) for progress and checksum recording
+    """
+
+    def __init__(self, session: ApiSession, max_workers: int = 16, initial_concurrency: int = 4,
+                 retries: int = 5, backoff: float = 0.5, max_backoff: float = 30.0,
+                 progress: Optional[Callable[[str], None]] = print):
+        self.session = session
+        self.max_workers = max_workers
+        self.limiter = AdaptiveLimiter(initial=min(initial_concurrency, max_workers), maximum=max_workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.progress = progress
+        self._throttled = 0
+        self._lock = threading.Lock()
+
+    def run(self, items: List[SyncItem], on_result: Optional[Callable[[SyncResult], None]] = None) -> SyncReport:
+        report = SyncReport()
+        if not items:
+            return report
+        self._throttled = 0
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._push, item) for item in items]
+            for done, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                report.results.append(result)
+                if on_result is not None:
+                    on_result(result)
+                if self.progress is not None:
+                    rate = done / max(time.monotonic() - start, 1e-6)
+                    self.progress(self._describe(result, done, len(items), rate))
+        report.elapsed = time.monotonic() - start
+        report.throttled = self._throttled
+        return report
+
+    @staticmethod
+    def _describe(result: SyncResult, done: int, total: int, rate: float) -> str:
+        item = result.item
+        if result.status == "failed":
+            outcome = f"❌ {item.kind} '{item.label}' failed: {result.error}"
+        else:
+            outcome = f"{result.status} {item.kind} '{item.label}' → ID {result.remote_id}"
+        return f"[{done}/{total}] {outcome} ({rate:.1f} items/s)"
+
+    def _push(self, item: SyncItem) -> SyncResult:
+        path = item.endpoint if item.remote_id is None else f"{item.endpoint}/{item.remote_id}"
+        status = item.outcome
+        error = None
+        attempt = 0
+        while attempt <= self.retries:
+            attempt += 1
+            if attempt > 1 and item.method == "POST" and error is not None and error[0] != 429:
+                # The previous POST may have succeeded before the connection dropped
+                existing = self._find_existing(item)
+                if existing is not None:
+                    return SyncResult(item, status, existing, attempt - 1)
+
+            self.limiter.acquire()
+            throttled, retry_after = False, 0.0
+            try:
+                code, body, retry_after_header = self.session.request(item.method, path, item.payload)
+            except requests.RequestException as e:
+                error = (None, str(e))
+            else:
+                if code < 400 or (code == 404 and item.delete and attempt > 1):
+                    # A 404 on a retried DELETE: the first attempt went through
+                    remote_id = body.get("id") if isinstance(body, dict) else None
+                    return SyncResult(item, status, remote_id if remote_id is not None else item.remote_id, attempt)
+                error = (code, f"HTTP {code}: {str(body)[:200]}")
+                if code not in RETRY_STATUS:
+                    break
+                if code == 429:
+                    throttled = True
+                    retry_after = self._retry_after(retry_after_header, attempt)
+                    with self._lock:
+                        self._throttled += 1
+            finally:
+                self.limiter.release(throttled, retry_after)
+
+            if not throttled and attempt <= self.retries:
+                time.sleep(random.uniform(0, self.backoff * (2 ** (attempt - 1))))
+
+        return SyncResult(item, "failed", item.remote_id, attempt, error[1] if error else None)
+
+    def _retry_after(self, header: Optional[str], attempt: int) -> float:
+        """Pause asked by the server, capped at max_backoff: every worker waits for it."""
+        seconds = None
+        if header is not None:
+            try:
+                seconds = float(header)
+            except ValueError:
+                pass  # HTTP-date: exponential backoff instead
+        if seconds is None or not math.isfinite(seconds):
+            seconds = self.backoff * (2 ** (attempt - 1))
+        return min(max(seconds, 0.0), self.max_backoff)
+
+    def _find_existing(self, item: SyncItem) -> Optional[int]:
+        if item.match is None:
+            return None
+        try:
+            code, records, _ = self.session.request("GET", item.endpoint)
+        except requests.RequestException:
+            return None
+        if code >= 400 or not isinstance(records, list):
+            return None
+        for record in records:
+            if item.match(record) == item.checksum:
+                return record.get("id")
+        return None
@@ -4,32 +4,68 @@ import datetime
 import argparse
 from farmbot import Farmbot
 from auth import load_token
+from sync_executor import ApiSession, SyncExecutor, SyncItem, SyncReport
+from backup_store import RESOURCES, BackupStore
+from ndjson_backup import json_to_ndjson, ndjson_to_json
+from sync_diff import diff_records
+from sync_state import SyncStateStore
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import hashlib
 
 
-SYNCED_RESOURCES_FILE = "synced_resources.json"
-
-class SyncIndex:
-    def __init__(self, path="synced_points.json"):
-        self.path = path
-        self.data = {"points": {}}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
-
-    def has_point(self, original_id: int) -> bool:
-        return str(original_id) in self.data["points"]
-
-    def add_point(self, original_id: int, new_id: int):
-        self.data["points"][str(original_id)] = new_id
-        self._save()
+SYNCED_RESOURCES_FILE = "synced_resources.json"  # old JSON index, imported into the SQLite store
+SYNC_STATE_FILE = "sync_state.db"
+
+class AccountSnapshot:
+    """
+    Session snapshot of one FarmBot account: each collection is downloaded once and shared
+    by the counts, the backup and the sync steps. Same api_get/api_post/api_patch interface
+    as Farmbot; writes go through and drop the cached collection.
+    """
+
+    def __init__(self, fb, label=""):
+        self.fb = fb
+        self.label = label
+        self._collections: Dict[str, Any] = {}
+        self.fetches = 0
+
+    @property
+    def state(self):
+        return self.fb.state
+
+    def api_get(self, endpoint, database_id=None, payload=None):
+        if database_id is not None or payload is not None:
+            return self.fb.api_get(endpoint, database_id, payload)
+        if endpoint not in self._collections:
+            data = self.fb.api_get(endpoint)
+            self.fetches += 1
+            if isinstance(data, str):
+                # The farmbot library returns the error message instead of raising
+                raise RuntimeError(f"Failed to fetch {endpoint} from {self.label or 'account'}: {data}")
+            self._collections[endpoint] = data
+        return self._collections[endpoint]
+
+    def api_post(self, endpoint, payload=None):
+        self.invalidate(endpoint.split("/")[0])
+        return self.fb.api_post(endpoint, payload)
+
+    def api_patch(self, endpoint, payload, database_id=None):
+        self.invalidate(endpoint.split("/")[0])
+        return self.fb.api_patch(endpoint, payload, database_id)
+
+    def invalidate(self, endpoint=None):
+        if endpoint is None:
+            self._collections.clear()
+        else:
+            self._collections.pop(endpoint, None)
 
-    def _save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+    def refresh(self, *endpoints):
+        """Refetch the given collections (all cached ones by default)."""
+        for endpoint in endpoints or list(self._collections):
+            self.invalidate(endpoint)
+            self.api_get(endpoint)
 
 
 @dataclass
@@ -104,6 +140,7 @@ def clean_payload(payload):
 
 # === Count Resources ===
 def count_resources(fb):
+    # With an AccountSnapshot, the lists fetched here are reused by the backup and the sync
     points = fb.api_get("points")
     return {
         "tools": len(fb.api_get("tools")),
@@ -112,108 +149,232 @@ def count_resources(fb):
     }
 
 
-# === Save Backup to JSON Files ===
-def save_backup(name, data, folder):
-    os.makedirs(folder, exist_ok=True)
-    file_path = os.path.join(folder, f"{name}.json")
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    print(f"✅ {name} backed up to {file_path}")
-
-def backup_all(prod_fb):
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    folder = os.path.join("backups", timestamp)
-    print(f"\n📦 Backing up production FarmBot data to {folder}...")
-    save_backup("tools", prod_fb.api_get("tools"), folder)
-    all_points = prod_fb.api_get("points")
-    save_backup("points", all_points, folder)
-    tool_slots = [p for p in all_points if p["pointer_type"] == "ToolSlot"]
-    save_backup("tool_slots", tool_slots, folder)
+# === Backups ===
+def backup_all(prod_fb, store=None, session=None):
+    """
+    With an ApiSession, records are streamed from the API straight into the store
+    (memory stays flat whatever the size of the garden); otherwise the lists come from prod_fb.
+    """
+    store = store or BackupStore("backups")
+    written, size = store.objects_written, store.bytes_written
+    counts = {}
+
+    def counted(resource, records):
+        counts[resource] = 0
+        for record in records:
+            counts[resource] += 1
+            yield record
+
+    resources = {resource: counted(resource, session.iter_records(resource) if session else prod_fb.api_get(resource))
+                 for resource in RESOURCES}
+    name = store.save_snapshot(resources)
+    total = sum(counts.values())
+    print(f"\n📦 Production backed up as snapshot {name}: {total} records, "
+          f"{store.objects_written - written} new ({(store.bytes_written - size) / 1024:.1f} KiB written)")
+    return name
+
+
+def show_backup_diff(store, old, new):
+    print(f"\n🔍 {old} → {new}")
+    for resource, changes in store.diff(old, new).items():
+        print(f" - {resource}: +{len(changes['added'])} -{len(changes['removed'])} ~{len(changes['changed'])}")
+
+
+def restore_items(fb, saved) -> list:
+    """Creates, field-level updates and deletes that bring the account back to a saved snapshot."""
+    items = []
+    for resource in RESOURCES:
+        live = {r["id"]: r for r in fb.api_get(resource)}
+        wanted = {r["id"]: r for r in saved.get(resource, [])}
+        if resource == "tools":
+            kind_of, checksum_of = (lambda r: "Tool"), tool_to_checksum
+        else:
+            kind_of, checksum_of = (lambda r: r.get("pointer_type", "GenericPointer")), point_record_checksum
+
+        for record_id, record in wanted.items():
+            payload = clean_payload(deepcopy(record))
+            current = live.get(record_id)
+            if current is None:
+                # Deleted since the backup: recreated (with a new ID)
+                items.append(SyncItem(kind=kind_of(record), label=record.get("name"), checksum=checksum_of(record),
+                                      endpoint=resource, payload=payload, match=checksum_of))
+                continue
+            changed = {k: v for k, v in payload.items() if current.get(k) != v}
+            if changed:
+                items.append(SyncItem(kind=kind_of(record), label=record.get("name"), checksum=checksum_of(record),
+                                      endpoint=resource, payload=changed, remote_id=record_id))
+
+        for record_id in live.keys() - wanted.keys():
+            record = live[record_id]
+            items.append(SyncItem(kind=kind_of(record), label=record.get("name"), checksum=checksum_of(record),
+                                  endpoint=resource, payload=None, remote_id=record_id, delete=True))
+    return items
+
+
+def restore_snapshot(fb, store, name, dry_run=False, executor=None):
+    items = restore_items(fb, store.load(name))
+    if not items:
+        print(f"✅ Production already matches snapshot {name}.")
+        return None
+
+    if dry_run:
+        for item in items:
+            target = "" if item.remote_id is None else f" (ID {item.remote_id})"
+            print(f"[DRY-RUN] Would {item.method} {item.kind} '{item.label}'{target}")
+        return None
+
+    executor = executor or SyncExecutor(ApiSession.from_farmbot(fb))
+    try:
+        report = executor.run(items)
+    finally:
+        if isinstance(fb, AccountSnapshot):
+            fb.invalidate()
+    print(f"✅ Restored {name} → Created: {report.count('created')}, Updated: {report.count('updated')}, "
+          f"Deleted: {report.count('deleted')}, Failed: {report.count('failed')}")
+    return report
 
 
 # === Sync Functions ===
-def sync_tools(prod_fb, sim_fb, dry_run=False):
+# Fields compared and sent for each resource (tool "status" is computed by the server from the slots)
+TOOL_FIELDS = ("name", "flow_rate_ml_per_s")
 
-    tools = prod_fb.api_get("tools")
-    synced = load_synced_checksums()
-    already_synced = synced.get("Tool", {})
 
-    created, updated, skipped = 0, 0, 0
+def point_record_checksum(record: Dict[str, Any]) -> str:
+    return Point.from_dict(record).to_checksum()
 
-    for tool in tools:
-        checksum = tool_to_checksum(tool)
-        payload = clean_payload(deepcopy(tool))
 
-        if checksum in already_synced:
-            remote_id = already_synced[checksum]
-            if dry_run:
-                print(f"[DRY-RUN] Would update Tool {tool.get('name')} → ID {remote_id}")
-            else:
-                sim_fb.api_patch(f"tools/{remote_id}", payload)
-            updated += 1
-        else:
-            if dry_run:
-                print(f"[DRY-RUN] Would create Tool {tool.get('name')}")
-                new_id = -1  # simulate
-            else:
-                response = sim_fb.api_post("tools", payload)
-                new_id = response.get("id")
-            already_synced[checksum] = new_id
-            created += 1
+def point_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    return Point.from_dict(record).to_post_payload()
 
 
-    synced["Tool"] = already_synced
-    if not dry_run:
-        save_synced_checksums(synced)
+def point_identity(record: Dict[str, Any]):
+    return (record.get("pointer_type"), record.get("name"),
+            round(record.get("x") or 0), round(record.get("y") or 0), round(record.get("z") or 0))
 
-    print(f"✅ Tools → Created: {created}, Updated: {updated}, Skipped: {skipped}")
 
+def tool_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: record[k] for k in TOOL_FIELDS if k in record}
 
 
-def sync_tool_slots(prod_fb, sim_fb, dry_run=False):
+def tool_identity(record: Dict[str, Any]):
+    return record.get("name")
 
-    all_points = prod_fb.api_get("points")
-    tool_slots = [Point.from_dict(p) for p in all_points if p.pointer_type == "ToolSlot"]
 
-    synced = load_synced_checksums()
-    already_synced = synced.get("ToolSlot", {})
+def claim_checksum_rows(state, kind, records, checksum_of):
+    """Rows imported from the old checksum-keyed index get the production ID of the matching record."""
+    unclaimed = state.unclaimed_checksums(kind)
+    if not unclaimed:
+        return
+    for record in records:
+        checksum = checksum_of(record)
+        if checksum in unclaimed:
+            state.set(kind, record["id"], unclaimed.pop(checksum), checksum)
+
+
+def plan_sync(prod_fb, sim_fb, endpoint, kinds, state, prune=False):
+    """
+    Diff production against the live simulator for the given kinds and return the SyncItems
+    to send: creates, updates with only the changed fields, and deletes. Nothing for unchanged records.
+    """
+    if endpoint == "tools":
+        kind_of = lambda r: "Tool"
+        fields_of, identity_of, checksum_of = tool_fields, tool_identity, tool_to_checksum
+    else:
+        kind_of = lambda r: r.get("pointer_type", "GenericPointer")
+        fields_of, identity_of, checksum_of = point_fields, point_identity, point_record_checksum
+
+    source = [r for r in prod_fb.api_get(endpoint) if kind_of(r) in kinds]
+    target = [r for r in sim_fb.api_get(endpoint) if kind_of(r) in kinds]
+
+    # Old synced_points.json entries are only a fallback for the per-type mappings
+    id_map = state.mapping("points") if endpoint == "points" else {}
+    for kind in kinds:
+        claim_checksum_rows(state, kind, [r for r in source if kind_of(r) == kind], checksum_of)
+        id_map.update(state.mapping(kind))
+
+    diff = diff_records(source, target, id_map, fields_of, identity_of, prune=prune)
+    # Pairs found by name + position are remembered, so the next run matches them by ID
+    for record in source:
+        if record["id"] in diff.matched:
+            state.set(kind_of(record), record["id"], diff.matched[record["id"]], checksum_of(record))
+
+    items = []
+    for change in diff.changes:
+        record = change.source or change.target
+        items.append(SyncItem(
+            kind=kind_of(record), label=record.get("name"), checksum=checksum_of(record), endpoint=endpoint,
+            payload=change.fields, remote_id=change.target["id"] if change.target else None,
+            match=checksum_of, delete=change.action == "delete",
+            source_id=change.source["id"] if change.source else None,
+        ))
+    print(f"🔎 {', '.join(kinds)} → {len(diff.creates)} to create, {len(diff.updates)} to update, "
+          f"{len(diff.deletes)} to delete, {diff.unchanged} unchanged")
+    return items
+
+
+def push_items(sim_fb, items, state, dry_run=False, executor=None):
+    """
+    Push the planned changes concurrently and record each production → simulator ID into the sync state.
+    Returns the SyncReport (None in dry-run mode).
+    """
+    if dry_run:
+        # Nothing is recorded in dry-run mode, not even the matches found while planning
+        state.rollback()
+        verbs = {"POST": "create", "PATCH": "update", "DELETE": "delete"}
+        for item in items:
+            target = "" if item.remote_id is None else f" → ID {item.remote_id}"
+            print(f"[DRY-RUN] Would {verbs[item.method]} {item.kind} '{item.label}'{target}")
+        return None
+
+    executor = executor or SyncExecutor(ApiSession.from_farmbot(sim_fb))
+
+    def record(result):
+        item = result.item
+        if result.status == "deleted":
+            state.remove_target(item.kind, item.remote_id)
+        elif result.status != "failed" and item.source_id is not None:
+            state.set(item.kind, item.source_id, result.remote_id, item.checksum)
+        state.commit_batch()
 
-    created, updated = 0, 0
+    try:
+        report = executor.run(items, on_result=record)
+    finally:
+        # Committed even on Ctrl-C so the next run doesn't recreate what was already pushed
+        state.flush()
+        if isinstance(sim_fb, AccountSnapshot):
+            for endpoint in set(item.endpoint for item in items):
+                sim_fb.invalidate(endpoint)
 
-    for slot in tool_slots:
-        checksum = slot.to_checksum()
-        payload = slot.to_post_payload()
+    if report.results:
+        print(f"⏱️  {len(report.results)} items in {report.elapsed:.1f}s "
+              f"({report.throughput:.1f} items/s, throttled {report.throttled}x)")
+    return report
 
-        if checksum in already_synced:
-            if dry_run:
-                print(f"[DRY-RUN] Would update ToolSlot '{slot.name}' → ID {already_synced[checksum]}")
-            else:
-                sim_fb.api_patch(f"points/{already_synced[checksum]}", payload)
-            updated += 1
-        else:
-            if dry_run:
-                print(f"[DRY-RUN] Would create ToolSlot '{slot.name}'")
-                new_id = -1
-            else:
-                response = sim_fb.api_post("points", payload)
-                new_id = response.get("id")
-            already_synced[checksum] = new_id
-            created += 1
 
-    synced["ToolSlot"] = already_synced
-    
-    if not dry_run:
-        save_synced_checksums(synced)
-        
-    print(f"✅ ToolSlots → Created: {created}, Updated: {updated}")
+def summarize(title, items, report):
+    if report is None:
+        counts = {outcome: sum(1 for i in items if i.outcome == outcome)
+                  for outcome in ("created", "updated", "deleted")}
+    else:
+        counts = {outcome: report.count(outcome) for outcome in ("created", "updated", "deleted", "failed")}
+    print(f"✅ {title} → " + ", ".join(f"{k.capitalize()}: {v}" for k, v in counts.items()))
 
-def sync_points_by_type(prod_fb, sim_fb, dry_run=False):
 
-    raw_points = prod_fb.api_get("points")
-    all_points = [Point.from_dict(p) for p in raw_points]
-    types = sorted(set(p.pointer_type for p in all_points))
+def sync_tools(prod_fb, sim_fb, state, dry_run=False, executor=None, prune=False):
+    items = plan_sync(prod_fb, sim_fb, "tools", ["Tool"], state, prune)
+    report = push_items(sim_fb, items, state, dry_run, executor)
+    summarize("Tools", items, report)
+
 
-    synced = load_synced_checksums()
+def sync_tool_slots(prod_fb, sim_fb, state, dry_run=False, executor=None, prune=False):
+    items = plan_sync(prod_fb, sim_fb, "points", ["ToolSlot"], state, prune)
+    report = push_items(sim_fb, items, state, dry_run, executor)
+    summarize("ToolSlots", items, report)
+
+def sync_points_by_type(prod_fb, sim_fb, state, dry_run=False, executor=None, prune=False):
+
+    raw_points = prod_fb.api_get("points")
+    types = sorted(set(p.get("pointer_type", "GenericPointer") for p in raw_points))
 
     print("\nSync Points by Type:")
     for idx, t in enumerate(types, start=1):
@@ -234,51 +395,20 @@ def sync_points_by_type(prod_fb, sim_fb, dry_run=False):
         print("Invalid choice. Aborting.")
         return
 
-    total_created, total_updated = 0, 0
-
+    # Every selected type goes out in a single concurrent batch
+    items = plan_sync(prod_fb, sim_fb, "points", selected_types, state, prune)
+    report = push_items(sim_fb, items, state, dry_run, executor)
     for ptype in selected_types:
-        already_synced = synced.get(ptype, {})
-        to_sync = [p for p in all_points if p.pointer_type == ptype]
-
-        created, updated = 0, 0
-
-        for p in to_sync:
-            checksum = p.to_checksum()
-            payload = p.to_post_payload()
-
-            if checksum in already_synced:
-                if dry_run:
-                    print(f"[DRY-RUN] Would update {ptype} point '{p.name}' → ID {already_synced[checksum]}")
-                else:
-                    sim_fb.api_patch(f"points/{already_synced[checksum]}", payload)
-                updated += 1
-            else:
-                if dry_run:
-                    print(f"[DRY-RUN] Would create {ptype} point '{p.name}'")
-                    new_id = -1
-                else:
-                    response = sim_fb.api_post("points", payload)
-                    new_id = response.get("id")
-                already_synced[checksum] = new_id
-                created += 1
-
-
-        synced[ptype] = already_synced
-        total_created += created
-        total_updated += updated
-        print(f"🔄 {ptype} → Created: {created}, Updated: {updated}")
-
-    if not dry_run:
-        save_synced_checksums(synced)
-        
-    print(f"✅ All selected point types synced. Total created: {total_created}, updated: {total_updated}")
+        summarize(ptype, [i for i in items if i.kind == ptype],
+                  report and SyncReport([r for r in report.results if r.item.kind == ptype]))
 
 
-def sync_points(prod_fb, sim_fb):
-    points = prod_fb.api_get("points")
-    print(f"Syncing {len(points)} points...")
-    for point in points:
-        sim_fb.post("points", clean_payload(deepcopy(point)))
+def sync_points(prod_fb, sim_fb, state, dry_run=False, executor=None, prune=False):
+    kinds = sorted(set(p.get("pointer_type", "GenericPointer") for p in prod_fb.api_get("points")) |
+                   set(p.get("pointer_type", "GenericPointer") for p in sim_fb.api_get("points")))
+    items = plan_sync(prod_fb, sim_fb, "points", kinds, state, prune)
+    report = push_items(sim_fb, items, state, dry_run, executor)
+    summarize("Points", items, report)
 
 def sync_farmware_envs(prod_fb, sim_fb, dry_run=False):
     print_farmware_envs(prod_fb, title="Production Farmware Environment Variables (Before Sync)")
@@ -329,16 +459,6 @@ def print_farmware_envs(fb, title="Farmware Environment Variables"):
         print(f" - {env['key']} = {env['value']}")
 
 
-def load_synced_checksums() -> Dict[str, Dict[str, int]]:
-    if not os.path.exists(SYNCED_RESOURCES_FILE):
-        return {}
-    with open(SYNCED_RESOURCES_FILE, "r") as f:
-        return json.load(f)
-
-def save_synced_checksums(synced: Dict[str, Dict[str, int]]):
-    with open(SYNCED_RESOURCES_FILE, "w") as f:
-        json.dump(synced, f, indent=2)
-
 def tool_to_checksum(tool: Dict[str, Any]) -> str:
     data = {
         "name": tool.get("name"),
@@ -384,11 +504,34 @@ def confirm():
 def main():
     parser = argparse.ArgumentParser(description="FarmBot Sync Tool")
     parser.add_argument("--backup-only", action="store_true", help="Only backup production FarmBot data")
-    parser.add_argument("--reset-synced", action="store_true", help="Clear synced resource checksum cache")
+    parser.add_argument("--reset-synced", action="store_true", help="Clear the production → simulator ID mapping")
     parser.add_argument("--dry-run", action="store_true", help="Preview sync actions without applying changes")
+    parser.add_argument("--workers", type=int, default=16, help="Maximum concurrent API requests when pushing")
+    parser.add_argument("--prune", action="store_true", help="Also delete simulator records that match nothing in production")
+    parser.add_argument("--list-backups", action="store_true", help="List backup snapshots")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="Compare two backup snapshots")
+    parser.add_argument("--to-ndjson", nargs=2, metavar=("JSON", "NDJSON"), help="Convert a JSON array backup (points.json) to NDJSON (.gz to compress)")
+    parser.add_argument("--to-json", nargs=2, metavar=("NDJSON", "JSON"), help="Convert an NDJSON backup back to the points.json layout")
+    parser.add_argument("--restore", metavar="SNAPSHOT", help="Push the differences from a backup snapshot back to production")
 
     args = parser.parse_args()
 
+    if args.to_ndjson:
+        print(f"✅ {json_to_ndjson(*args.to_ndjson)} records written to {args.to_ndjson[1]}")
+        return
+    if args.to_json:
+        print(f"✅ {ndjson_to_json(*args.to_json)} records written to {args.to_json[1]}")
+        return
+
+    store = BackupStore("backups")
+    if args.list_backups:
+        for name in store.snapshots():
+            print(name)
+        return
+    if args.diff:
+        show_backup_diff(store, *args.diff)
+        return
+
     # Load tokens
     prod_token = load_token("farmbot_authorization_token_prod.json")
     sim_token = load_token("farmbot_authorization_token.json")
@@ -401,13 +544,34 @@ def main():
     sim_fb = Farmbot()
     sim_fb.set_token(sim_token)
 
+    # Collections are fetched once per session and shared by every step of a menu action
+    prod = AccountSnapshot(prod_fb, "production")
+    sim = AccountSnapshot(sim_fb, "simulator")
+
     if args.backup_only:
-        backup_all(prod_fb)
+        backup_all(prod, store, session=ApiSession.from_farmbot(prod))
+        return
+
+    if args.restore:
+        # Safety net: the current state is backed up before being overwritten
+        backup_all(prod, store)
+        restore_snapshot(prod, store, args.restore, dry_run=True)
+        if not args.dry_run and confirm():
+            restore_snapshot(prod, store, args.restore,
+                             executor=SyncExecutor(ApiSession.from_farmbot(prod), max_workers=args.workers))
         return
 
-    if args.reset_synced and os.path.exists(SYNCED_RESOURCES_FILE):
-        os.remove(SYNCED_RESOURCES_FILE)
-        print("🧹 Synced resource cache cleared.")
+    # One pooled session shared by every sync, so connections are reused between menu actions
+    executor = SyncExecutor(ApiSession.from_farmbot(sim), max_workers=args.workers)
+
+    state = SyncStateStore(SYNC_STATE_FILE)
+    imported = state.import_json(SYNCED_RESOURCES_FILE)
+    if imported:
+        print(f"📥 Imported {imported} mappings from the old JSON index into {SYNC_STATE_FILE}.")
+
+    if args.reset_synced:
+        state.clear()
+        print("🧹 Sync state cleared.")
 
 
     while True:
@@ -415,41 +579,47 @@ def main():
         choice = input("Enter your choice [1-0]: ").strip()
 
         if choice in {"1", "2", "3", "4", "6", "7"}:
-            prod_counts = count_resources(prod_fb)
-            sim_counts = count_resources(sim_fb)
+            # Production may have changed since the last action; the simulator is
+            # already refetched after our own writes
+            prod.invalidate()
+            prod_counts = count_resources(prod)
+            sim_counts = count_resources(sim)
             show_comparison(prod_counts, sim_counts)
 
-            backup_all(prod_fb)
+            backup_all(prod, store)
 
             if not confirm():
                 print("❌ Sync cancelled.")
                 continue
 
             if choice == "1":
-                sync_tools(prod_fb, sim_fb, args.dry_run)
+                sync_tools(prod, sim, state, args.dry_run, executor, args.prune)
             elif choice == "2":
-                sync_tool_slots(prod_fb, sim_fb, args.dry_run)
+                sync_tool_slots(prod, sim, state, args.dry_run, executor, args.prune)
             elif choice == "3":
-                sync_points(prod_fb, sim_fb, args.dry_run)
+                sync_points(prod, sim, state, args.dry_run, executor, args.prune)
             elif choice == "4":
-                sync_tools(prod_fb, sim_fb, args.dry_run)
-                sync_tool_slots(prod_fb, sim_fb, args.dry_run)
-                sync_points(prod_fb, sim_fb, args.dry_run)
+                sync_tools(prod, sim, state, args.dry_run, executor, args.prune)
+                sync_tool_slots(prod, sim, state, args.dry_run, executor, args.prune)
+                sync_points(prod, sim, state, args.dry_run, executor, args.prune)
             elif choice == "6":
-                sync_points_by_type(prod_fb, sim_fb, args.dry_run)
+                sync_points_by_type(prod, sim, state, args.dry_run, executor, args.prune)
             elif choice == "7":
-                sync_farmware_envs(prod_fb, sim_fb, args.dry_run)
+                sync_farmware_envs(prod, sim, args.dry_run)
 
         elif choice == "5":
-            prod_counts = count_resources(prod_fb)
-            sim_counts = count_resources(sim_fb)
+            prod.invalidate()
+            sim.invalidate()
+            prod_counts = count_resources(prod)
+            sim_counts = count_resources(sim)
             show_comparison(prod_counts, sim_counts)
 
         elif choice == "0":
+            state.close()
             print("Exiting. Goodbye!")
             break
         elif choice == "8":
-            print_farmware_envs(prod_fb)
+            print_farmware_envs(prod)
         else:
             print("Invalid choice. Please select a valid option.")
 
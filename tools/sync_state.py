@@ -0,0 +1,132 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mappings (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,           -- "Tool", "Plant", "ToolSlot", ... ("points" for the old synced_points.json)
+    source_id TEXT,               -- production ID (NULL for rows imported from checksum-keyed files)
+    target_id INTEGER,            -- simulator ID
+    checksum TEXT,                -- content checksum of the production record when it was synced
+    updated_at REAL NOT NULL,
+    UNIQUE (kind, source_id)
+);
+CREATE INDEX IF NOT EXISTS mappings_checksum ON mappings (kind, checksum);
+CREATE INDEX IF NOT EXISTS mappings_target ON mappings (kind, target_id);
+"""
+
+
+class SyncStateStore:
+    """
+    Production → simulator ID mapping kept in SQLite (WAL).
+
+    Each write is a row upsert, not a rewrite of the whole file. Writes are committed
+    in batches (commit_batch) and at the end of a sync (flush); after a crash only the
+    last uncommitted batch is lost, and the diff finds those records again by name + position.
+    """
+
+    def __init__(self, path: str = "sync_state.db", batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM mappings").fetchone()[0]
+
+    # === Reads ===
+    def mapping(self, kind: str) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT source_id, target_id FROM mappings WHERE kind = ? AND source_id IS NOT NULL", (kind,))
+        return {source_id: target_id for source_id, target_id in rows}
+
+    def find_by_checksum(self, kind: str, checksum: str) -> Optional[int]:
+        row = self.conn.execute(
+            "SELECT target_id FROM mappings WHERE kind = ? AND checksum = ? ORDER BY updated_at DESC LIMIT 1",
+            (kind, checksum)).fetchone()
+        return row[0] if row else None
+
+    def unclaimed_checksums(self, kind: str) -> Dict[str, int]:
+        """Rows imported from the old checksum-keyed index that no production ID has claimed yet."""
+        rows = self.conn.execute(
+            "SELECT checksum, target_id FROM mappings WHERE kind = ? AND source_id IS NULL", (kind,))
+        return {checksum: target_id for checksum, target_id in rows}
+
+    # === Writes ===
+    def set(self, kind: str, source_id, target_id: Optional[int], checksum: Optional[str] = None):
+        self.conn.execute(
+            "DELETE FROM mappings WHERE kind = ? AND source_id IS NULL AND target_id = ?", (kind, target_id))
+        self.conn.execute(
+            "INSERT INTO mappings (kind, source_id, target_id, checksum, updated_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (kind, source_id) DO UPDATE SET target_id = excluded.target_id, "
+            "checksum = excluded.checksum, updated_at = excluded.updated_at",
+            (kind, str(source_id), target_id, checksum, time.time()))
+        self._pending += 1
+
+    def remove_target(self, kind: str, target_id: int):
+        self.conn.execute("DELETE FROM mappings WHERE kind = ? AND target_id = ?", (kind, target_id))
+        self._pending += 1
+
+    def commit_batch(self):
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def rollback(self):
+        self.conn.rollback()
+        self._pending = 0
+
+    def clear(self):
+        self.conn.execute("DELETE FROM mappings")
+        self.flush()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    # === Migration ===
+    def import_json(self, resources_path: str = "synced_resources.json",
+                    points_path: str = "synced_points.json") -> int:
+        """
+        Imports the old JSON index files once, then renames them to *.migrated.
+        synced_resources.json: {kind: {checksum or production ID: simulator ID}}
+        synced_points.json (SyncIndex): {"points": {production ID: simulator ID}}
+        """
+        imported = 0
+        if os.path.exists(resources_path):
+            with open(resources_path, "r", encoding="utf-8") as f:
+                for kind, entries in json.load(f).items():
+                    for key, target_id in entries.items():
+                        if target_id is None or target_id < 0:
+                            continue  # placeholders written by old dry runs
+                        if key.isdigit():
+                            self.set(kind, key, target_id)
+                        else:
+                            self.conn.execute(
+                                "INSERT INTO mappings (kind, source_id, target_id, checksum, updated_at) "
+                                "VALUES (?, NULL, ?, ?, ?)", (kind, target_id, key, time.time()))
+                        imported += 1
+        if os.path.exists(points_path):
+            with open(points_path, "r", encoding="utf-8") as f:
+                for source_id, target_id in json.load(f).get("points", {}).items():
+                    self.set("points", source_id, target_id)
+                    imported += 1
+        self.flush()
+        for path in (resources_path, points_path):
+            if os.path.exists(path):
+                os.replace(path, path + ".migrated")
+        return imported
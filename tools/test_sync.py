@@ -3,6 +3,8 @@ from sync_farmbot_basics import Point, tool_to_checksum, clean_payload
 import tempfile
 import json
 import os
+import time
+from copy import deepcopy
 
 # === Point model tests ===
 
@@ -63,26 +65,305 @@ def test_clean_payload_removes_fields():
         assert key not in cleaned
 
 
-# === Checksum storage test ===
+# === Sync state store tests ===
 
-def test_checksum_save_and_load(tmp_path):
-    from sync_farmbot_basics import save_synced_checksums, load_synced_checksums
+def test_sync_state_imports_old_json_index(tmp_path):
+    from sync_state import SyncStateStore
 
-    data = {
-        "Tool": {"abc": 1},
-        "ToolSlot": {"xyz": 2}
-    }
+    resources = tmp_path / "synced_resources.json"
+    resources.write_text(json.dumps({"Tool": {"abc": 1, "dry": -1}, "Plant": {"1000": 7}}))
+    points = tmp_path / "synced_points.json"
+    points.write_text(json.dumps({"points": {"1001": 8}}))
+
+    state = SyncStateStore(str(tmp_path / "state.db"))
+    assert state.import_json(str(resources), str(points)) == 3
+    assert not resources.exists() and (tmp_path / "synced_resources.json.migrated").exists()
+    assert state.mapping("Plant") == {"1000": 7}
+    assert state.mapping("points") == {"1001": 8}
+    assert state.unclaimed_checksums("Tool") == {"abc": 1}
+
+    # A production record with that checksum claims the imported row
+    state.set("Tool", 55, 1, "abc")
+    state.close()
+    state = SyncStateStore(str(tmp_path / "state.db"))
+    assert state.mapping("Tool") == {"55": 1}
+    assert state.unclaimed_checksums("Tool") == {}
+    assert state.find_by_checksum("Tool", "abc") == 1
+
+
+# === Concurrent push tests ===
+
+class FakeSession:
+    """Fake Web API: throttles the first requests and drops the response of one POST."""
+
+    def __init__(self, throttle=3, drop_post_for=None):
+        import threading
+        self.lock = threading.Lock()
+        self.records = []
+        self.throttle = throttle
+        self.drop_post_for = drop_post_for
+        self.calls = 0
+
+    def request(self, method, path, payload=None):
+        import requests
+        from sync_farmbot_basics import Point
+        with self.lock:
+            self.calls += 1
+            if method == "GET":
+                return 200, list(self.records), None
+            if self.throttle > 0:
+                self.throttle -= 1
+                return 429, {"error": "slow down"}, "0"
+            if method == "PATCH":
+                return 200, {"id": int(path.split("/")[1]), **payload}, None
+            if method == "DELETE":
+                self.records[:] = [r for r in self.records if r["id"] != int(path.split("/")[1])]
+                return 200, None, None
+            record = {"id": len(self.records) + 1, **payload}
+            self.records.append(record)
+            if payload["name"] == self.drop_post_for:
+                self.drop_post_for = None
+                raise requests.ConnectionError("connection reset")
+            return 200, record, None
+
+
+def _points(n):
+    return [{"id": 1000 + i, "name": f"Plant {i}", "x": i, "y": 2 * i, "z": 0, "pointer_type": "Plant"}
+            for i in range(n)]
+
+
+class FakeAccount:
+    def __init__(self, points):
+        self.points = points
+
+    def api_get(self, endpoint):
+        return {"tools": [], "points": self.points}[endpoint]
+
+
+def test_concurrent_push_records_mapping(tmp_path):
+    import sync_farmbot_basics
+    from sync_executor import SyncExecutor
+    from sync_state import SyncStateStore
+
+    prod = FakeAccount(_points(40))
+    session = FakeSession(throttle=3, drop_post_for="Plant 7")
+    sim = FakeAccount(session.records)
+    state = SyncStateStore(str(tmp_path / "state.db"), batch_size=16)
+    items = sync_farmbot_basics.plan_sync(prod, sim, "points", ["Plant"], state)
+
+    executor = SyncExecutor(session, max_workers=8, backoff=0, progress=None)
+    report = sync_farmbot_basics.push_items(None, items, state, executor=executor)
+
+    assert report.count("created") == 40
+    assert report.throttled == 3
+    # The dropped POST was found on the server, not created twice
+    assert len(session.records) == 40
+    assert len(SyncStateStore(str(tmp_path / "state.db")).mapping("Plant")) == 40
+
+
+def test_sync_sends_only_differences(tmp_path):
+    import sync_farmbot_basics
+    from sync_executor import SyncExecutor
+    from sync_state import SyncStateStore
+
+    prod = FakeAccount(_points(10))
+    # Simulator already holds the same garden under other IDs, never synced before
+    session = FakeSession(throttle=0)
+    session.records.extend({**p, "id": p["id"] - 900} for p in prod.points)
+    sim = FakeAccount(session.records)
+    executor = SyncExecutor(session, backoff=0, progress=None)
+
+    state = SyncStateStore(str(tmp_path / "state.db"))
+    assert sync_farmbot_basics.plan_sync(prod, sim, "points", ["Plant"], state) == []
+    assert state.mapping("Plant")["1000"] == 100  # matched by name + position
+
+    prod.points[0]["x"] = 55
+    renamed = prod.points[1]["name"] = "Renamed"
+    del prod.points[2]
+    items = sync_farmbot_basics.plan_sync(prod, sim, "points", ["Plant"], state)
+    assert sorted((i.method, i.remote_id) for i in items) == [("DELETE", 102), ("PATCH", 100), ("PATCH", 101)]
+    assert {i.remote_id: i.payload for i in items if i.method == "PATCH"} == {100: {"x": 55}, 101: {"name": renamed}}
+
+    sync_farmbot_basics.push_items(None, items, state, executor=executor)
+    assert "1002" not in state.mapping("Plant")
+
+
+def test_push_does_not_retry_client_errors():
+    from sync_executor import SyncExecutor, SyncItem
+
+    class Rejecting:
+        calls = 0
+
+        def request(self, method, path, payload=None):
+            Rejecting.calls += 1
+            return 422, {"name": "is invalid"}, None
+
+    executor = SyncExecutor(Rejecting(), backoff=0, progress=None)
+    report = executor.run([SyncItem("Tool", "Bad", "abc", "tools", {"name": ""})])
+    assert report.count("failed") == 1 and Rejecting.calls == 1
+    assert "422" in report.results[0].error
+
+
+def test_throttled_push_halves_the_limit_and_waits_for_retry_after():
+    from sync_executor import SyncExecutor, SyncItem
+
+    class Throttling:
+        def __init__(self, retry_after):
+            self.retry_after = retry_after
+            self.calls = []
+
+        def request(self, method, path, payload=None):
+            self.calls.append(time.monotonic())
+            if len(self.calls) == 1:
+                return 429, "slow down", self.retry_after
+            return 201, {"id": 7}, None
+
+    session = Throttling("0.2")
+    executor = SyncExecutor(session, initial_concurrency=4, backoff=0, progress=None)
+    report = executor.run([SyncItem("Tool", "Seeder", "abc", "tools", {"name": "Seeder"})])
+    assert report.count("created") == 1 and report.throttled == 1
+    assert executor.limiter.limit == 2
+    assert session.calls[1] - session.calls[0] >= 0.2
+
+    # An absurd Retry-After is capped; an HTTP-date falls back to the backoff
+    session = Throttling("86400")
+    executor = SyncExecutor(session, backoff=0, max_backoff=0.1, progress=None)
+    started = time.monotonic()
+    executor.run([SyncItem("Tool", "Seeder", "abc", "tools", {"name": "Seeder"})])
+    assert time.monotonic() - started < 5
+    assert executor._retry_after("Wed, 21 Oct 2015 07:28:00 GMT", 1) == 0
+    assert SyncExecutor(session, backoff=1, progress=None)._retry_after("nan", 2) == 2
+
+
+# === Session snapshot tests ===
+
+def test_account_snapshot_fetches_each_collection_once(tmp_path, monkeypatch):
+    import sync_farmbot_basics
+    from sync_farmbot_basics import AccountSnapshot, backup_all, count_resources
+
+    class FakeFarmbot:
+        def __init__(self):
+            self.gets = []
+
+        def api_get(self, endpoint, database_id=None, payload=None):
+            self.gets.append(endpoint)
+            return {"tools": [{"id": 1, "name": "Seeder"}],
+                    "points": _points(3) + [{"id": 9, "name": "Slot", "x": 0, "y": 0, "z": 0,
+                                             "pointer_type": "ToolSlot"}]}[endpoint]
+
+        def api_post(self, endpoint, payload=None):
+            return {"id": 10, **payload}
+
+    monkeypatch.chdir(tmp_path)
+    fb = FakeFarmbot()
+    snapshot = AccountSnapshot(fb)
+
+    assert count_resources(snapshot) == {"tools": 1, "tool_slots": 1, "points": 4}
+    backup_all(snapshot)
+    assert sorted(fb.gets) == ["points", "tools"]
+
+    # A write drops the collection; the next read refetches it
+    snapshot.api_post("points", {"name": "New"})
+    snapshot.api_get("points")
+    snapshot.api_get("tools")
+    assert sorted(fb.gets) == ["points", "points", "tools"]
+
+
+# === Backup store tests ===
+
+def test_backup_store_deduplicates_and_diffs(tmp_path):
+    from backup_store import BackupStore
+
+    store = BackupStore(str(tmp_path))
+    points = _points(50)
+    first = store.save_snapshot({"tools": [], "points": points}, name="first")
+    assert store.objects_written == 50
+
+    # One point edited, one removed, one added: only the new contents are written
+    points = deepcopy(points)
+    points[0]["x"] = 999
+    removed = points.pop(1)
+    points.append({"id": 5000, "name": "New", "x": 1, "y": 1, "z": 0, "pointer_type": "Weed"})
+    second = store.save_snapshot({"tools": [], "points": points}, name="second")
+    assert store.objects_written == 52
+
+    diff = store.diff(first, second)["points"]
+    assert diff == {"added": ["5000"], "removed": [str(removed["id"])], "changed": ["1000"]}
+    assert store.load(second)["points"][0]["x"] == 999
+    assert store.snapshots() == ["first", "second"]
+
+
+def test_backup_store_snapshots_in_the_same_second_keep_their_packs(tmp_path, monkeypatch):
+    import datetime
+    import backup_store
+    from backup_store import BackupStore
+
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 5, 1, 12, 0, 0)
+
+    monkeypatch.setattr(backup_store.datetime, "datetime", FrozenDatetime)
+    store = BackupStore(str(tmp_path))
+    points = _points(3)
+    first = store.save_snapshot({"tools": [], "points": points})
+    points = deepcopy(points)
+    points[0]["x"] = 999
+    second = store.save_snapshot({"tools": [], "points": points})
+
+    assert (first, second) == ("2025-05-01_12-00-00", "2025-05-01_12-00-00-2")
+    assert store.load(first)["points"][0]["x"] != 999
+    assert store.load(second)["points"][0]["x"] == 999
+    with pytest.raises(FileExistsError):
+        store.save_snapshot({"tools": [], "points": points}, name=first)
+
+
+def test_restore_pushes_only_differences(tmp_path):
+    from backup_store import BackupStore
+    from sync_farmbot_basics import restore_items
+
+    store = BackupStore(str(tmp_path))
+    saved = _points(5)
+    store.save_snapshot({"tools": [], "points": saved}, name="snap")
+
+    live = deepcopy(saved)
+    live[0]["x"] = 42                      # edited since the backup
+    del live[1]                            # deleted since the backup
+    live.append({"id": 77, "name": "Extra", "x": 0, "y": 0, "z": 0, "pointer_type": "Weed"})
+
+    class Live:
+        def api_get(self, endpoint):
+            return {"tools": [], "points": live}[endpoint]
+
+    items = {(i.method, i.remote_id): i for i in restore_items(Live(), store.load("snap"))}
+    assert set(items) == {("PATCH", 1000), ("POST", None), ("DELETE", 77)}
+    assert items[("PATCH", 1000)].payload == {"x": 0}
+    assert items[("POST", None)].payload["name"] == "Plant 1"
+
+
+# === Streaming NDJSON backup tests ===
+
+def test_json_array_stream_parsing_across_chunks():
+    from ndjson_backup import iter_json_array
+
+    records = _points(20) + [{"id": 1, "name": "Épinard 🌱", "meta": {"n": [1, 2.5, None]}}]
+    raw = json.dumps(records, indent=2).encode()
+    for size in (1, 3, 64, len(raw)):
+        chunks = (raw[i:i + size] for i in range(0, len(raw), size))
+        assert list(iter_json_array(chunks)) == records
+    assert list(iter_json_array(["[1", "2, 3]"])) == [12, 3]
+    with pytest.raises(ValueError):
+        list(iter_json_array(['[{"id": 1},']))
+
+
+def test_ndjson_round_trip_keeps_points_json_layout(tmp_path):
+    from ndjson_backup import json_to_ndjson, ndjson_to_json, read_ndjson
+
+    original = tmp_path / "points.json"
+    with open(original, "w", encoding="utf-8") as f:
+        json.dump(_points(30), f, indent=2)
 
-    path = tmp_path / "checksums.json"
-    original_file = "synced_resources.json"
-    try:
-        # Redirect global variable
-        from sync_farmbot_basics import SYNCED_RESOURCES_FILE
-        globals()["SYNCED_RESOURCES_FILE"] = str(path)
-
-        save_synced_checksums(data)
-        loaded = load_synced_checksums()
-        assert loaded == data
-    finally:
-        # Reset to original filename
-        globals()["SYNCED_RESOURCES_FILE"] = original_file
+    assert json_to_ndjson(str(original), str(tmp_path / "points.ndjson.gz")) == 30
+    assert next(read_ndjson(str(tmp_path / "points.ndjson.gz")))["id"] == 1000
+    assert ndjson_to_json(str(tmp_path / "points.ndjson.gz"), str(tmp_path / "back.json")) == 30
+    assert (tmp_path / "back.json").read_text() == original.read_text()